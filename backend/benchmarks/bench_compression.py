@@ -0,0 +1,128 @@
+import argparse
+import gzip
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.domain.component import Component  # noqa: E402
+from core.domain.component_type import ComponentType  # noqa: E402
+from core.domain.healthcheck_config import HealthcheckConfig  # noqa: E402
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary  # noqa: E402
+from core.domain.page import Page  # noqa: E402
+from core.domain.product import Product  # noqa: E402
+from core.domain.status_type import StatusType  # noqa: E402
+from infra.utils import compression  # noqa: E402
+from infra.web.routers.schemas.page import PageDTO  # noqa: E402
+from infra.web.routers.schemas.product import ProductResponseDTO  # noqa: E402
+
+
+def _build_body(products: int, components: int, days: int) -> bytes:
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    statuses = [StatusType.OPERATIONAL] * 28 + [StatusType.DEGRADED, StatusType.OUTAGE]
+
+    page = Page(
+        page_size=products,
+        page_count=products,
+        total_elements=products,
+        total_pages=1,
+        content=[
+            Product(
+                id=product_id,
+                name=f"bench-{product_id}",
+                description="benchmark product",
+                created_at=today,
+                updated_at=today,
+                components=[
+                    Component(
+                        id=product_id * 1000 + component_id,
+                        product_id=product_id,
+                        name=f"bench-{product_id}-{component_id}",
+                        type=ComponentType.BACKEND,
+                        monitoring_config=HealthcheckConfig(
+                            health_url=f"https://bench-{product_id}-{component_id}.example.com/health"
+                        ),
+                        current_status=StatusType.OPERATIONAL,
+                        healthcheck_day_logs=[
+                            HealthcheckLogDaySummary(
+                                component_id=product_id * 1000 + component_id,
+                                date=today - timedelta(days=day),
+                                total_checks=1440,
+                                successful_checks=1440 - (day * 7 + component_id) % 5,
+                                uptime=round(100 - ((day * 7 + component_id) % 5) / 14.4, 2),
+                                avg_response_time=100 + (day * 13 + component_id) % 90,
+                                max_response_time=400 + (day * 31 + component_id) % 900,
+                                overall_status=statuses[(day + component_id) % len(statuses)],
+                            )
+                            for day in range(days)
+                        ],
+                    )
+                    for component_id in range(components)
+                ],
+            )
+            for product_id in range(1, products + 1)
+        ],
+    )
+
+    return PageDTO[ProductResponseDTO].model_validate(page).model_dump_json(by_alias=True).encode("utf-8")
+
+
+def _codecs() -> list[tuple[str, Callable[[bytes], bytes]]]:
+    codecs: list[tuple[str, Callable[[bytes], bytes]]] = [
+        (f"gzip-{level}", lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0))
+        for level in (1, compression.GZIP_LEVEL, 9)
+    ]
+
+    if compression.brotli is not None:
+        codecs += [
+            (f"br-{quality}", lambda body, quality=quality: compression.brotli.compress(body, quality=quality))
+            for quality in (1, compression.BROTLI_QUALITY, 9)
+        ]
+
+    if compression.zstd is not None:
+        codecs += [
+            (f"zstd-{level}", lambda body, level=level: compression.zstd.compress(body, level=level))
+            for level in (1, compression.ZSTD_LEVEL, 9)
+        ]
+
+    return codecs
+
+
+def run(products: int, components: int, days: int, iterations: int) -> None:
+    body = _build_body(products, components, days)
+
+    print(
+        f"products: {products}, components/product: {components}, days: {days},"
+        f" body: {len(body) / 1024:,.0f} KiB, iterations: {iterations}"
+    )
+
+    for name, encode in _codecs():
+        compressed = encode(body)
+
+        started = time.process_time()
+        for _ in range(iterations):
+            encode(body)
+        cpu_seconds = time.process_time() - started
+
+        print(
+            f"{name:<8} {len(compressed) / 1024:8,.1f} KiB  ratio {len(body) / len(compressed):6.1f}x"
+            f"  {cpu_seconds / iterations * 1000:7.2f} ms cpu/response"
+        )
+
+    missing = [name for name, module in (("br", compression.brotli), ("zstd", compression.zstd)) if module is None]
+    if missing:
+        print(f"not measured (codec unavailable in this interpreter): {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compression ratio and CPU per product listing response")
+    parser.add_argument("--products", type=int, default=10)
+    parser.add_argument("--components", type=int, default=3)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--iterations", type=int, default=20)
+    arguments = parser.parse_args()
+
+    run(arguments.products, arguments.components, arguments.days, arguments.iterations)
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from core.domain.component_type import ComponentType  # noqa: E402
+from core.domain.healthcheck_log import HealthcheckLog  # noqa: E402
+from core.domain.status_type import StatusType  # noqa: E402
+from infra.adapter.postgres_log_repository import PostgresLogRepository  # noqa: E402
+from infra.adapter.segment_log_archive import SegmentLogArchive  # noqa: E402
+from infra.db.models import Base, ComponentModel, HealthcheckLogModel, ProductModel  # noqa: E402
+from infra.utils.formatters import format_bytes  # noqa: E402
+
+
+def _generate_rows(component_id: int, rows: int) -> list[dict]:
+    start = datetime.now(timezone.utc) - timedelta(days=90)
+    generated = []
+
+    for index in range(rows):
+        healthy = random.random() > 0.02
+        generated.append(
+            {
+                "component_id": component_id,
+                "checked_at": start + timedelta(seconds=60 * index, milliseconds=random.randint(0, 900)),
+                "is_successful": healthy,
+                "status_code": 200 if healthy else random.choice([500, 502, 503]),
+                "response_time_ms": random.randint(40, 400) if healthy else random.randint(400, 5000),
+                "status_before": StatusType.OPERATIONAL,
+                "status_after": StatusType.OPERATIONAL if healthy else StatusType.DEGRADED,
+                "error_message": None if healthy else "Service Unavailable",
+            }
+        )
+
+    return generated
+
+
+def _normalize(logs: list[HealthcheckLog]) -> list[HealthcheckLog]:
+    return [replace(log, checked_at=log.checked_at.replace(tzinfo=timezone.utc)) for log in logs]
+
+
+async def run(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        database_path = Path(workdir) / "bench.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+        session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with session_factory() as session:
+            product = ProductModel(name="bench")
+            session.add(product)
+            await session.flush()
+
+            component = ComponentModel(
+                product_id=product.id,
+                name="bench-api",
+                type=ComponentType.BACKEND,
+                health_url="https://bench.example.com/health",
+            )
+            session.add(component)
+            await session.flush()
+            component_id = component.id
+
+            generated_rows = _generate_rows(component_id, rows)
+            for offset in range(0, rows, 10_000):
+                await session.execute(insert(HealthcheckLogModel), generated_rows[offset : offset + 10_000])
+
+            await session.commit()
+
+        async with engine.begin() as connection:
+            await connection.exec_driver_sql("VACUUM")
+
+        repository = PostgresLogRepository(session_factory)
+        archive = SegmentLogArchive(Path(workdir) / "archive")
+        far_past = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        far_future = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+        started = time.perf_counter()
+        sql_logs = await repository.get_logs_between(component_id, since=far_past, until=far_future)
+        sql_seconds = time.perf_counter() - started
+
+        await archive.write_segment(component_id, sql_logs)
+        segment_bytes = sum(path.stat().st_size for path in (Path(workdir) / "archive").rglob("*.seg"))
+
+        started = time.perf_counter()
+        archived_logs = await archive.read_logs(component_id)
+        archive_seconds = time.perf_counter() - started
+
+        await engine.dispose()
+
+        database_bytes = database_path.stat().st_size
+
+        print(f"rows:                {rows}")
+        print(f"sqlite file:         {format_bytes(database_bytes)}")
+        print(f"segment files:       {format_bytes(segment_bytes)}")
+        print(f"storage ratio:       {database_bytes / segment_bytes:.1f}x")
+        print(f"sql scan:            {sql_seconds * 1000:.1f} ms ({rows / sql_seconds:,.0f} rows/s)")
+        print(f"archive scan (mmap): {archive_seconds * 1000:.1f} ms ({rows / archive_seconds:,.0f} rows/s)")
+        print(f"rows match:          {_normalize(sql_logs) == _normalize(archived_logs)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare SQL and columnar archive storage for health checks")
+    parser.add_argument("--rows", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    random.seed(42)
+    asyncio.run(run(arguments.rows))
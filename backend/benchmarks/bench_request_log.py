@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # noqa: E402
+
+from infra.logging.config import configure_logging  # noqa: E402
+from infra.web.middleware.request_event_log_middleware import RequestEventLogMiddleware  # noqa: E402
+
+MODES: list[tuple[str, dict[str, Any]]] = [
+    ("full", {"mode": "full"}),
+    ("summary", {"mode": "summary"}),
+    ("sampled", {"mode": "sampled"}),
+]
+
+SCOPE: Scope = {
+    "type": "http",
+    "method": "GET",
+    "path": "/py-status-page/product",
+    "query_string": b"page=1&page_size=10&summary_days=30&include_total=true",
+    "client": ("10.0.0.12", 51234),
+    "route": SimpleNamespace(path="/product", name="get_all_products"),
+    "headers": [
+        (b"host", b"status.example.com"),
+        (b"user-agent", b"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0"),
+        (b"accept", b"application/json, text/plain, */*"),
+        (b"accept-encoding", b"gzip, deflate, br, zstd"),
+        (b"accept-language", b"en-US,en;q=0.9"),
+        (b"if-none-match", b'"3f9a1c7e"'),
+        (b"origin", b"http://localhost:4200"),
+        (b"referer", b"http://localhost:4200/"),
+        (b"connection", b"keep-alive"),
+        (b"x-request-id", b"bench-request"),
+    ],
+}
+
+
+async def _endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", b"2")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+async def _per_request_us(app: ASGIApp, requests: int) -> float:
+    for _ in range(min(requests, 1_000)):
+        await app(SCOPE, _receive, _send)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(SCOPE, _receive, _send)
+
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def run(requests: int, sample_rate: float, json_logs: bool) -> None:
+    configure_logging(log_level="INFO", service_name="bench", environment="dev", json_logs=json_logs)
+    # Rendered and written like in production, just not to the terminal.
+    logging.getLogger().handlers[0].setStream(open(os.devnull, "w"))
+
+    baseline = await _per_request_us(_endpoint, requests)
+
+    print(f"requests: {requests}, sample_rate: {sample_rate}, json_logs: {json_logs}")
+    print(f"{'none':<8} {baseline:8.2f} us/request")
+
+    for name, options in MODES:
+        middleware = RequestEventLogMiddleware(_endpoint, sample_rate=sample_rate, **options)
+        per_request = await _per_request_us(middleware, requests)
+
+        print(f"{name:<8} {per_request:8.2f} us/request  {per_request - baseline:8.2f} us overhead")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-request cost of RequestEventLogMiddleware in each logging mode")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    parser.add_argument("--console", action="store_true", help="render with the console renderer instead of JSON")
+    arguments = parser.parse_args()
+
+    asyncio.run(run(arguments.requests, arguments.sample_rate, not arguments.console))
@@ -0,0 +1,124 @@
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from core.domain.component import Component  # noqa: E402
+from core.domain.component_type import ComponentType  # noqa: E402
+from core.domain.healthcheck_config import HealthcheckConfig  # noqa: E402
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary  # noqa: E402
+from core.domain.page import Page  # noqa: E402
+from core.domain.product import Product  # noqa: E402
+from core.domain.status_type import StatusType  # noqa: E402
+from infra.web.json_encoder import compile_encoder  # noqa: E402
+from infra.web.routers.schemas.page import PageDTO  # noqa: E402
+from infra.web.routers.schemas.product import ColumnarProductResponseDTO, ProductResponseDTO  # noqa: E402
+
+RESPONSE_MODEL = PageDTO[ProductResponseDTO]
+COLUMNAR_RESPONSE_MODEL = PageDTO[ColumnarProductResponseDTO]
+
+
+def _build_page(components: int, days: int) -> Page[Product]:
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    product = Product(
+        id=1,
+        name="bench",
+        description="benchmark product",
+        created_at=today,
+        updated_at=today,
+        components=[
+            Component(
+                id=component_id,
+                product_id=1,
+                name=f"bench-{component_id}",
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url=f"https://bench-{component_id}.example.com/health"),
+                current_status=StatusType.OPERATIONAL,
+                healthcheck_day_logs=[
+                    HealthcheckLogDaySummary(
+                        component_id=component_id,
+                        date=today - timedelta(days=day),
+                        total_checks=1440,
+                        successful_checks=1438,
+                        uptime=99.86,
+                        avg_response_time=120,
+                        max_response_time=980,
+                        overall_status=StatusType.OPERATIONAL,
+                    )
+                    for day in range(days)
+                ],
+            )
+            for component_id in range(1, components + 1)
+        ],
+    )
+
+    return Page(page_size=1, page_count=1, total_elements=1, total_pages=1, content=[product])
+
+
+def _framework(page: Page[Product]) -> bytes:
+    # What FastAPI does for a plain return value: validate into the DTO, dump to python, then json.dumps.
+    dumped = RESPONSE_MODEL.model_validate(page).model_dump(mode="json", by_alias=True)
+    return json.dumps(jsonable_encoder(dumped), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _validated(page: Page[Product]) -> bytes:
+    return RESPONSE_MODEL.model_validate(page).model_dump_json(by_alias=True).encode("utf-8")
+
+
+def _compiled(page: Page[Product]) -> bytes:
+    return compile_encoder(RESPONSE_MODEL).to_json(page, by_alias=True, warnings="error")
+
+
+def _columnar(page: Page[Product]) -> bytes:
+    return COLUMNAR_RESPONSE_MODEL.model_validate(page).model_dump_json(by_alias=True).encode("utf-8")
+
+
+def _measure(name: str, encode: Callable[[Page[Product]], bytes], page: Page[Product], iterations: int) -> None:
+    body = encode(page)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        encode(page)
+    seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        json.loads(body)
+    decode_seconds = time.perf_counter() - started
+
+    print(
+        f"{name:<10} {seconds / iterations * 1000:8.2f} ms/response  {len(body) / 1024:8,.0f} KiB"
+        f"  {decode_seconds / iterations * 1000:8.2f} ms json.loads"
+    )
+
+
+def run(components: int, days: int, iterations: int) -> None:
+    page = _build_page(components, days)
+
+    if json.loads(_compiled(page)) != json.loads(_validated(page)):
+        raise SystemExit("compiled encoder output differs from the validated response")
+
+    print(f"components: {components}, days: {days}, iterations: {iterations}")
+
+    _measure("framework", _framework, page, iterations)
+    _measure("validated", _validated, page, iterations)
+    _measure("compiled", _compiled, page, iterations)
+    _measure("columnar", _columnar, page, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Product page encoding: DTOs, compiled encoder, columnar bars")
+    parser.add_argument("--components", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--iterations", type=int, default=20)
+    arguments = parser.parse_args()
+
+    run(arguments.components, arguments.days, arguments.iterations)
@@ -1,3 +1,5 @@
 #/bin/bash
 
+python src/cli.py migrate || exit 1
+
 uvicorn main:create_app --app-dir src --host 0.0.0.0 --port 8080 --no-access-log --factory
\ No newline at end of file
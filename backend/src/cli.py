@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional, TextIO
+
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from infra.adapter.postgres_component_repository import get_component_repository
+from infra.adapter.postgres_incident_repository import get_incident_repository
+from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.postgres_product_repository import get_product_repository
+from infra.db.session import close_engine, migrate_database
+from infra.utils.log_export import ExportFormat, decode_logs, encode_logs
+from use_cases.incident.backfill_incidents_use_case import BackfillIncidentsUseCase
+from use_cases.log.export_logs_use_case import ExportLogsUseCase
+from use_cases.log.import_logs_use_case import ImportLogsUseCase
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="status-page")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Stream raw health checks as NDJSON or CSV")
+    export.add_argument("--component-id", type=int)
+    export.add_argument("--product-id", type=int)
+    export.add_argument("--since", type=_parse_datetime, help="ISO-8601, UTC when no offset is given")
+    export.add_argument("--until", type=_parse_datetime, help="ISO-8601, UTC when no offset is given")
+    export.add_argument("--format", choices=[item.value for item in ExportFormat], default=ExportFormat.NDJSON.value)
+    export.add_argument("--gzip", action="store_true")
+    export.add_argument("--output", help="Destination file, defaults to stdout")
+
+    import_ = commands.add_parser("import", help="Bulk load health checks from an NDJSON or CSV export")
+    import_.add_argument("--format", choices=[item.value for item in ExportFormat], default=ExportFormat.NDJSON.value)
+    import_.add_argument("--batch-size", type=int, default=5000)
+    import_.add_argument("--input", help="Source file, defaults to stdin")
+
+    commands.add_parser("migrate", help="Apply pending schema migrations")
+
+    backfill = commands.add_parser("backfill-incidents", help="Rebuild incidents from stored health checks")
+    backfill.add_argument("--component-id", type=int, action="append", dest="component_ids")
+
+    return parser
+
+
+async def export_checks(args: argparse.Namespace, output: BinaryIO) -> None:
+    use_case = ExportLogsUseCase(
+        product_repository=get_product_repository(),
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
+    )
+
+    logs = await use_case.execute(
+        component_id=args.component_id,
+        product_id=args.product_id,
+        since=args.since,
+        until=args.until,
+    )
+
+    async for chunk in encode_logs(logs, export_format=ExportFormat(args.format), compress=args.gzip):
+        output.write(chunk)
+
+    output.flush()
+
+
+async def import_checks(args: argparse.Namespace, source: TextIO) -> int:
+    use_case = ImportLogsUseCase(log_repository=get_log_repository())
+
+    return await use_case.execute(decode_logs(source, ExportFormat(args.format)), batch_size=args.batch_size)
+
+
+async def backfill_incidents(args: argparse.Namespace) -> int:
+    use_case = BackfillIncidentsUseCase(
+        log_repository=get_log_repository(),
+        incident_repository=get_incident_repository(),
+    )
+
+    return await use_case.execute(component_ids=args.component_ids)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        if args.command == "migrate":
+            applied = await migrate_database()
+            print(f"Applied migrations: {', '.join(map(str, applied)) or 'none pending'}", file=sys.stderr)
+            return
+
+        if args.command == "backfill-incidents":
+            written = await backfill_incidents(args)
+            print(f"Backfilled {written} incidents", file=sys.stderr)
+            return
+
+        if args.command == "import":
+            if args.input is None:
+                imported = await import_checks(args, sys.stdin)
+            else:
+                with open(args.input, encoding="utf-8", newline="") as source:
+                    imported = await import_checks(args, source)
+
+            print(f"Imported {imported} health checks", file=sys.stderr)
+            return
+
+        if args.output is None:
+            await export_checks(args, sys.stdout.buffer)
+            return
+
+        with open(args.output, "wb") as output:
+            await export_checks(args, output)
+    finally:
+        await close_engine()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        asyncio.run(_run(args))
+    except ComponentNotFoundError:
+        print("Component not found", file=sys.stderr)
+        return 1
+    except ProductNotFoundError:
+        print("Product not found", file=sys.stderr)
+        return 1
+    except InvalidTimeRangeError as error:
+        print(str(error), file=sys.stderr)
+        return 2
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
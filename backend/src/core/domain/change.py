@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ChangeKind(str, Enum):
+    PRODUCT = "PRODUCT"
+    COMPONENT = "COMPONENT"
+    DAY_SUMMARY = "DAY_SUMMARY"
+
+
+@dataclass(frozen=True)
+class Change:
+    kind: ChangeKind
+    entity_id: int
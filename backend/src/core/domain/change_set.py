@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+from core.domain.component import Component
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.product import Product
+
+
+@dataclass
+class ChangeSet:
+    version: int
+    products: list[Product] = field(default_factory=list)
+    deleted_product_ids: list[int] = field(default_factory=list)
+    components: list[Component] = field(default_factory=list)
+    deleted_component_ids: list[int] = field(default_factory=list)
+    day_summaries: list[HealthcheckLogDaySummary] = field(default_factory=list)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Generic, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    page_size: int
+    content: list[T]
+    next_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.content)
+
+    def __len__(self) -> int:
+        return len(self.content)
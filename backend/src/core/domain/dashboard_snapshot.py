@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from core.domain.product import Product
+
+
+@dataclass
+class DashboardSnapshot:
+    version: int
+    generated_at: datetime
+    products: list[Product] = field(default_factory=list)
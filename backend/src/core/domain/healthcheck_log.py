@@ -17,3 +17,5 @@ class HealthcheckLog:
     status_before: StatusType
     status_after: StatusType
     error_message: Optional[str]
+
+    id: Optional[int] = None
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from core.domain.rollup_resolution import RollupResolution
+from core.domain.status_type import StatusType
+
+
+@dataclass
+class HealthcheckRollup:
+    component_id: int
+    resolution: RollupResolution
+    bucket_start: datetime
+    total_checks: int
+    successful_checks: int
+    uptime: float
+    avg_response_time: int
+    max_response_time: int
+    overall_status: StatusType
+
+
+@dataclass
+class HealthcheckHistory:
+    component_id: int
+    resolution: RollupResolution
+    since: datetime
+    until: datetime
+    buckets: list[HealthcheckRollup] = field(default_factory=list)
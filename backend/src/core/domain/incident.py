@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+
+
+@dataclass
+class Incident:
+    id: Optional[int]
+    component_id: int
+
+    started_at: datetime
+    status: StatusType
+    ended_at: Optional[datetime] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.ended_at is None
+
+    @property
+    def duration_seconds(self) -> Optional[int]:
+        if self.ended_at is None:
+            return None
+
+        return int((self.ended_at - self.started_at).total_seconds())
+
+    @classmethod
+    def open_from(cls, log: HealthcheckLog) -> "Incident":
+        return cls(id=None, component_id=log.component_id, started_at=log.checked_at, status=log.status_after)
+
+    def absorb(self, log: HealthcheckLog) -> bool:
+        if log.status_after is StatusType.OPERATIONAL:
+            self.ended_at = log.checked_at
+            return True
+
+        if log.status_after.severity > self.status.severity:
+            self.status = log.status_after
+            return True
+
+        return False
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Generic, Iterator, TypeVar
+from typing import Generic, Iterator, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -8,9 +8,10 @@ T = TypeVar("T")
 class Page(Generic[T]):
     page_size: int
     page_count: int
-    total_elements: int
-    total_pages: int
+    total_elements: Optional[int]
+    total_pages: Optional[int]
     content: list[T]
+    has_next: bool = False
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.content)
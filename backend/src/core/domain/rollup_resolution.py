@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+
+class RollupResolution(str, Enum):
+    MINUTE = "MINUTE"
+    HOUR = "HOUR"
+    DAY = "DAY"
+
+    @property
+    def seconds(self) -> int:
+        mapping = {
+            RollupResolution.MINUTE: 60,
+            RollupResolution.HOUR: 3_600,
+            RollupResolution.DAY: 86_400,
+        }
+
+        return mapping[self]
+
+    def bucket_start(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+
+        value = value.astimezone(timezone.utc)
+
+        if self is RollupResolution.MINUTE:
+            return value.replace(second=0, microsecond=0)
+
+        if self is RollupResolution.HOUR:
+            return value.replace(minute=0, second=0, microsecond=0)
+
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def bucket_count(self, since: datetime, until: datetime) -> int:
+        span = self.bucket_start(until) - self.bucket_start(since)
+
+        return int(span / timedelta(seconds=self.seconds)) + 1
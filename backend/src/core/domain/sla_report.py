@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ComponentSla:
+    component_id: int
+    total_checks: int
+    successful_checks: int
+    uptime: Optional[float]
+
+
+@dataclass
+class SlaReport:
+    since: datetime
+    until: datetime
+    total_checks: int
+    successful_checks: int
+    uptime: Optional[float]
+    components: list[ComponentSla] = field(default_factory=list)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from core.domain.status_type import StatusType
+
+
+@dataclass(frozen=True)
+class StatusEvent:
+    id: str
+    component_id: int
+    product_id: int
+    previous_status: StatusType
+    status: StatusType
+    changed_at: datetime
@@ -0,0 +1 @@
+class EventLogExpiredError(Exception): ...
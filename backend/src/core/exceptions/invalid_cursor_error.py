@@ -0,0 +1 @@
+class InvalidCursorError(Exception): ...
@@ -0,0 +1 @@
+class InvalidTimeRangeError(Exception): ...
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from core.domain.change import Change
+
+
+class ChangeTracker(ABC):
+    @abstractmethod
+    async def current_version(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def record_change(self, *changes: Change) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def changes_since(self, version: int) -> tuple[int, list[Change]]:
+        raise NotImplementedError
@@ -19,7 +19,18 @@ class ComponentRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_all_by_product_id(self, product_id: int, page: int, page_size: int) -> Page[Component]:
+    async def find_all_by_ids(self, component_ids: list[int]) -> list[Component]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all_by_product_id(
+        self,
+        product_id: int,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: Optional[str] = None,
+    ) -> Page[Component]:
         raise NotImplementedError
 
     @abstractmethod
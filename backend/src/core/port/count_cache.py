@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Optional
+
+
+class CountCache(ABC):
+    @abstractmethod
+    async def get(self, namespace: str, key: Hashable) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generation(self, namespace: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, namespace: str, key: Hashable, total: int, generation: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        raise NotImplementedError
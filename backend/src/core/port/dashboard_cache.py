@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from core.domain.dashboard_snapshot import DashboardSnapshot
+
+
+class DashboardCache(ABC):
+    @abstractmethod
+    async def get_or_build(
+        self,
+        version: int,
+        build: Callable[[], Awaitable[DashboardSnapshot]],
+    ) -> DashboardSnapshot:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def encoded(self, snapshot: DashboardSnapshot, encode: Callable[[DashboardSnapshot], bytes]) -> bytes:
+        raise NotImplementedError
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from core.domain.incident import Incident
+from core.domain.page import Page
+from core.domain.status_type import StatusType
+
+
+class IncidentRepository(ABC):
+    @abstractmethod
+    async def save(self, incident: Incident) -> Incident:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_open(self, component_id: int) -> Optional[Incident]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all(
+        self,
+        page: int,
+        page_size: int,
+        component_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        status: Optional[StatusType] = None,
+        is_open: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Page[Incident]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_for_component(self, component_id: int, incidents: list[Incident]) -> None:
+        raise NotImplementedError
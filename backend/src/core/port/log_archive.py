@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+
+
+class LogArchive(ABC):
+    @abstractmethod
+    async def write_segment(self, component_id: int, logs: list[HealthcheckLog]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_logs(
+        self,
+        component_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[HealthcheckLog]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_logs(
+        self,
+        component_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[list[HealthcheckLog]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_latest_logs(
+        self,
+        component_id: int,
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> list[HealthcheckLog]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def archived_until(self, component_id: int) -> Optional[datetime]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def component_ids(self) -> list[int]:
+        raise NotImplementedError
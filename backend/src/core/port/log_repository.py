@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Optional
 
+from core.domain.cursor_page import CursorPage
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
 from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.healthcheck_rollup import HealthcheckRollup
+from core.domain.rollup_resolution import RollupResolution
 
 
 class LogRepository(ABC):
@@ -9,10 +15,36 @@ class LogRepository(ABC):
     async def add_log(self, log: HealthcheckLog) -> HealthcheckLog:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_logs(self, logs: list[HealthcheckLog]) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_logs(self, component_id: int, limit: int) -> list[HealthcheckLog]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_logs_page(
+        self,
+        component_id: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        is_successful: Optional[bool] = None,
+    ) -> CursorPage[HealthcheckLog]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_logs(
+        self,
+        component_ids: Optional[list[int]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[HealthcheckLog]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_last_n_day_summary(self, component_id: int, last_n_days: int) -> list[HealthcheckLogDaySummary]:
         raise NotImplementedError
@@ -24,3 +56,34 @@ class LogRepository(ABC):
         last_n_days: int,
     ) -> dict[int, list[HealthcheckLogDaySummary]]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_logs_between(self, component_id: int, since: datetime, until: datetime) -> list[HealthcheckLog]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_logs(self, component_id: int, log_ids: list[int]) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_archivable_components(self, until: datetime) -> dict[int, datetime]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_check_counts(
+        self,
+        component_ids: list[int],
+        since: datetime,
+        until: datetime,
+    ) -> dict[int, tuple[int, int]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_rollups(
+        self,
+        component_id: int,
+        resolution: RollupResolution,
+        since: datetime,
+        until: datetime,
+    ) -> list[HealthcheckRollup]:
+        raise NotImplementedError
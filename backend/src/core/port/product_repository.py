@@ -19,7 +19,19 @@ class ProductRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_all(self, is_visible: bool, page: int, page_size: int) -> Page[Product]:
+    async def find_all(
+        self,
+        is_visible: bool,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: Optional[str] = None,
+        include_components: bool = True,
+    ) -> Page[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_all_without_pagination(self, is_visible: bool) -> list[Product]:
         raise NotImplementedError
 
     @abstractmethod
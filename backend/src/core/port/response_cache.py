@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Optional
+
+
+class ResponseCache(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def tags(self, key: str) -> Optional[frozenset[str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generation(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, body: bytes, tags: Iterable[str], generation: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        raise NotImplementedError
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from core.domain.status_event import StatusEvent
+from core.domain.status_type import StatusType
+
+
+class StatusEventBus(ABC):
+    @abstractmethod
+    async def publish(
+        self,
+        component_id: int,
+        product_id: int,
+        previous_status: StatusType,
+        status: StatusType,
+        changed_at: datetime,
+    ) -> StatusEvent:
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest_event_id(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_after(self, last_event_id: str, timeout_seconds: float) -> list[StatusEvent]:
+        raise NotImplementedError
@@ -0,0 +1,46 @@
+import time
+from collections import deque
+from functools import lru_cache
+
+from core.domain.change import Change
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from core.port.change_tracker import ChangeTracker
+from infra.config.config import get_config
+
+
+class InMemoryChangeTracker(ChangeTracker):
+    def __init__(self, initial_version: int = 0, max_changes: int = 10_000) -> None:
+        self._version = initial_version
+        self._oldest_complete_version = initial_version
+        self._changes: deque[tuple[int, Change]] = deque(maxlen=max_changes)
+
+    async def current_version(self) -> int:
+        return self._version
+
+    async def record_change(self, *changes: Change) -> int:
+        self._version += 1
+
+        for change in changes:
+            if len(self._changes) == self._changes.maxlen:
+                self._oldest_complete_version = self._changes[0][0]
+
+            self._changes.append((self._version, change))
+
+        return self._version
+
+    async def changes_since(self, version: int) -> tuple[int, list[Change]]:
+        if version > self._version:
+            raise EventLogExpiredError(f"Version {version} was not issued by this process")
+
+        if version < self._oldest_complete_version:
+            raise EventLogExpiredError(f"Version {version} is no longer retained")
+
+        return self._version, [change for change_version, change in self._changes if change_version > version]
+
+
+@lru_cache
+def get_change_tracker() -> ChangeTracker:
+    return InMemoryChangeTracker(
+        initial_version=time.time_ns() // 1_000_000,
+        max_changes=get_config().CHANGE_LOG_CONFIG.MAX_CHANGES,
+    )
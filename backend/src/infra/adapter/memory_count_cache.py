@@ -0,0 +1,32 @@
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Optional
+
+from core.port.count_cache import CountCache
+
+
+class InMemoryCountCache(CountCache):
+    def __init__(self) -> None:
+        self._totals: dict[str, dict[Hashable, int]] = {}
+        self._generations: dict[str, int] = {}
+
+    async def get(self, namespace: str, key: Hashable) -> Optional[int]:
+        return self._totals.get(namespace, {}).get(key)
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def set(self, namespace: str, key: Hashable, total: int, generation: int) -> None:
+        if generation != self._generations.get(namespace, 0):
+            return
+
+        self._totals.setdefault(namespace, {})[key] = total
+
+    async def invalidate(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        self._totals.pop(namespace, None)
+
+
+@lru_cache
+def get_count_cache() -> CountCache:
+    return InMemoryCountCache()
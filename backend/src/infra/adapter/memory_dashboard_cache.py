@@ -0,0 +1,54 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Optional
+
+from core.domain.dashboard_snapshot import DashboardSnapshot
+from core.port.dashboard_cache import DashboardCache
+from infra.config.config import get_config
+
+
+class InMemoryDashboardCache(DashboardCache):
+    def __init__(self, refresh_seconds: float = 0.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._built_at = 0.0
+        self._body: Optional[tuple[DashboardSnapshot, bytes]] = None
+        self._lock = asyncio.Lock()
+
+    async def get_or_build(
+        self,
+        version: int,
+        build: Callable[[], Awaitable[DashboardSnapshot]],
+    ) -> DashboardSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot, version):
+            return snapshot
+
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot, version):
+                return snapshot
+
+            self._snapshot = await build()
+            self._built_at = self._clock()
+            return self._snapshot
+
+    async def encoded(self, snapshot: DashboardSnapshot, encode: Callable[[DashboardSnapshot], bytes]) -> bytes:
+        body = self._body
+        if body is not None and body[0] is snapshot:
+            return body[1]
+
+        encoded = encode(snapshot)
+        self._body = (snapshot, encoded)
+        return encoded
+
+    def _is_fresh(self, snapshot: DashboardSnapshot, version: int) -> bool:
+        return snapshot.version >= version or self._clock() - self._built_at < self._refresh_seconds
+
+
+@lru_cache
+def get_dashboard_cache() -> DashboardCache:
+    return InMemoryDashboardCache(refresh_seconds=get_config().DASHBOARD_CONFIG.REFRESH_SECONDS)
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Optional
+
+from core.port.response_cache import ResponseCache
+from infra.config.config import get_config
+
+
+class InMemoryResponseCache(ResponseCache):
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, frozenset[str]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._invalidated_at: dict[str, int] = {}
+        self._generation = 0
+        self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def tags(self, key: str) -> Optional[frozenset[str]]:
+        entry = self._entries.get(key)
+
+        return entry[1] if entry is not None else None
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def set(self, key: str, body: bytes, tags: Iterable[str], generation: int) -> None:
+        entry_tags = frozenset(tags)
+
+        if any(self._invalidated_at.get(tag, 0) > generation for tag in entry_tags):
+            return
+
+        if self._entry_size(key, body) > self._max_bytes:
+            return
+
+        self._drop(key)
+        self._entries[key] = (body, entry_tags)
+        self._size += self._entry_size(key, body)
+
+        for tag in entry_tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while self._size > self._max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        self._generation += 1
+
+        for tag in tags:
+            self._invalidated_at[tag] = self._generation
+
+            for key in self._keys_by_tag.pop(tag, set()):
+                self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        body, tags = entry
+        self._size -= self._entry_size(key, body)
+
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+
+            if keys is not None:
+                keys.discard(key)
+
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _entry_size(self, key: str, body: bytes) -> int:
+        return len(key) + len(body)
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    return InMemoryResponseCache(max_bytes=get_config().RESPONSE_CACHE_CONFIG.MAX_BYTES)
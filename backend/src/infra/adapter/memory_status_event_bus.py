@@ -0,0 +1,81 @@
+import asyncio
+import secrets
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+from core.domain.status_event import StatusEvent
+from core.domain.status_type import StatusType
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from core.port.status_event_bus import StatusEventBus
+from infra.config.config import get_config
+
+
+class InMemoryStatusEventBus(StatusEventBus):
+    def __init__(self, max_events: int) -> None:
+        self._instance = secrets.token_hex(4)
+        self._events: deque[StatusEvent] = deque(maxlen=max_events)
+        self._sequence = 0
+        self._published = asyncio.Event()
+
+    async def publish(
+        self,
+        component_id: int,
+        product_id: int,
+        previous_status: StatusType,
+        status: StatusType,
+        changed_at: datetime,
+    ) -> StatusEvent:
+        self._sequence += 1
+        event = StatusEvent(
+            id=self._event_id(self._sequence),
+            component_id=component_id,
+            product_id=product_id,
+            previous_status=previous_status,
+            status=status,
+            changed_at=changed_at,
+        )
+        self._events.append(event)
+
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+        return event
+
+    def latest_event_id(self) -> str:
+        return self._event_id(self._sequence)
+
+    async def read_after(self, last_event_id: str, timeout_seconds: float) -> list[StatusEvent]:
+        sequence = self._parse_sequence(last_event_id)
+
+        if sequence == self._sequence:
+            published = self._published
+
+            try:
+                async with asyncio.timeout(timeout_seconds):
+                    await published.wait()
+            except TimeoutError:
+                return []
+
+        first_retained = self._sequence - len(self._events) + 1
+        if sequence + 1 < first_retained:
+            raise EventLogExpiredError(f"Event {last_event_id} is no longer retained")
+
+        return list(islice(self._events, sequence + 1 - first_retained, None))
+
+    def _event_id(self, sequence: int) -> str:
+        return f"{self._instance}-{sequence}"
+
+    def _parse_sequence(self, event_id: str) -> int:
+        instance, _, raw_sequence = event_id.partition("-")
+
+        if instance != self._instance or not raw_sequence.isdigit() or int(raw_sequence) > self._sequence:
+            raise EventLogExpiredError(f"Event {event_id} is no longer retained")
+
+        return int(raw_sequence)
+
+
+@lru_cache
+def get_status_event_bus() -> StatusEventBus:
+    return InMemoryStatusEventBus(max_events=get_config().STREAM_CONFIG.EVENT_LOG_SIZE)
@@ -1,120 +1,166 @@
+from dataclasses import replace
 from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from core.domain.change import Change, ChangeKind
 from core.domain.component import Component
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.page import Page
 from core.exceptions.component_already_exists_error import ComponentAlreadyExistsError
+from core.port.change_tracker import ChangeTracker
 from core.port.component_repository import ComponentRepository
+from core.port.count_cache import CountCache
+from core.port.response_cache import ResponseCache
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_count_cache import get_count_cache
+from infra.adapter.memory_response_cache import get_response_cache
+from infra.db.dialect import upsert_insert
 from infra.db.models import ComponentModel
-from infra.db.session import get_session_factory
+from infra.db.pagination import fetch_page
+from infra.db.projections import COMPONENT_COLUMNS, component_from_row
+from infra.db.reader import SessionReader, primary_reads
+from infra.db.search import name_matches
+from infra.db.session import get_session_factory, get_session_reader, get_session_writer
+from infra.db.writer import SessionWriter
+from infra.utils.cache_tags import SEARCH_RESULTS_TAG, component_tag, product_tag
+
+COMPONENT_COUNT_NAMESPACE = "components"
 
 
 class PostgresComponentRepository(ComponentRepository):
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
+        change_tracker: Optional[ChangeTracker] = None,
+        count_cache: Optional[CountCache] = None,
+        writer: Optional[SessionWriter] = None,
+        reader: Optional[SessionReader] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._session_factory = session_factory
+        self._change_tracker = change_tracker
+        self._count_cache = count_cache
+        self._response_cache = response_cache
+        self._writer = writer or SessionWriter(session_factory)
+        self._reader = reader or SessionReader(session_factory)
 
     async def save(self, component: Component) -> Component:
-        async with self._session_factory() as session:
-            try:
-                model: Optional[ComponentModel] = None
-                component_id = component.id
-
-                if component_id is not None and component_id > 0:
-                    model = await session.get(ComponentModel, component_id)
-
-                if model is None:
-                    model = ComponentModel(
-                        product_id=component.product_id,
-                        name=component.name,
-                        type=component.type,
-                        current_status=component.current_status,
-                        health_url=component.monitoring_config.health_url,
-                        check_interval_seconds=component.monitoring_config.check_interval_seconds,
-                        timeout_seconds=component.monitoring_config.timeout_seconds,
-                        expected_status_code=component.monitoring_config.expected_status_code,
-                        max_response_time_ms=component.monitoring_config.max_response_time_ms,
-                        failures_before_outage=component.monitoring_config.failures_before_outage,
-                        is_active=component.is_active,
-                    )
-
-                    if component_id is not None and component_id > 0:
-                        model.id = component_id
-
-                    session.add(model)
-                else:
-                    model.product_id = component.product_id
-                    model.name = component.name
-                    model.type = component.type
-                    model.current_status = component.current_status
-                    model.health_url = component.monitoring_config.health_url
-                    model.check_interval_seconds = component.monitoring_config.check_interval_seconds
-                    model.timeout_seconds = component.monitoring_config.timeout_seconds
-                    model.expected_status_code = component.monitoring_config.expected_status_code
-                    model.max_response_time_ms = component.monitoring_config.max_response_time_ms
-                    model.failures_before_outage = component.monitoring_config.failures_before_outage
-                    model.is_active = component.is_active
-
-                await session.commit()
-                await session.refresh(model)
-
-                return self._to_domain(model)
-
-            except IntegrityError as e:
-                await session.rollback()
-
-                error_msg = str(e.orig).lower()
-
-                if "name" in error_msg or "components_name_key" in error_msg:
-                    raise ComponentAlreadyExistsError("name", component.name)
-                elif "health_url" in error_msg or "components_health_url_key" in error_msg:
-                    raise ComponentAlreadyExistsError("health_url", component.monitoring_config.health_url)
-                else:
-                    raise
-
-    async def find_all_by_product_id(self, product_id: int, page: int, page_size: int) -> Page[Component]:
-        async with self._session_factory() as session:
-            total_elements_statement = select(func.count(ComponentModel.id)).where(
-                ComponentModel.product_id == product_id
+        values = {
+            "product_id": component.product_id,
+            "name": component.name,
+            "type": component.type,
+            "current_status": component.current_status,
+            "health_url": component.monitoring_config.health_url,
+            "check_interval_seconds": component.monitoring_config.check_interval_seconds,
+            "timeout_seconds": component.monitoring_config.timeout_seconds,
+            "expected_status_code": component.monitoring_config.expected_status_code,
+            "max_response_time_ms": component.monitoring_config.max_response_time_ms,
+            "failures_before_outage": component.monitoring_config.failures_before_outage,
+            "is_active": component.is_active,
+        }
+
+        async def _save(session: AsyncSession) -> tuple[Component, Optional[Row]]:
+            previous = None
+
+            if component.id is not None and component.id > 0:
+                previous_statement = select(ComponentModel.product_id, ComponentModel.name).where(
+                    ComponentModel.id == component.id
+                )
+                previous = (await session.execute(previous_statement)).one_or_none()
+                statement = upsert_insert(session, ComponentModel).values(id=component.id, **values)
+                statement = statement.on_conflict_do_update(index_elements=[ComponentModel.id], set_=values)
+            else:
+                statement = insert(ComponentModel).values(**values)
+
+            model = (
+                await session.scalars(
+                    statement.returning(ComponentModel),
+                    execution_options={"populate_existing": True},
+                )
+            ).one()
+
+            return self._to_domain(model), previous
+
+        try:
+            saved, previous = await self._writer.run(_save)
+        except IntegrityError as e:
+            error_msg = str(e.orig).lower()
+
+            if "name" in error_msg or "components_name_key" in error_msg:
+                raise ComponentAlreadyExistsError("name", component.name)
+            elif "health_url" in error_msg or "components_health_url_key" in error_msg:
+                raise ComponentAlreadyExistsError("health_url", component.monitoring_config.health_url)
+            else:
+                raise
+
+        if previous is None:
+            await self._record_change(saved.id, saved.product_id, membership_changed=True, name_changed=True)
+        else:
+            await self._record_change(
+                saved.id,
+                saved.product_id,
+                previous_product_id=previous.product_id,
+                membership_changed=previous.product_id != saved.product_id,
+                name_changed=previous.name != saved.name,
             )
-            total_elements = (await session.execute(total_elements_statement)).scalar_one()
 
-            offset = (page - 1) * page_size
+        return saved
+
+    async def find_all_by_product_id(
+        self,
+        product_id: int,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: Optional[str] = None,
+    ) -> Page[Component]:
+        known_total, generation = await self._cached_total(product_id, include_total and search is None)
+
+        async def _find_all(session: AsyncSession) -> Page[Component]:
             statement = (
-                select(ComponentModel)
+                select(*COMPONENT_COLUMNS)
                 .where(ComponentModel.product_id == product_id)
                 .order_by(ComponentModel.id.asc())
-                .offset(offset)
-                .limit(page_size)
             )
-            models = (await session.execute(statement)).scalars().all()
-            content = [self._to_domain(model) for model in models]
 
-            total_pages = (total_elements + page_size - 1) // page_size if total_elements > 0 else 0
+            if search is not None:
+                statement = statement.where(name_matches(session, ComponentModel, search))
 
-            return Page(
-                page_size=page_size,
-                page_count=len(content),
-                total_elements=total_elements,
-                total_pages=total_pages,
-                content=content,
-            )
+            row_page = await fetch_page(session, statement, page, page_size, include_total, known_total)
+
+            return replace(row_page, content=[component_from_row(row) for row in row_page])
+
+        fills_count = include_total and search is None and known_total is None and self._count_cache is not None
+
+        with primary_reads(fills_count):
+            component_page = await self._reader.run(_find_all)
+
+        if fills_count:
+            total_elements = component_page.total_elements
+            await self._count_cache.set(COMPONENT_COUNT_NAMESPACE, product_id, total_elements, generation)
+
+        return component_page
 
     async def delete(self, component_id: int) -> bool:
-        async with self._session_factory() as session:
-            statement = delete(ComponentModel).where(ComponentModel.id == component_id)
+        async def _delete(session: AsyncSession) -> Optional[int]:
+            statement = (
+                delete(ComponentModel).where(ComponentModel.id == component_id).returning(ComponentModel.product_id)
+            )
+
+            return (await session.execute(statement)).scalar_one_or_none()
+
+        product_id = await self._writer.run(_delete)
+
+        if product_id is None:
+            return False
 
-            result = await session.execute(statement)
-            await session.commit()
+        await self._record_change(component_id, product_id, membership_changed=True)
 
-            return result.rowcount == 1 # type: ignore
+        return True
 
     async def find_all_without_pagination(self) -> list[Component]:
         async with self._session_factory() as session:
@@ -133,6 +179,52 @@ class PostgresComponentRepository(ComponentRepository):
 
             return self._to_domain(model) if model is not None else None
 
+    async def find_all_by_ids(self, component_ids: list[int]) -> list[Component]:
+        if not component_ids:
+            return []
+
+        async def _find_all(session: AsyncSession) -> list[Component]:
+            statement = (
+                select(*COMPONENT_COLUMNS)
+                .where(ComponentModel.id.in_(component_ids))
+                .order_by(ComponentModel.id.asc())
+            )
+
+            return [component_from_row(row) for row in await session.execute(statement)]
+
+        return await self._reader.run(_find_all)
+
+    async def _record_change(
+        self,
+        component_id: Optional[int],
+        product_id: int,
+        previous_product_id: Optional[int] = None,
+        membership_changed: bool = False,
+        name_changed: bool = False,
+    ) -> None:
+        if self._change_tracker is not None:
+            await self._change_tracker.record_change(Change(ChangeKind.COMPONENT, component_id))
+
+        if self._count_cache is not None and membership_changed:
+            await self._count_cache.invalidate(COMPONENT_COUNT_NAMESPACE)
+
+        if self._response_cache is not None:
+            cache_tags = [component_tag(component_id), product_tag(product_id)]
+            if previous_product_id is not None and previous_product_id != product_id:
+                cache_tags.append(product_tag(previous_product_id))
+            if name_changed:
+                cache_tags.append(SEARCH_RESULTS_TAG)
+
+            await self._response_cache.invalidate(cache_tags)
+
+    async def _cached_total(self, product_id: int, include_total: bool) -> tuple[Optional[int], int]:
+        if not include_total or self._count_cache is None:
+            return None, 0
+
+        generation = await self._count_cache.generation(COMPONENT_COUNT_NAMESPACE)
+
+        return await self._count_cache.get(COMPONENT_COUNT_NAMESPACE, product_id), generation
+
     def _to_domain(self, model: ComponentModel) -> Component:
         return Component(
             id=model.id,
@@ -158,4 +250,11 @@ class PostgresComponentRepository(ComponentRepository):
 def get_component_repository() -> ComponentRepository:
     session_factory = get_session_factory()
 
-    return PostgresComponentRepository(session_factory)
+    return PostgresComponentRepository(
+        session_factory,
+        change_tracker=get_change_tracker(),
+        count_cache=get_count_cache(),
+        writer=get_session_writer(),
+        reader=get_session_reader(),
+        response_cache=get_response_cache(),
+    )
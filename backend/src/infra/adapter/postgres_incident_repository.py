@@ -0,0 +1,151 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.domain.incident import Incident
+from core.domain.page import Page
+from core.domain.status_type import StatusType
+from core.port.incident_repository import IncidentRepository
+from infra.db.models import ComponentModel, IncidentModel
+from infra.db.pagination import fetch_page
+from infra.db.session import get_session_factory, get_session_writer
+from infra.db.writer import SessionWriter
+
+
+class PostgresIncidentRepository(IncidentRepository):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        writer: Optional[SessionWriter] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._writer = writer or SessionWriter(session_factory)
+
+    async def save(self, incident: Incident) -> Incident:
+        async def _save(session: AsyncSession) -> Incident:
+            model: Optional[IncidentModel] = None
+
+            if incident.id is not None:
+                model = await session.get(IncidentModel, incident.id)
+
+            if model is None:
+                model = IncidentModel(
+                    component_id=incident.component_id,
+                    started_at=incident.started_at,
+                    status=incident.status,
+                    ended_at=incident.ended_at,
+                )
+                session.add(model)
+            else:
+                model.status = incident.status
+                model.ended_at = incident.ended_at
+
+            await session.flush()
+            await session.refresh(model)
+
+            return self._to_domain(model)
+
+        return await self._writer.run(_save)
+
+    async def find_open(self, component_id: int) -> Optional[Incident]:
+        async with self._session_factory() as session:
+            statement = (
+                select(IncidentModel)
+                .where(IncidentModel.component_id == component_id)
+                .where(IncidentModel.ended_at.is_(None))
+                .order_by(IncidentModel.started_at.desc())
+                .limit(1)
+            )
+
+            model = (await session.execute(statement)).scalar_one_or_none()
+
+            return self._to_domain(model) if model is not None else None
+
+    async def find_all(
+        self,
+        page: int,
+        page_size: int,
+        component_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        status: Optional[StatusType] = None,
+        is_open: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Page[Incident]:
+        filters = []
+
+        if component_id is not None:
+            filters.append(IncidentModel.component_id == component_id)
+
+        if product_id is not None:
+            filters.append(
+                IncidentModel.component_id.in_(select(ComponentModel.id).where(ComponentModel.product_id == product_id))
+            )
+
+        if status is not None:
+            filters.append(IncidentModel.status == status)
+
+        if is_open is not None:
+            filters.append(IncidentModel.ended_at.is_(None) if is_open else IncidentModel.ended_at.is_not(None))
+
+        if since is not None:
+            filters.append(or_(IncidentModel.ended_at.is_(None), IncidentModel.ended_at >= since))
+
+        if until is not None:
+            filters.append(IncidentModel.started_at < until)
+
+        async with self._session_factory() as session:
+            statement = (
+                select(IncidentModel)
+                .where(*filters)
+                .order_by(IncidentModel.started_at.desc(), IncidentModel.id.desc())
+            )
+            row_page = await fetch_page(session, statement, page, page_size)
+
+            return replace(row_page, content=[self._to_domain(row[0]) for row in row_page])
+
+    async def replace_for_component(self, component_id: int, incidents: list[Incident]) -> None:
+        async def _replace(session: AsyncSession) -> None:
+            await session.execute(delete(IncidentModel).where(IncidentModel.component_id == component_id))
+
+            if incidents:
+                await session.execute(
+                    insert(IncidentModel),
+                    [
+                        {
+                            "component_id": component_id,
+                            "started_at": incident.started_at,
+                            "status": incident.status,
+                            "ended_at": incident.ended_at,
+                        }
+                        for incident in incidents
+                    ],
+                )
+
+        await self._writer.run(_replace)
+
+    def _to_domain(self, model: IncidentModel) -> Incident:
+        return Incident(
+            id=model.id,
+            component_id=model.component_id,
+            started_at=self._as_utc(model.started_at),
+            status=model.status,
+            ended_at=self._as_utc(model.ended_at) if model.ended_at is not None else None,
+        )
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value.astimezone(timezone.utc)
+
+
+@lru_cache
+def get_incident_repository() -> IncidentRepository:
+    session_factory = get_session_factory()
+
+    return PostgresIncidentRepository(session_factory, writer=get_session_writer())
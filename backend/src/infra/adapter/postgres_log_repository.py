@@ -1,26 +1,85 @@
+from collections.abc import AsyncIterator
 from datetime import date, datetime, time, timedelta, timezone
 from functools import lru_cache
+from math import ceil
+from typing import Optional
 
-from sqlalchemy import Float, Integer, Numeric, RowMapping, case, cast, func, select
+from sqlalchemy import (
+    Float,
+    Integer,
+    Numeric,
+    RowMapping,
+    ScalarSelect,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
 
+from core.domain.change import Change, ChangeKind
+from core.domain.cursor_page import CursorPage
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
 from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.healthcheck_rollup import HealthcheckRollup
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
+from core.port.change_tracker import ChangeTracker
+from core.port.log_archive import LogArchive
 from core.port.log_repository import LogRepository
-from infra.db.models import HealthcheckLogModel
-from infra.db.session import get_session_factory
+from core.port.response_cache import ResponseCache
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_response_cache import get_response_cache
+from infra.adapter.segment_log_archive import get_log_archive
+from infra.config.config import get_config
+from infra.db.dialect import dialect_name, upsert_insert
+from infra.db.models import ComponentModel, HealthcheckCounterModel, HealthcheckLogModel, HealthcheckRollupModel
+from infra.db.reader import SessionReader
+from infra.db.session import get_session_factory, get_session_reader, get_session_writer
+from infra.db.writer import SessionWriter
+from infra.utils.cache_tags import component_tag
+from infra.utils.cursor import decode_cursor, encode_cursor
+
+LOG_COLUMNS = (
+    "component_id",
+    "checked_at",
+    "is_successful",
+    "status_code",
+    "response_time_ms",
+    "status_before",
+    "status_after",
+    "error_message",
+)
+
+DELETE_BATCH_SIZE = 1000
+
+COUNTER_LOCK_NAMESPACE = 7_342_002
 
 
 class PostgresLogRepository(LogRepository):
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
+        archive: Optional[LogArchive] = None,
+        change_tracker: Optional[ChangeTracker] = None,
+        writer: Optional[SessionWriter] = None,
+        reader: Optional[SessionReader] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._session_factory = session_factory
+        self._archive = archive
+        self._change_tracker = change_tracker
+        self._response_cache = response_cache
+        self._writer = writer or SessionWriter(session_factory)
+        self._reader = reader or SessionReader(session_factory)
 
     async def add_log(self, log: HealthcheckLog) -> HealthcheckLog:
-        async with self._session_factory() as session:
+        async def _add(session: AsyncSession) -> HealthcheckLog:
             model = HealthcheckLogModel(
                 component_id=log.component_id,
                 checked_at=log.checked_at,
@@ -33,14 +92,40 @@ class PostgresLogRepository(LogRepository):
             )
 
             session.add(model)
+            await self._upsert_rollups(session, [log])
+            await self._advance_counters(session, [log])
 
-            await session.commit()
+            await session.flush()
             await session.refresh(model)
 
             return self._to_domain(model)
 
+        added = await self._writer.run(_add)
+        await self._record_change({log.component_id})
+
+        return added
+
+    async def add_logs(self, logs: list[HealthcheckLog]) -> int:
+        if not logs:
+            return 0
+
+        async def _add(session: AsyncSession) -> None:
+            await self._upsert_rollups(session, logs)
+
+            if dialect_name(session) == "postgresql":
+                await self._copy_logs(session, logs)
+            else:
+                await session.execute(insert(HealthcheckLogModel.__table__), [self._to_row(log) for log in logs])
+
+            await self._advance_counters(session, logs)
+
+        await self._writer.run(_add)
+        await self._record_change({log.component_id for log in logs})
+
+        return len(logs)
+
     async def get_logs(self, component_id: int, limit: int) -> list[HealthcheckLog]:
-        async with self._session_factory() as session:
+        async def _get_logs(session: AsyncSession) -> list[HealthcheckLog]:
             statement = (
                 select(HealthcheckLogModel)
                 .where(HealthcheckLogModel.component_id == component_id)
@@ -51,6 +136,216 @@ class PostgresLogRepository(LogRepository):
 
             return [self._to_domain(model) for model in models]
 
+        logs = await self._reader.run(_get_logs)
+
+        if self._archive is not None and len(logs) < limit:
+            until = min(self._as_utc(log.checked_at) for log in logs) if logs else None
+            logs.extend(await self._archive.read_latest_logs(component_id, limit - len(logs), until=until))
+
+        return logs
+
+    async def get_logs_page(
+        self,
+        component_id: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        is_successful: Optional[bool] = None,
+    ) -> CursorPage[HealthcheckLog]:
+        filters = [HealthcheckLogModel.component_id == component_id]
+        upper_bound = until
+
+        if since is not None:
+            filters.append(HealthcheckLogModel.checked_at >= since)
+
+        if until is not None:
+            filters.append(HealthcheckLogModel.checked_at < until)
+
+        if is_successful is not None:
+            filters.append(HealthcheckLogModel.is_successful.is_(is_successful))
+
+        if cursor is not None:
+            cursor_checked_at, cursor_id = decode_cursor(cursor)
+            upper_bound = cursor_checked_at
+            filters.append(HealthcheckLogModel.checked_at <= cursor_checked_at)
+            filters.append(
+                or_(
+                    HealthcheckLogModel.checked_at < cursor_checked_at,
+                    HealthcheckLogModel.id < cursor_id,
+                )
+            )
+
+        statement = (
+            select(HealthcheckLogModel)
+            .where(*filters)
+            .order_by(HealthcheckLogModel.checked_at.desc(), HealthcheckLogModel.id.desc())
+            .limit(page_size + 1)
+        )
+
+        async with self._session_factory() as session:
+            models = (await session.execute(statement)).scalars().all()
+            logs = [self._to_domain(model) for model in models]
+
+        if self._archive is not None and len(logs) <= page_size:
+            if logs:
+                upper_bound = logs[-1].checked_at
+
+            logs.extend(
+                await self._read_archived_page(
+                    archive=self._archive,
+                    component_id=component_id,
+                    limit=page_size + 1 - len(logs),
+                    since=since,
+                    until=upper_bound,
+                    is_successful=is_successful,
+                )
+            )
+
+        next_cursor: Optional[str] = None
+        if len(logs) > page_size:
+            last_log = logs[page_size - 1]
+            next_cursor = encode_cursor(last_log.checked_at, last_log.id or 0)
+
+        return CursorPage(page_size=page_size, content=logs[:page_size], next_cursor=next_cursor)
+
+    async def stream_logs(
+        self,
+        component_ids: Optional[list[int]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[HealthcheckLog]:
+        if component_ids is None:
+            component_ids = await self._logged_component_ids()
+
+        for component_id in dict.fromkeys(component_ids):
+            lower_bound = since
+
+            if self._archive is not None:
+                archived_until = await self._archive.archived_until(component_id)
+
+                async for batch in self._archive.iter_logs(component_id, since=since, until=until):
+                    for log in batch:
+                        yield log
+
+                if archived_until is not None:
+                    archived_bound = archived_until + timedelta(microseconds=1)
+                    lower_bound = archived_bound if since is None else max(archived_bound, self._as_utc(since))
+
+            filters = [HealthcheckLogModel.component_id == component_id]
+
+            if lower_bound is not None:
+                filters.append(HealthcheckLogModel.checked_at >= lower_bound)
+
+            if until is not None:
+                filters.append(HealthcheckLogModel.checked_at < until)
+
+            statement = (
+                select(HealthcheckLogModel)
+                .where(*filters)
+                .order_by(HealthcheckLogModel.checked_at.asc(), HealthcheckLogModel.id.asc())
+                .execution_options(yield_per=batch_size)
+            )
+
+            async with self._session_factory() as session:
+                models = await session.stream_scalars(statement)
+
+                async for model in models:
+                    yield self._to_domain(model)
+
+    async def get_check_counts(
+        self,
+        component_ids: list[int],
+        since: datetime,
+        until: datetime,
+    ) -> dict[int, tuple[int, int]]:
+        deduped_component_ids = list(dict.fromkeys(component_ids))
+
+        if not deduped_component_ids:
+            return {}
+
+        counters = HealthcheckCounterModel
+        checks_until = func.coalesce(self._cumulative_before(counters.cumulative_checks, until), 0)
+        checks_since = func.coalesce(self._cumulative_before(counters.cumulative_checks, since), 0)
+        successful_until = func.coalesce(self._cumulative_before(counters.cumulative_successful_checks, until), 0)
+        successful_since = func.coalesce(self._cumulative_before(counters.cumulative_successful_checks, since), 0)
+
+        statement = select(
+            ComponentModel.id,
+            (checks_until - checks_since).label("total_checks"),
+            (successful_until - successful_since).label("successful_checks"),
+        ).where(ComponentModel.id.in_(deduped_component_ids))
+
+        async with self._session_factory() as session:
+            rows = (await session.execute(statement)).all()
+
+            return {int(component_id): (int(total), int(successful)) for component_id, total, successful in rows}
+
+    async def get_rollups(
+        self,
+        component_id: int,
+        resolution: RollupResolution,
+        since: datetime,
+        until: datetime,
+    ) -> list[HealthcheckRollup]:
+        async with self._session_factory() as session:
+            statement = (
+                select(HealthcheckRollupModel)
+                .where(HealthcheckRollupModel.component_id == component_id)
+                .where(HealthcheckRollupModel.resolution == resolution)
+                .where(HealthcheckRollupModel.bucket_start >= resolution.bucket_start(since))
+                .where(HealthcheckRollupModel.bucket_start < until)
+                .order_by(HealthcheckRollupModel.bucket_start.asc())
+            )
+            models = (await session.execute(statement)).scalars().all()
+
+            return [self._to_rollup(model) for model in models]
+
+    async def get_logs_between(self, component_id: int, since: datetime, until: datetime) -> list[HealthcheckLog]:
+        async with self._session_factory() as session:
+            statement = (
+                select(HealthcheckLogModel)
+                .where(HealthcheckLogModel.component_id == component_id)
+                .where(HealthcheckLogModel.checked_at >= since)
+                .where(HealthcheckLogModel.checked_at < until)
+                .order_by(HealthcheckLogModel.checked_at.asc(), HealthcheckLogModel.id.asc())
+            )
+            models = (await session.execute(statement)).scalars().all()
+
+            return [self._to_domain(model) for model in models]
+
+    async def delete_logs(self, component_id: int, log_ids: list[int]) -> int:
+        if not log_ids:
+            return 0
+
+        async def _delete(session: AsyncSession) -> int:
+            deleted = 0
+
+            for offset in range(0, len(log_ids), DELETE_BATCH_SIZE):
+                statement = (
+                    delete(HealthcheckLogModel)
+                    .where(HealthcheckLogModel.component_id == component_id)
+                    .where(HealthcheckLogModel.id.in_(log_ids[offset : offset + DELETE_BATCH_SIZE]))
+                )
+                result = await session.execute(statement)
+                deleted += result.rowcount  # type: ignore
+
+            return deleted
+
+        return await self._writer.run(_delete)
+
+    async def find_archivable_components(self, until: datetime) -> dict[int, datetime]:
+        async with self._session_factory() as session:
+            statement = (
+                select(HealthcheckLogModel.component_id, func.min(HealthcheckLogModel.checked_at))
+                .where(HealthcheckLogModel.checked_at < until)
+                .group_by(HealthcheckLogModel.component_id)
+            )
+            rows = (await session.execute(statement)).all()
+
+            return {int(component_id): self._as_utc(oldest) for component_id, oldest in rows}
+
     async def get_last_n_day_summary(self, component_id: int, last_n_days: int) -> list[HealthcheckLogDaySummary]:
         bulk_result = await self.get_last_n_day_summary_bulk(
             component_ids=[component_id],
@@ -70,7 +365,7 @@ class PostgresLogRepository(LogRepository):
             return {}
 
         summary_date_expr = func.date(HealthcheckLogModel.checked_at).label("summary_date")
-        total_checks_expr = func.count(HealthcheckLogModel.id).label("total_checks")
+        total_checks_expr = func.count().label("total_checks")
         successful_checks_expr = func.sum(case((HealthcheckLogModel.is_successful.is_(True), 1), else_=0)).label(
             "successful_checks"
         )
@@ -101,27 +396,403 @@ class PostgresLogRepository(LogRepository):
             .order_by(HealthcheckLogModel.component_id.asc(), summary_date_expr.desc())
         )
 
+        async def _summarize(session: AsyncSession) -> list[RowMapping]:
+            return list((await session.execute(statement)).mappings().all())
+
+        summaries_by_component: dict[int, list[HealthcheckLogDaySummary]] = {}
+
+        for row in await self._reader.run(_summarize):
+            component_id = int(row["component_id"])
+            summaries_by_component.setdefault(component_id, []).append(self._to_day_summary(row))
+
+        if self._archive is not None:
+            await self._merge_archived_summaries(self._archive, deduped_component_ids, since, summaries_by_component)
+
+        return summaries_by_component
+
+    async def _record_change(self, component_ids: set[int]) -> None:
+        if self._change_tracker is not None:
+            await self._change_tracker.record_change(
+                *(Change(ChangeKind.DAY_SUMMARY, component_id) for component_id in component_ids)
+            )
+
+        if self._response_cache is not None:
+            await self._response_cache.invalidate(component_tag(component_id) for component_id in component_ids)
+
+    async def _logged_component_ids(self) -> list[int]:
         async with self._session_factory() as session:
-            rows = (await session.execute(statement)).mappings().all()
+            statement = select(HealthcheckLogModel.component_id).distinct()
+            component_ids = {int(component_id) for component_id in (await session.execute(statement)).scalars()}
+
+        if self._archive is not None:
+            component_ids.update(await self._archive.component_ids())
+
+        return sorted(component_ids)
+
+    async def _read_archived_page(
+        self,
+        archive: LogArchive,
+        component_id: int,
+        limit: int,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        is_successful: Optional[bool],
+    ) -> list[HealthcheckLog]:
+        since = self._as_utc(since) if since is not None else None
+        bound = self._as_utc(until) if until is not None else None
+        logs: list[HealthcheckLog] = []
+
+        while len(logs) < limit:
+            batch = await archive.read_latest_logs(component_id, limit, until=bound)
+
+            if not batch:
+                break
+
+            for log in batch:
+                if since is not None and log.checked_at < since:
+                    return logs
+
+                if is_successful is None or log.is_successful is is_successful:
+                    logs.append(log)
+
+                    if len(logs) == limit:
+                        break
+
+            bound = batch[-1].checked_at
+
+        return logs
+
+    async def _merge_archived_summaries(
+        self,
+        archive: LogArchive,
+        component_ids: list[int],
+        since: datetime,
+        summaries_by_component: dict[int, list[HealthcheckLogDaySummary]],
+    ) -> None:
+        for component_id in component_ids:
+            archived_until = await archive.archived_until(component_id)
+
+            if archived_until is None or archived_until < since:
+                continue
+
+            archived_logs = await archive.read_logs(component_id, since=since)
+            if not archived_logs:
+                continue
+
+            summaries_by_date = {
+                summary.date.date(): summary for summary in summaries_by_component.get(component_id, [])
+            }
+
+            for summary in self._summarize_logs(component_id, archived_logs):
+                existing = summaries_by_date.get(summary.date.date())
+                summaries_by_date[summary.date.date()] = (
+                    summary if existing is None else self._combine_day_summaries(existing, summary)
+                )
+
+            summaries_by_component[component_id] = sorted(
+                summaries_by_date.values(),
+                key=lambda item: item.date.date(),
+                reverse=True,
+            )
+
+    def _summarize_logs(self, component_id: int, logs: list[HealthcheckLog]) -> list[HealthcheckLogDaySummary]:
+        logs_by_date: dict[date, list[HealthcheckLog]] = {}
+
+        for log in logs:
+            logs_by_date.setdefault(self._as_utc(log.checked_at).date(), []).append(log)
+
+        summaries: list[HealthcheckLogDaySummary] = []
+
+        for summary_date, day_logs in logs_by_date.items():
+            total_checks = len(day_logs)
+            successful_checks = sum(1 for log in day_logs if log.is_successful)
+
+            summaries.append(
+                HealthcheckLogDaySummary(
+                    component_id=component_id,
+                    date=datetime.combine(summary_date, time.min, tzinfo=timezone.utc),
+                    total_checks=total_checks,
+                    successful_checks=successful_checks,
+                    uptime=round((successful_checks / total_checks) * 100, 2),
+                    avg_response_time=ceil(sum(log.response_time_ms for log in day_logs) / total_checks),
+                    max_response_time=max(log.response_time_ms for log in day_logs),
+                    overall_status=max((log.status_after for log in day_logs), key=lambda item: item.severity),
+                )
+            )
+
+        return summaries
+
+    def _combine_day_summaries(
+        self,
+        first: HealthcheckLogDaySummary,
+        second: HealthcheckLogDaySummary,
+    ) -> HealthcheckLogDaySummary:
+        total_checks = first.total_checks + second.total_checks
+        successful_checks = first.successful_checks + second.successful_checks
+        weighted_response_time = (
+            first.avg_response_time * first.total_checks + second.avg_response_time * second.total_checks
+        )
+
+        return HealthcheckLogDaySummary(
+            component_id=first.component_id,
+            date=first.date,
+            total_checks=total_checks,
+            successful_checks=successful_checks,
+            uptime=round((successful_checks / total_checks) * 100, 2),
+            avg_response_time=ceil(weighted_response_time / total_checks),
+            max_response_time=max(first.max_response_time, second.max_response_time),
+            overall_status=max((first.overall_status, second.overall_status), key=lambda item: item.severity),
+        )
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
 
-            summaries_by_component: dict[int, list[HealthcheckLogDaySummary]] = {}
+        return value.astimezone(timezone.utc)
 
-            for row in rows:
-                component_id = int(row["component_id"])
-                summaries_by_component.setdefault(component_id, []).append(self._to_day_summary(row))
+    async def _copy_logs(self, session: AsyncSession, logs: list[HealthcheckLog]) -> None:
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
 
-            return summaries_by_component
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            HealthcheckLogModel.__tablename__,
+            records=[tuple(self._to_row(log).values()) for log in logs],
+            columns=LOG_COLUMNS,
+        )
+
+    def _to_row(self, log: HealthcheckLog) -> dict:
+        return {
+            "component_id": log.component_id,
+            "checked_at": self._as_utc(log.checked_at),
+            "is_successful": log.is_successful,
+            "status_code": log.status_code,
+            "response_time_ms": log.response_time_ms,
+            "status_before": log.status_before.value,
+            "status_after": log.status_after.value,
+            "error_message": log.error_message,
+        }
+
+    async def _upsert_rollups(self, session: AsyncSession, logs: list[HealthcheckLog]) -> None:
+        buckets: dict[tuple[int, RollupResolution, datetime], dict[str, int]] = {}
+
+        for log in logs:
+            for resolution in RollupResolution:
+                key = (log.component_id, resolution, resolution.bucket_start(log.checked_at))
+                bucket = buckets.setdefault(
+                    key,
+                    {
+                        "total_checks": 0,
+                        "successful_checks": 0,
+                        "total_response_time_ms": 0,
+                        "max_response_time_ms": 0,
+                        "max_status_severity": 0,
+                    },
+                )
+                bucket["total_checks"] += 1
+                bucket["successful_checks"] += 1 if log.is_successful else 0
+                bucket["total_response_time_ms"] += log.response_time_ms
+                bucket["max_response_time_ms"] = max(bucket["max_response_time_ms"], log.response_time_ms)
+                bucket["max_status_severity"] = max(bucket["max_status_severity"], log.status_after.severity)
+
+        if not buckets:
+            return
+
+        rows = [
+            {"component_id": component_id, "resolution": resolution, "bucket_start": bucket_start, **values}
+            for (component_id, resolution, bucket_start), values in buckets.items()
+        ]
+
+        table = HealthcheckRollupModel.__table__
+        statement = upsert_insert(session, table)
+        excluded = statement.excluded
+
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.component_id, table.c.resolution, table.c.bucket_start],
+                set_={
+                    "total_checks": table.c.total_checks + excluded.total_checks,
+                    "successful_checks": table.c.successful_checks + excluded.successful_checks,
+                    "total_response_time_ms": table.c.total_response_time_ms + excluded.total_response_time_ms,
+                    "max_response_time_ms": case(
+                        (excluded.max_response_time_ms > table.c.max_response_time_ms, excluded.max_response_time_ms),
+                        else_=table.c.max_response_time_ms,
+                    ),
+                    "max_status_severity": case(
+                        (excluded.max_status_severity > table.c.max_status_severity, excluded.max_status_severity),
+                        else_=table.c.max_status_severity,
+                    ),
+                },
+            ),
+            rows,
+        )
+
+    async def _advance_counters(self, session: AsyncSession, logs: list[HealthcheckLog]) -> None:
+        deltas: dict[int, dict[datetime, list[int]]] = {}
+
+        for log in logs:
+            bucket_start = RollupResolution.MINUTE.bucket_start(log.checked_at)
+            delta = deltas.setdefault(log.component_id, {}).setdefault(bucket_start, [0, 0])
+            delta[0] += 1
+            delta[1] += 1 if log.is_successful else 0
+
+        table = HealthcheckCounterModel.__table__
+
+        for component_id, buckets in sorted(deltas.items()):
+            await self._lock_counters(session, component_id)
+            ordered = sorted(buckets.items())
+            latest_statement = (
+                select(table.c.bucket_start, table.c.cumulative_checks, table.c.cumulative_successful_checks)
+                .where(table.c.component_id == component_id)
+                .order_by(table.c.bucket_start.desc())
+                .limit(1)
+            )
+            latest = (await session.execute(latest_statement)).first()
+
+            if latest is not None and self._as_utc(latest.bucket_start) > ordered[0][0]:
+                await self._shift_counters(session, component_id, ordered)
+                continue
+
+            cumulative_checks, cumulative_successful = (latest[1], latest[2]) if latest is not None else (0, 0)
+            rows = []
+
+            for bucket_start, (checks, successful) in ordered:
+                cumulative_checks += checks
+                cumulative_successful += successful
+                rows.append(
+                    {
+                        "component_id": component_id,
+                        "bucket_start": bucket_start,
+                        "cumulative_checks": cumulative_checks,
+                        "cumulative_successful_checks": cumulative_successful,
+                    }
+                )
+
+            statement = upsert_insert(session, table)
+            await session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.component_id, table.c.bucket_start],
+                    set_={
+                        "cumulative_checks": statement.excluded.cumulative_checks,
+                        "cumulative_successful_checks": statement.excluded.cumulative_successful_checks,
+                    },
+                ),
+                rows,
+            )
+
+    async def _lock_counters(self, session: AsyncSession, component_id: int) -> None:
+        if dialect_name(session) == "postgresql":
+            await session.execute(select(func.pg_advisory_xact_lock(COUNTER_LOCK_NAMESPACE, component_id)))
+
+    async def _shift_counters(
+        self,
+        session: AsyncSession,
+        component_id: int,
+        ordered: list[tuple[datetime, list[int]]],
+    ) -> None:
+        table = HealthcheckCounterModel.__table__
+        first_bucket, last_bucket = ordered[0][0], ordered[-1][0]
+
+        previous_statement = (
+            select(table.c.cumulative_checks, table.c.cumulative_successful_checks)
+            .where(table.c.component_id == component_id)
+            .where(table.c.bucket_start < first_bucket)
+            .order_by(table.c.bucket_start.desc())
+            .limit(1)
+        )
+        previous = (await session.execute(previous_statement)).first()
+        previous_checks, previous_successful = previous if previous is not None else (0, 0)
+
+        span_statement = (
+            select(table.c.bucket_start, table.c.cumulative_checks, table.c.cumulative_successful_checks)
+            .where(table.c.component_id == component_id)
+            .where(table.c.bucket_start >= first_bucket)
+            .where(table.c.bucket_start <= last_bucket)
+        )
+        existing = {
+            self._as_utc(row.bucket_start): (row.cumulative_checks, row.cumulative_successful_checks)
+            for row in await session.execute(span_statement)
+        }
+
+        deltas = dict(ordered)
+        shift_checks = shift_successful = 0
+        rows = []
+
+        for bucket_start in sorted(existing.keys() | deltas.keys()):
+            checks, successful = deltas.get(bucket_start, (0, 0))
+            shift_checks += checks
+            shift_successful += successful
+
+            if bucket_start in existing:
+                previous_checks, previous_successful = existing[bucket_start]
+
+            rows.append(
+                {
+                    "component_id": component_id,
+                    "bucket_start": bucket_start,
+                    "cumulative_checks": previous_checks + shift_checks,
+                    "cumulative_successful_checks": previous_successful + shift_successful,
+                }
+            )
+
+        statement = upsert_insert(session, table)
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.component_id, table.c.bucket_start],
+                set_={
+                    "cumulative_checks": statement.excluded.cumulative_checks,
+                    "cumulative_successful_checks": statement.excluded.cumulative_successful_checks,
+                },
+            ),
+            rows,
+        )
+
+        await session.execute(
+            update(table)
+            .where(table.c.component_id == component_id)
+            .where(table.c.bucket_start > last_bucket)
+            .values(
+                cumulative_checks=table.c.cumulative_checks + shift_checks,
+                cumulative_successful_checks=table.c.cumulative_successful_checks + shift_successful,
+            )
+        )
+
+    def _cumulative_before(self, column: InstrumentedAttribute[int], boundary: datetime) -> ScalarSelect[int]:
+        return (
+            select(column)
+            .where(HealthcheckCounterModel.component_id == ComponentModel.id)
+            .where(HealthcheckCounterModel.bucket_start < boundary)
+            .order_by(HealthcheckCounterModel.bucket_start.desc())
+            .limit(1)
+            .correlate(ComponentModel)
+            .scalar_subquery()
+        )
+
+    def _to_rollup(self, model: HealthcheckRollupModel) -> HealthcheckRollup:
+        statuses_by_severity = {status.severity: status for status in StatusType}
+
+        return HealthcheckRollup(
+            component_id=model.component_id,
+            resolution=model.resolution,
+            bucket_start=self._as_utc(model.bucket_start),
+            total_checks=model.total_checks,
+            successful_checks=model.successful_checks,
+            uptime=round((model.successful_checks / model.total_checks) * 100, 2) if model.total_checks else 0.0,
+            avg_response_time=ceil(model.total_response_time_ms / model.total_checks) if model.total_checks else 0,
+            max_response_time=model.max_response_time_ms,
+            overall_status=statuses_by_severity[model.max_status_severity],
+        )
 
     def _to_domain(self, model: HealthcheckLogModel) -> HealthcheckLog:
         return HealthcheckLog(
             component_id=model.component_id,
-            checked_at=model.checked_at,
+            checked_at=self._as_utc(model.checked_at),
             is_successful=model.is_successful,
             status_code=model.status_code,
             response_time_ms=model.response_time_ms,
             status_before=model.status_before,
             status_after=model.status_after,
             error_message=model.error_message,
+            id=model.id,
         )
 
     def _to_day_summary(self, row: RowMapping) -> HealthcheckLogDaySummary:
@@ -151,5 +822,13 @@ class PostgresLogRepository(LogRepository):
 @lru_cache
 def get_log_repository() -> LogRepository:
     session_factory = get_session_factory()
+    archive = get_log_archive() if get_config().ARCHIVE_CONFIG.ENABLED else None
 
-    return PostgresLogRepository(session_factory=session_factory)
+    return PostgresLogRepository(
+        session_factory=session_factory,
+        archive=archive,
+        change_tracker=get_change_tracker(),
+        writer=get_session_writer(),
+        reader=get_session_reader(),
+        response_cache=get_response_cache(),
+    )
@@ -1,51 +1,77 @@
+from dataclasses import replace
 from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
+from core.domain.change import Change, ChangeKind
 from core.domain.component import Component
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.page import Page
 from core.domain.product import Product
+from core.port.change_tracker import ChangeTracker
+from core.port.count_cache import CountCache
 from core.port.product_repository import ProductRepository
+from core.port.response_cache import ResponseCache
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_count_cache import get_count_cache
+from infra.adapter.memory_response_cache import get_response_cache
+from infra.adapter.postgres_component_repository import COMPONENT_COUNT_NAMESPACE
+from infra.db.dialect import upsert_insert
 from infra.db.models import ComponentModel, ProductModel
-from infra.db.session import get_session_factory
+from infra.db.pagination import fetch_page
+from infra.db.projections import PRODUCT_COLUMNS, components_by_product, product_from_row
+from infra.db.reader import SessionReader, primary_reads
+from infra.db.search import name_matches
+from infra.db.session import get_session_factory, get_session_reader, get_session_writer
+from infra.db.writer import SessionWriter
+from infra.utils.cache_tags import PRODUCT_LIST_TAG, product_tag
+
+PRODUCT_COUNT_NAMESPACE = "products"
 
 
 class PostgresProductRepository(ProductRepository):
     def __init__(
         self,
         session_factory: async_sessionmaker[AsyncSession],
+        change_tracker: Optional[ChangeTracker] = None,
+        count_cache: Optional[CountCache] = None,
+        writer: Optional[SessionWriter] = None,
+        reader: Optional[SessionReader] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._session_factory = session_factory
+        self._change_tracker = change_tracker
+        self._count_cache = count_cache
+        self._response_cache = response_cache
+        self._writer = writer or SessionWriter(session_factory)
+        self._reader = reader or SessionReader(session_factory)
 
     async def save(self, product: Product) -> Product:
-        async with self._session_factory() as session:
-            model: Optional[ProductModel] = None
+        values = {
+            "name": product.name,
+            "description": product.description,
+            "is_visible": product.is_visible,
+        }
 
+        async def _save(session: AsyncSession) -> Product:
             if product.id is not None and product.id > 0:
-                model = await session.get(ProductModel, product.id)
-
-            if model is None:
-                model = ProductModel(
-                    name=product.name,
-                    description=product.description,
-                    is_visible=product.is_visible,
+                statement = upsert_insert(session, ProductModel).values(id=product.id, **values)
+                statement = statement.on_conflict_do_update(
+                    index_elements=[ProductModel.id],
+                    set_={**values, "updated_at": func.now()},
                 )
-
-                if product.id is not None and product.id > 0:
-                    model.id = product.id
-
-                session.add(model)
             else:
-                model.name = product.name
-                model.description = product.description
-                model.is_visible = product.is_visible
+                statement = insert(ProductModel).values(**values)
 
-            await session.commit()
-            await session.refresh(model)
+            model = (
+                await session.scalars(
+                    statement.returning(ProductModel),
+                    execution_options={"populate_existing": True},
+                )
+            ).one()
 
             return Product(
                 id=model.id,
@@ -57,6 +83,11 @@ class PostgresProductRepository(ProductRepository):
                 components=product.components,
             )
 
+        saved = await self._writer.run(_save)
+        await self._record_change(saved.id)
+
+        return saved
+
     async def find_by_id(self, product_id: int) -> Optional[Product]:
         async with self._session_factory() as session:
             statement = (
@@ -81,45 +112,94 @@ class PostgresProductRepository(ProductRepository):
 
             return self._to_domain(model)
 
-    async def find_all(self, is_visible: bool, page: int, page_size: int) -> Page[Product]:
-        async with self._session_factory() as session:
-            total_elements_statement = select(func.count(ProductModel.id)).where(
-                ProductModel.is_visible.is_(is_visible)
-            )
-            total_elements = (await session.execute(total_elements_statement)).scalar_one()
-
-            offset = (page - 1) * page_size
+    async def find_all(
+        self,
+        is_visible: bool,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: Optional[str] = None,
+        include_components: bool = True,
+    ) -> Page[Product]:
+        known_total, generation = await self._cached_total(is_visible, include_total and search is None)
+
+        async def _find_all(session: AsyncSession) -> Page[Product]:
             statement = (
-                select(ProductModel)
-                .options(selectinload(ProductModel.components))
+                select(*PRODUCT_COLUMNS)
                 .where(ProductModel.is_visible.is_(is_visible))
                 .order_by(ProductModel.id.asc())
-                .offset(offset)
-                .limit(page_size)
             )
-            models = (await session.execute(statement)).scalars().all()
-            content = [self._to_domain(model) for model in models]
 
-            total_pages = (total_elements + page_size - 1) // page_size if total_elements > 0 else 0
+            if search is not None:
+                statement = statement.where(
+                    or_(
+                        name_matches(session, ProductModel, search),
+                        ProductModel.id.in_(
+                            select(ComponentModel.product_id).where(name_matches(session, ComponentModel, search))
+                        ),
+                    )
+                )
 
-            return Page(
-                page_size=page_size,
-                page_count=len(content),
-                total_elements=total_elements,
-                total_pages=total_pages,
-                content=content,
+            row_page = await fetch_page(session, statement, page, page_size, include_total, known_total)
+            product_ids = [row.id for row in row_page] if include_components else []
+            components = await components_by_product(session, product_ids)
+
+            return replace(
+                row_page,
+                content=[product_from_row(row, components.get(row.id, [])) for row in row_page],
             )
 
-    async def delete(self, product_id: int) -> bool:
+        fills_count = include_total and search is None and known_total is None and self._count_cache is not None
+
+        with primary_reads(fills_count):
+            product_page = await self._reader.run(_find_all)
+
+        if fills_count:
+            await self._count_cache.set(PRODUCT_COUNT_NAMESPACE, is_visible, product_page.total_elements, generation)
+
+        return product_page
+
+    async def find_all_without_pagination(self, is_visible: bool) -> list[Product]:
         async with self._session_factory() as session:
-            statement = delete(ProductModel).where(ProductModel.id == product_id)
+            statement = (
+                select(*PRODUCT_COLUMNS)
+                .where(ProductModel.is_visible.is_(is_visible))
+                .order_by(ProductModel.id.asc())
+            )
+            rows = (await session.execute(statement)).all()
+            components = await components_by_product(session, [row.id for row in rows])
+
+            return [product_from_row(row, components[row.id]) for row in rows]
+
+    async def delete(self, product_id: int) -> bool:
+        async def _delete(session: AsyncSession) -> bool:
+            statement = delete(ProductModel).where(ProductModel.id == product_id).returning(ProductModel.id)
+
+            return (await session.execute(statement)).scalar_one_or_none() is not None
+
+        deleted = await self._writer.run(_delete)
+        await self._record_change(product_id)
+
+        return deleted
+
+    async def _record_change(self, product_id: Optional[int]) -> None:
+        if self._change_tracker is not None:
+            await self._change_tracker.record_change(Change(ChangeKind.PRODUCT, product_id))
+
+        if self._count_cache is not None:
+            await self._count_cache.invalidate(PRODUCT_COUNT_NAMESPACE)
+            await self._count_cache.invalidate(COMPONENT_COUNT_NAMESPACE)
+
+        if self._response_cache is not None:
+            await self._response_cache.invalidate([PRODUCT_LIST_TAG, product_tag(product_id)])
 
-            await session.execute(statement)
-            await session.commit()
+    async def _cached_total(self, is_visible: bool, include_total: bool) -> tuple[Optional[int], int]:
+        if not include_total or self._count_cache is None:
+            return None, 0
 
-            result = await session.execute(select(ProductModel).where(ProductModel.id == product_id))
+        generation = await self._count_cache.generation(PRODUCT_COUNT_NAMESPACE)
 
-            return result.scalar_one_or_none() is None
+        return await self._count_cache.get(PRODUCT_COUNT_NAMESPACE, is_visible), generation
 
     def _to_domain(self, model: ProductModel) -> Product:
         return Product(
@@ -160,4 +240,11 @@ class PostgresProductRepository(ProductRepository):
 def get_product_repository() -> ProductRepository:
     session_factory = get_session_factory()
 
-    return PostgresProductRepository(session_factory)
+    return PostgresProductRepository(
+        session_factory,
+        change_tracker=get_change_tracker(),
+        count_cache=get_count_cache(),
+        writer=get_session_writer(),
+        reader=get_session_reader(),
+        response_cache=get_response_cache(),
+    )
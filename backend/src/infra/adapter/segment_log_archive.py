@@ -0,0 +1,228 @@
+import asyncio
+import mmap
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.port.log_archive import LogArchive
+from infra.config.config import get_config
+from infra.utils.columnar_codec import decode_segment, decode_segment_header, encode_segment, to_epoch_us
+
+SEGMENT_SUFFIX = ".seg"
+
+
+@dataclass(frozen=True)
+class SegmentInfo:
+    path: Path
+    first_checked_at: datetime
+    last_checked_at: datetime
+    row_count: int
+
+
+class SegmentLogArchive(LogArchive):
+    def __init__(self, root_path: str | Path) -> None:
+        self._root_path = Path(root_path)
+        self._segments: Optional[dict[int, list[SegmentInfo]]] = None
+        self._lock = asyncio.Lock()
+
+    async def write_segment(self, component_id: int, logs: list[HealthcheckLog]) -> None:
+        if not logs:
+            return
+
+        async with self._lock:
+            segments = await self._load_index()
+            info = await asyncio.to_thread(self._write_segment_file, component_id, logs)
+
+            component_segments = segments.setdefault(component_id, [])
+            component_segments.append(info)
+            component_segments.sort(key=lambda item: item.first_checked_at)
+
+    async def read_logs(
+        self,
+        component_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[HealthcheckLog]:
+        segments = await self._segments_between(component_id, since, until)
+
+        if not segments:
+            return []
+
+        logs = await asyncio.to_thread(self._read_segment_files, segments, since, until)
+
+        return sorted(logs, key=lambda log: log.checked_at)
+
+    async def iter_logs(
+        self,
+        component_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[list[HealthcheckLog]]:
+        for group in self._overlapping_groups(await self._segments_between(component_id, since, until)):
+            logs = await asyncio.to_thread(self._read_segment_files, group, since, until)
+
+            if logs:
+                yield sorted(logs, key=lambda log: log.checked_at) if len(group) > 1 else logs
+
+    async def read_latest_logs(
+        self,
+        component_id: int,
+        limit: int,
+        until: Optional[datetime] = None,
+    ) -> list[HealthcheckLog]:
+        if limit < 1:
+            return []
+
+        segments = [
+            segment
+            for segment in await self._component_segments(component_id)
+            if until is None or segment.first_checked_at < until
+        ]
+
+        if not segments:
+            return []
+
+        return await asyncio.to_thread(self._read_latest_segment_files, segments, limit, until)
+
+    async def archived_until(self, component_id: int) -> Optional[datetime]:
+        segments = await self._component_segments(component_id)
+
+        if not segments:
+            return None
+
+        return max(segment.last_checked_at for segment in segments)
+
+    async def component_ids(self) -> list[int]:
+        segments = await self._load_index()
+
+        return sorted(component_id for component_id, component_segments in segments.items() if component_segments)
+
+    async def _segments_between(
+        self,
+        component_id: int,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> list[SegmentInfo]:
+        return [
+            segment
+            for segment in await self._component_segments(component_id)
+            if (since is None or segment.last_checked_at >= since)
+            and (until is None or segment.first_checked_at < until)
+        ]
+
+    def _overlapping_groups(self, segments: list[SegmentInfo]) -> list[list[SegmentInfo]]:
+        groups: list[list[SegmentInfo]] = []
+        group_end: Optional[datetime] = None
+
+        for segment in segments:
+            if groups and group_end is not None and segment.first_checked_at <= group_end:
+                groups[-1].append(segment)
+                group_end = max(group_end, segment.last_checked_at)
+            else:
+                groups.append([segment])
+                group_end = segment.last_checked_at
+
+        return groups
+
+    async def _component_segments(self, component_id: int) -> list[SegmentInfo]:
+        segments = await self._load_index()
+
+        return list(segments.get(component_id, []))
+
+    async def _load_index(self) -> dict[int, list[SegmentInfo]]:
+        if self._segments is None:
+            self._segments = await asyncio.to_thread(self._scan_segments)
+
+        return self._segments
+
+    def _scan_segments(self) -> dict[int, list[SegmentInfo]]:
+        segments: dict[int, list[SegmentInfo]] = {}
+
+        if not self._root_path.is_dir():
+            return segments
+
+        for path in sorted(self._root_path.glob(f"*/*{SEGMENT_SUFFIX}")):
+            with path.open("rb") as file:
+                header = decode_segment_header(file.read(64))
+
+            segments.setdefault(header.component_id, []).append(
+                SegmentInfo(
+                    path=path,
+                    first_checked_at=header.first_checked_at,
+                    last_checked_at=header.last_checked_at,
+                    row_count=header.row_count,
+                )
+            )
+
+        for component_segments in segments.values():
+            component_segments.sort(key=lambda item: item.first_checked_at)
+
+        return segments
+
+    def _write_segment_file(self, component_id: int, logs: list[HealthcheckLog]) -> SegmentInfo:
+        payload = encode_segment(component_id, logs)
+        header = decode_segment_header(payload)
+
+        component_path = self._root_path / str(component_id)
+        component_path.mkdir(parents=True, exist_ok=True)
+
+        file_name = f"{to_epoch_us(header.first_checked_at)}-{to_epoch_us(header.last_checked_at)}{SEGMENT_SUFFIX}"
+        final_path = component_path / file_name
+        temp_path = final_path.with_suffix(".tmp")
+
+        with temp_path.open("wb") as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, final_path)
+
+        return SegmentInfo(
+            path=final_path,
+            first_checked_at=header.first_checked_at,
+            last_checked_at=header.last_checked_at,
+            row_count=header.row_count,
+        )
+
+    def _read_latest_segment_files(
+        self,
+        segments: list[SegmentInfo],
+        limit: int,
+        until: Optional[datetime],
+    ) -> list[HealthcheckLog]:
+        newest_first = sorted(segments, key=lambda item: item.last_checked_at, reverse=True)
+        logs: list[HealthcheckLog] = []
+
+        for segment in newest_first:
+            if len(logs) >= limit and segment.last_checked_at < logs[limit - 1].checked_at:
+                break
+
+            logs.extend(self._read_segment_files([segment], None, until))
+            logs.sort(key=lambda log: log.checked_at, reverse=True)
+
+        return logs[:limit]
+
+    def _read_segment_files(
+        self,
+        segments: list[SegmentInfo],
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> list[HealthcheckLog]:
+        logs: list[HealthcheckLog] = []
+
+        for segment in segments:
+            with segment.path.open("rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    logs.extend(decode_segment(mapped, since=since, until=until))
+
+        return logs
+
+
+@lru_cache
+def get_log_archive() -> LogArchive:
+    return SegmentLogArchive(get_config().ARCHIVE_CONFIG.PATH)
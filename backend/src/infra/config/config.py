@@ -11,11 +11,20 @@ class LoggingConfig(BaseModel):
     LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     JSON_FORMAT: bool = False
     LIBRARY_LOG_LEVELS: dict[str, str | int] = Field(default_factory=dict)
+    REQUEST_LOG_MODE: Literal["full", "summary", "sampled"] = "full"
+    REQUEST_LOG_SAMPLE_RATE: float = Field(default=0.1, ge=0, le=1)
+    REQUEST_LOG_SLOW_MS: float = Field(default=1000.0, ge=0)
 
 
 class DatabaseConfig(BaseModel):
     DRIVER: Literal["postgres", "sqlite"] = "postgres"
     SQLITE_PATH: str = "./status_page.db"
+    SQLITE_PROFILE: Literal["default", "production"] = "default"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL"] = "NORMAL"
+    SQLITE_CACHE_SIZE_KIB: int = Field(default=65_536, ge=0)
+    SQLITE_MMAP_SIZE_BYTES: int = Field(default=268_435_456, ge=0)
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(default=5_000, ge=0)
+    SQLITE_WRITE_BATCH_SIZE: int = Field(default=100, ge=1)
 
     USER: str | None = None
     PASSWORD: str | None = None
@@ -27,6 +36,13 @@ class DatabaseConfig(BaseModel):
     MAX_OVERFLOW: int = 20
     POOL_TIMEOUT: int = 30
     POOL_RECYCLE: int = 1800
+    POOL_STATS_LOG_INTERVAL_SECONDS: int = Field(default=60, ge=0)
+
+    READ_REPLICA_HOST: str | None = None
+    READ_REPLICA_PORT: int | None = None
+    READ_REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0, gt=0)
+    READ_REPLICA_LAG_CHECK_SECONDS: float = Field(default=5.0, gt=0)
+    READ_REPLICA_RETRY_SECONDS: float = Field(default=30.0, gt=0)
 
     @model_validator(mode="after")
     def validate_required_postgres_fields(self) -> "DatabaseConfig":
@@ -50,6 +66,36 @@ class DatabaseConfig(BaseModel):
         return self
 
 
+class ArchiveConfig(BaseModel):
+    ENABLED: bool = False
+    PATH: str = "./archive"
+    RETENTION_DAYS: int = Field(default=30, ge=1)
+    INTERVAL_SECONDS: int = Field(default=3600, ge=1)
+
+
+class ResponseCacheConfig(BaseModel):
+    MAX_BYTES: int = Field(default=33_554_432, ge=0)
+
+
+class CompressionConfig(BaseModel):
+    ENABLED: bool = True
+    MINIMUM_SIZE: int = Field(default=1024, ge=0)
+    OFFLOAD_SIZE: int = Field(default=65_536, ge=0)
+
+
+class StreamConfig(BaseModel):
+    HEARTBEAT_SECONDS: float = Field(default=15.0, gt=0)
+    EVENT_LOG_SIZE: int = Field(default=1000, ge=1)
+
+
+class ChangeLogConfig(BaseModel):
+    MAX_CHANGES: int = Field(default=10_000, ge=1)
+
+
+class DashboardConfig(BaseModel):
+    REFRESH_SECONDS: float = Field(default=5.0, ge=0)
+
+
 class Config(BaseSettings):
     APP_NAME: str = "py-status-page"
     VERSION: str = get_version()
@@ -61,8 +107,15 @@ class Config(BaseSettings):
 
     LOGGING_CONFIG: LoggingConfig = LoggingConfig()
     DATABASE_CONFIG: DatabaseConfig
+    ARCHIVE_CONFIG: ArchiveConfig = ArchiveConfig()
+    RESPONSE_CACHE_CONFIG: ResponseCacheConfig = ResponseCacheConfig()
+    COMPRESSION_CONFIG: CompressionConfig = CompressionConfig()
+    STREAM_CONFIG: StreamConfig = StreamConfig()
+    CHANGE_LOG_CONFIG: ChangeLogConfig = ChangeLogConfig()
+    DASHBOARD_CONFIG: DashboardConfig = DashboardConfig()
 
     SYNC_INTERVAL_SECONDS: int = 60
+    FAST_SERIALIZATION: bool = False
 
     model_config = SettingsConfigDict(
         frozen=True,
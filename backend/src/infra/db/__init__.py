@@ -1,4 +1,12 @@
-from infra.db.models import Base, ComponentModel, ProductModel
+from infra.db.models import (
+    Base,
+    ComponentModel,
+    HealthcheckCounterModel,
+    HealthcheckLogModel,
+    HealthcheckRollupModel,
+    IncidentModel,
+    ProductModel,
+)
 from infra.db.session import (
     close_engine,
     create_database_schema,
@@ -11,6 +19,10 @@ from infra.db.session import (
 __all__ = [
     "Base",
     "ComponentModel",
+    "HealthcheckCounterModel",
+    "HealthcheckLogModel",
+    "HealthcheckRollupModel",
+    "IncidentModel",
     "ProductModel",
     "close_engine",
     "create_database_schema",
@@ -0,0 +1,20 @@
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(session: AsyncSession) -> str:
+    return session.get_bind().dialect.name
+
+
+def upsert_insert(session: AsyncSession, table: Any) -> Any:
+    name = dialect_name(session)
+
+    if name == "postgresql":
+        return postgresql.insert(table)
+
+    if name == "sqlite":
+        return sqlite.insert(table)
+
+    raise NotImplementedError(f"Upserts are not supported for dialect '{name}'")
@@ -0,0 +1,8 @@
+from infra.db.migrations.runner import MIGRATIONS, Migration, apply_migrations, run_migrations
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "apply_migrations",
+    "run_migrations",
+]
@@ -0,0 +1,90 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import Column, Connection, DateTime, Integer, MetaData, String, Table, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infra.db.migrations import v0001_health_check_indexes, v0002_name_search, v0003_timestamptz_columns
+
+MIGRATION_LOCK_ID = 7_342_001
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+    concurrent: bool = False
+
+
+MIGRATIONS = (
+    Migration(
+        version=1,
+        name="health_check_indexes",
+        upgrade=v0001_health_check_indexes.upgrade,
+        concurrent=True,
+    ),
+    Migration(version=2, name="name_search", upgrade=v0002_name_search.upgrade),
+    Migration(version=3, name="timestamptz_columns", upgrade=v0003_timestamptz_columns.upgrade),
+)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+def apply_migrations(connection: Connection) -> list[int]:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SELECT pg_advisory_xact_lock({MIGRATION_LOCK_ID})")
+
+    pending = _pending_migrations(connection)
+
+    for migration in pending:
+        _apply_migration(connection, migration)
+
+    return [migration.version for migration in pending]
+
+
+def _pending_migrations(connection: Connection) -> list[Migration]:
+    schema_migrations.create(connection, checkfirst=True)
+    applied_versions = set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+    return [
+        migration
+        for migration in sorted(MIGRATIONS, key=lambda item: item.version)
+        if migration.version not in applied_versions
+    ]
+
+
+def _apply_migration(connection: Connection, migration: Migration) -> None:
+    migration.upgrade(connection)
+    connection.execute(insert(schema_migrations).values(version=migration.version, name=migration.name))
+
+
+async def run_migrations(engine: AsyncEngine) -> list[int]:
+    if engine.dialect.name != "postgresql":
+        async with engine.begin() as connection:
+            return await connection.run_sync(apply_migrations)
+
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.exec_driver_sql(f"SELECT pg_advisory_lock({MIGRATION_LOCK_ID})")
+
+        try:
+            pending = await connection.run_sync(_pending_migrations)
+
+            for migration in pending:
+                if migration.concurrent:
+                    await connection.run_sync(_apply_migration, migration)
+                    continue
+
+                async with engine.begin() as transaction:
+                    await transaction.run_sync(_apply_migration, migration)
+
+            return [migration.version for migration in pending]
+        finally:
+            await connection.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK_ID})")
@@ -0,0 +1,28 @@
+from sqlalchemy import Connection
+
+from infra.db.models import HealthcheckLogModel
+
+OBSOLETE_INDEXES = (
+    "ix_health_checks_component_id",
+    "health_checks_component_id_idx",
+    "health_checks_checked_at_idx",
+    "health_checks_component_id_checked_at_idx",
+)
+
+
+def upgrade(connection: Connection) -> None:
+    concurrently = (
+        connection.dialect.name == "postgresql"
+        and connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+    )
+
+    for index_name in OBSOLETE_INDEXES:
+        connection.exec_driver_sql(f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {index_name}")
+
+    for index in HealthcheckLogModel.__table__.indexes:
+        index.dialect_kwargs["postgresql_concurrently"] = concurrently
+
+        try:
+            index.create(connection, checkfirst=True)
+        finally:
+            index.dialect_kwargs["postgresql_concurrently"] = False
@@ -0,0 +1,23 @@
+from sqlalchemy import Connection
+
+from infra.db.models import name_search_sqlite_ddl
+
+SEARCHABLE_TABLES = ("products", "components")
+
+
+def upgrade(connection: Connection) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        for table_name in SEARCHABLE_TABLES:
+            connection.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_name_trgm ON {table_name} USING gin (name gin_trgm_ops)"
+            )
+
+        return
+
+    for table_name in SEARCHABLE_TABLES:
+        for statement in name_search_sqlite_ddl(table_name):
+            connection.exec_driver_sql(statement)
+
+        connection.exec_driver_sql(f"INSERT INTO {table_name}_name_fts({table_name}_name_fts) VALUES ('rebuild')")
@@ -0,0 +1,28 @@
+from sqlalchemy import Connection, DateTime, text
+
+from infra.db.models import Base
+
+NAIVE_COLUMNS_QUERY = text(
+    "SELECT table_name, column_name FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND data_type = 'timestamp without time zone'"
+)
+
+
+def upgrade(connection: Connection) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+
+    naive_columns = {(row.table_name, row.column_name) for row in connection.execute(NAIVE_COLUMNS_QUERY)}
+
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.type, DateTime) or not column.type.timezone:
+                continue
+
+            if (table.name, column.name) not in naive_columns:
+                continue
+
+            connection.exec_driver_sql(
+                f'ALTER TABLE {table.name} ALTER COLUMN "{column.name}" TYPE timestamptz '
+                f"USING \"{column.name}\" AT TIME ZONE 'UTC'"
+            )
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DDL, BigInteger, Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, event, func
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -11,6 +11,7 @@ from sqlalchemy.orm import (
 )
 
 from core.domain.component_type import ComponentType
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
 
 
@@ -18,8 +19,34 @@ class Base(MappedAsDataclass, DeclarativeBase):
     pass
 
 
+def name_search_index(table_name: str) -> Index:
+    return Index(
+        f"ix_{table_name}_name_trgm",
+        "name",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+def name_search_sqlite_ddl(table_name: str) -> tuple[str, ...]:
+    fts_table = f"{table_name}_name_fts"
+
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5"
+        f"(name, content='{table_name}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, name) VALUES (new.id, new.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, name) VALUES ('delete', old.id, old.name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF name ON {table_name} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, name) VALUES ('delete', old.id, old.name); "
+        f"INSERT INTO {fts_table}(rowid, name) VALUES (new.id, new.name); END",
+    )
+
+
 class ProductModel(Base):
     __tablename__ = "products"
+    __table_args__ = (name_search_index("products"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
 
@@ -52,6 +79,7 @@ class ProductModel(Base):
 
 class ComponentModel(Base):
     __tablename__ = "components"
+    __table_args__ = (name_search_index("components"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id", ondelete="CASCADE"), index=True)
@@ -87,9 +115,27 @@ class ComponentModel(Base):
 
 class HealthcheckLogModel(Base):
     __tablename__ = "health_checks"
+    __table_args__ = (
+        Index(
+            "ix_health_checks_component_id_checked_at",
+            "component_id",
+            "checked_at",
+            postgresql_include=["is_successful", "response_time_ms", "status_after"],
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_health_checks_component_id_checked_at",
+            "component_id",
+            "checked_at",
+            "is_successful",
+            "response_time_ms",
+            "status_after",
+        ).ddl_if(dialect="sqlite"),
+        Index("ix_health_checks_checked_at_brin", "checked_at", postgresql_using="brin").ddl_if(dialect="postgresql"),
+        Index("ix_health_checks_checked_at", "checked_at").ddl_if(dialect="sqlite"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
-    component_id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), index=True)
+    component_id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"))
 
     is_successful: Mapped[bool] = mapped_column(Boolean)
     status_code: Mapped[Optional[int]] = mapped_column(Integer)
@@ -113,3 +159,64 @@ class HealthcheckLogModel(Base):
     )
 
     component: Mapped[ComponentModel] = relationship(back_populates="healthcheck_logs", init=False)
+
+
+class HealthcheckRollupModel(Base):
+    __tablename__ = "health_check_rollups"
+
+    component_id: Mapped[int] = mapped_column(
+        ForeignKey("components.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    resolution: Mapped[RollupResolution] = mapped_column(
+        Enum(RollupResolution, native_enum=False, name="rollup_resolution"),
+        primary_key=True,
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    total_checks: Mapped[int] = mapped_column(Integer, default=0)
+    successful_checks: Mapped[int] = mapped_column(Integer, default=0)
+    total_response_time_ms: Mapped[int] = mapped_column(BigInteger, default=0)
+    max_response_time_ms: Mapped[int] = mapped_column(Integer, default=0)
+    max_status_severity: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class HealthcheckCounterModel(Base):
+    __tablename__ = "health_check_counters"
+
+    component_id: Mapped[int] = mapped_column(
+        ForeignKey("components.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    cumulative_checks: Mapped[int] = mapped_column(BigInteger, default=0)
+    cumulative_successful_checks: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+class IncidentModel(Base):
+    __tablename__ = "incidents"
+    __table_args__ = (
+        Index("ix_incidents_component_id_ended_at", "component_id", "ended_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
+    component_id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"))
+
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    status: Mapped[StatusType] = mapped_column(
+        Enum(StatusType, native_enum=False, name="status_type"),
+        nullable=False,
+    )
+    ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=None)
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+for _table in (ProductModel.__table__, ComponentModel.__table__):
+    for _statement in name_search_sqlite_ddl(_table.name):
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
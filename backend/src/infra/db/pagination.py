@@ -0,0 +1,52 @@
+from typing import Any, Optional
+
+from sqlalchemy import Row, Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.page import Page
+
+
+async def fetch_page(
+    session: AsyncSession,
+    statement: Select,
+    page: int,
+    page_size: int,
+    include_total: bool = True,
+    known_total: Optional[int] = None,
+) -> Page[Row[Any]]:
+    offset = (page - 1) * page_size
+
+    if not include_total or known_total is not None:
+        rows = list((await session.execute(statement.offset(offset).limit(page_size + 1))).all())
+        content = rows[:page_size]
+
+        return _build_page(content, page_size, known_total, has_next=len(rows) > page_size)
+
+    windowed = statement.add_columns(func.count().over().label("total_elements")).offset(offset).limit(page_size)
+    content = list((await session.execute(windowed)).all())
+
+    if content:
+        total_elements = content[0].total_elements
+    elif offset == 0:
+        total_elements = 0
+    else:
+        count_statement = statement.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+        total_elements = (await session.execute(count_statement)).scalar_one()
+
+    return _build_page(content, page_size, total_elements, has_next=offset + len(content) < total_elements)
+
+
+def _build_page(content: list[Any], page_size: int, total_elements: Optional[int], has_next: bool) -> Page[Any]:
+    total_pages = None
+
+    if total_elements is not None:
+        total_pages = (total_elements + page_size - 1) // page_size if total_elements > 0 else 0
+
+    return Page(
+        page_size=page_size,
+        page_count=len(content),
+        total_elements=total_elements,
+        total_pages=total_pages,
+        content=content,
+        has_next=has_next,
+    )
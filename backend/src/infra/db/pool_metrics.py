@@ -0,0 +1,138 @@
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection
+
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+
+class PoolMetrics:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_in_use = 0
+        self._in_use = 0
+        self._engine: Optional[Engine] = None
+        self._wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+        self._wait_count = 0
+        self._wait_sum_ms = 0.0
+        self._wait_max_ms = 0.0
+
+    def attach(self, engine: Engine) -> "PoolMetrics":
+        self._engine = engine
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+        if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool):
+            engine.pool.metrics = self
+
+        return self
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        wait_ms = seconds * 1000
+
+        self._wait_buckets[bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)] += 1
+        self._wait_count += 1
+        self._wait_sum_ms += wait_ms
+        self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+
+    def record_checkout_timeout(self) -> None:
+        self.checkout_timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self._engine.pool if self._engine is not None else None
+
+        return {
+            "pool": type(pool).__name__ if pool is not None else None,
+            "size": self._gauge(pool, "size"),
+            "in_use": self._gauge(pool, "checkedout"),
+            "idle": self._gauge(pool, "checkedin"),
+            "overflow": max(0, overflow) if (overflow := self._gauge(pool, "overflow")) is not None else None,
+            "peak_in_use": self.peak_in_use,
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.checkout_timeouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "checkout_wait_ms": {
+                "count": self._wait_count,
+                "mean": round(self._wait_sum_ms / self._wait_count, 3) if self._wait_count else 0.0,
+                "max": round(self._wait_max_ms, 3),
+                "p50": self._wait_percentile(0.5),
+                "p95": self._wait_percentile(0.95),
+                "p99": self._wait_percentile(0.99),
+                "buckets": {
+                    str(bound): count
+                    for bound, count in zip([*CHECKOUT_WAIT_BUCKETS_MS, "+Inf"], self._wait_buckets)
+                },
+            },
+        }
+
+    def _wait_percentile(self, fraction: float) -> Optional[float]:
+        if not self._wait_count:
+            return None
+
+        threshold = self._wait_count * fraction
+        seen = 0
+
+        for index, count in enumerate(self._wait_buckets):
+            seen += count
+
+            if seen >= threshold:
+                if index < len(CHECKOUT_WAIT_BUCKETS_MS):
+                    return float(CHECKOUT_WAIT_BUCKETS_MS[index])
+
+                break
+
+        return round(self._wait_max_ms, 3)
+
+    def _gauge(self, pool: Optional[Pool], name: str) -> Optional[int]:
+        reader: Optional[Callable[[], int]] = getattr(pool, name, None)
+
+        return reader() if reader is not None else None
+
+    def _on_connect(self, _dbapi_connection, _connection_record) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, _dbapi_connection, _connection_record, _connection_proxy) -> None:
+        self.checkouts += 1
+        self._in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self._in_use)
+
+    def _on_checkin(self, _dbapi_connection, _connection_record) -> None:
+        self._in_use = max(0, self._in_use - 1)
+
+    def _on_invalidate(self, _dbapi_connection, _connection_record, _exception) -> None:
+        self.invalidations += 1
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_checkout_timeout()
+            raise
+
+        if self.metrics is not None:
+            self.metrics.record_checkout_wait(time.perf_counter() - started)
+
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+
+        return pool  # type: ignore[return-value]
@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.component import Component
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.product import Product
+from infra.db.models import ComponentModel, ProductModel
+
+PRODUCT_COLUMNS = (
+    ProductModel.id,
+    ProductModel.name,
+    ProductModel.description,
+    ProductModel.is_visible,
+    ProductModel.created_at,
+    ProductModel.updated_at,
+)
+
+COMPONENT_COLUMNS = (
+    ComponentModel.id,
+    ComponentModel.product_id,
+    ComponentModel.name,
+    ComponentModel.type,
+    ComponentModel.current_status,
+    ComponentModel.health_url,
+    ComponentModel.check_interval_seconds,
+    ComponentModel.timeout_seconds,
+    ComponentModel.expected_status_code,
+    ComponentModel.max_response_time_ms,
+    ComponentModel.failures_before_outage,
+    ComponentModel.is_active,
+)
+
+
+def product_from_row(row: Row[Any], components: list[Component]) -> Product:
+    return Product(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        is_visible=row.is_visible,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        components=components,
+    )
+
+
+def component_from_row(row: Row[Any]) -> Component:
+    return Component(
+        id=row.id,
+        product_id=row.product_id,
+        name=row.name,
+        type=row.type,
+        current_status=row.current_status,
+        monitoring_config=HealthcheckConfig(
+            health_url=row.health_url,
+            check_interval_seconds=row.check_interval_seconds,
+            timeout_seconds=row.timeout_seconds,
+            expected_status_code=row.expected_status_code,
+            max_response_time_ms=row.max_response_time_ms,
+            failures_before_outage=row.failures_before_outage,
+        ),
+        is_active=row.is_active,
+    )
+
+
+async def components_by_product(session: AsyncSession, product_ids: Iterable[int]) -> dict[int, list[Component]]:
+    product_ids = list(product_ids)
+    grouped: dict[int, list[Component]] = {product_id: [] for product_id in product_ids}
+
+    if not product_ids:
+        return grouped
+
+    statement = (
+        select(*COMPONENT_COLUMNS)
+        .where(ComponentModel.product_id.in_(product_ids))
+        .order_by(ComponentModel.product_id.asc(), ComponentModel.id.asc())
+    )
+
+    for row in await session.execute(statement):
+        grouped[row.product_id].append(component_from_row(row))
+
+    return grouped
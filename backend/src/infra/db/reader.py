@@ -0,0 +1,111 @@
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, TypeVar
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = structlog.stdlib.get_logger(__name__)
+
+T = TypeVar("T")
+
+ReadQuery = Callable[[AsyncSession], Awaitable[T]]
+
+POSTGRES_REPLICA_LAG_QUERY = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_primary_only: ContextVar[bool] = ContextVar("primary_only", default=False)
+
+
+@contextmanager
+def primary_reads(enabled: bool = True) -> Iterator[None]:
+    token = _primary_only.set(_primary_only.get() or enabled)
+
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+class SessionReader:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def run(self, query: ReadQuery[T]) -> T:
+        async with self._session_factory() as session:
+            return await query(session)
+
+
+class ReplicaSessionReader(SessionReader):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        replica_session_factory: async_sessionmaker[AsyncSession],
+        max_lag_seconds: float,
+        lag_check_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+        lag_query: str = POSTGRES_REPLICA_LAG_QUERY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(session_factory)
+        self._replica_session_factory = replica_session_factory
+        self._max_lag_seconds = max_lag_seconds
+        self._lag_check_seconds = lag_check_seconds
+        self._retry_seconds = retry_seconds
+        self._lag_query = text(lag_query)
+        self._clock = clock
+
+        self._lag_seconds: Optional[float] = None
+        self._lag_checked_at: Optional[float] = None
+        self._unavailable_until = 0.0
+
+    async def run(self, query: ReadQuery[T]) -> T:
+        if not _primary_only.get() and await self._replica_is_fresh():
+            try:
+                async with self._replica_session_factory() as session:
+                    return await query(session)
+            except (DBAPIError, OSError) as error:
+                self._mark_unavailable(error)
+
+        return await super().run(query)
+
+    async def _replica_is_fresh(self) -> bool:
+        now = self._clock()
+
+        if now < self._unavailable_until:
+            return False
+
+        if self._lag_checked_at is None or now - self._lag_checked_at >= self._lag_check_seconds:
+            self._lag_checked_at = now
+
+            try:
+                async with self._replica_session_factory() as session:
+                    self._lag_seconds = float((await session.execute(self._lag_query)).scalar_one() or 0)
+            except (DBAPIError, OSError) as error:
+                self._mark_unavailable(error)
+                return False
+
+            if self._lag_seconds > self._max_lag_seconds:
+                logger.warning(
+                    "Read replica is lagging, reading from primary",
+                    lag_seconds=self._lag_seconds,
+                    max_lag_seconds=self._max_lag_seconds,
+                )
+
+        return self._lag_seconds is not None and self._lag_seconds <= self._max_lag_seconds
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        self._unavailable_until = self._clock() + self._retry_seconds
+        self._lag_checked_at = None
+
+        logger.warning(
+            "Read replica unavailable, reading from primary",
+            error=str(error),
+            retry_in_seconds=self._retry_seconds,
+        )
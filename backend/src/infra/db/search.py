@@ -0,0 +1,20 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.db.dialect import dialect_name
+
+TRIGRAM_LENGTH = 3
+
+
+def name_matches(session: AsyncSession, model: Any, term: str) -> ColumnElement[bool]:
+    if dialect_name(session) == "sqlite" and len(term) >= TRIGRAM_LENGTH:
+        fts_table = table(f"{model.__tablename__}_name_fts", column("rowid"), column("name"))
+        phrase = '"' + term.replace('"', '""') + '"'
+
+        return model.id.in_(select(fts_table.c.rowid).where(fts_table.c.name.op("MATCH")(phrase)))
+
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    return model.name.ilike(f"%{escaped}%", escape="\\")
@@ -1,6 +1,7 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from functools import lru_cache
+from typing import Any, Optional
 
 from sqlalchemy import URL, event
 from sqlalchemy.ext.asyncio import (
@@ -11,7 +12,11 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from infra.config.config import get_config
+from infra.db.migrations import apply_migrations, run_migrations
 from infra.db.models import Base
+from infra.db.pool_metrics import InstrumentedAsyncAdaptedQueuePool, PoolMetrics
+from infra.db.reader import ReplicaSessionReader, SessionReader
+from infra.db.writer import QueuedSessionWriter, SessionWriter
 
 
 @lru_cache
@@ -23,26 +28,83 @@ def get_engine() -> AsyncEngine:
             drivername="sqlite+aiosqlite",
             database=db_config.SQLITE_PATH,
         )
+        pool_options = {}
+
+        if db_config.SQLITE_PATH not in ("", ":memory:"):
+            pool_options["poolclass"] = InstrumentedAsyncAdaptedQueuePool
+
         engine = create_async_engine(
             url,
             echo=db_config.ECHO,
             pool_pre_ping=True,
+            **pool_options,
         )
+        get_pool_metrics("primary").attach(engine.sync_engine)
+
+        pragmas = ["foreign_keys=ON"]
+        is_production = db_config.SQLITE_PROFILE == "production"
+
+        if is_production:
+            pragmas.extend(
+                [
+                    "journal_mode=WAL",
+                    f"synchronous={db_config.SQLITE_SYNCHRONOUS}",
+                    f"cache_size=-{db_config.SQLITE_CACHE_SIZE_KIB}",
+                    f"mmap_size={db_config.SQLITE_MMAP_SIZE_BYTES}",
+                    f"busy_timeout={db_config.SQLITE_BUSY_TIMEOUT_MS}",
+                    "temp_store=MEMORY",
+                ]
+            )
 
         @event.listens_for(engine.sync_engine, "connect")
         def _set_sqlite_pragma(dbapi_connection, _connection_record) -> None:
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for pragma in pragmas:
+                cursor.execute(f"PRAGMA {pragma}")
             cursor.close()
 
+            if is_production:
+                dbapi_connection.isolation_level = None
+
+        if is_production:
+
+            @event.listens_for(engine.sync_engine, "begin")
+            def _begin_sqlite_transaction(connection) -> None:
+                connection.exec_driver_sql("BEGIN")
+
         return engine
 
+    engine = _create_postgres_engine(host=db_config.HOST, port=db_config.PORT)
+    get_pool_metrics("primary").attach(engine.sync_engine)
+
+    return engine
+
+
+@lru_cache
+def get_read_engine() -> Optional[AsyncEngine]:
+    db_config = get_config().DATABASE_CONFIG
+
+    if db_config.DRIVER != "postgres" or not db_config.READ_REPLICA_HOST:
+        return None
+
+    engine = _create_postgres_engine(
+        host=db_config.READ_REPLICA_HOST,
+        port=db_config.READ_REPLICA_PORT or db_config.PORT,
+    )
+    get_pool_metrics("replica").attach(engine.sync_engine)
+
+    return engine
+
+
+def _create_postgres_engine(host: Optional[str], port: Optional[int]) -> AsyncEngine:
+    db_config = get_config().DATABASE_CONFIG
+
     url = URL.create(
         drivername="postgresql+asyncpg",
         username=db_config.USER,
         password=db_config.PASSWORD,
-        host=db_config.HOST,
-        port=db_config.PORT,
+        host=host,
+        port=port,
         database=db_config.DATABASE,
     )
 
@@ -54,19 +116,74 @@ def get_engine() -> AsyncEngine:
         max_overflow=db_config.MAX_OVERFLOW,
         pool_timeout=db_config.POOL_TIMEOUT,
         pool_recycle=db_config.POOL_RECYCLE,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
     )
 
 
+@lru_cache
+def get_pool_metrics(name: str) -> PoolMetrics:
+    return PoolMetrics(name)
+
+
+def get_pool_stats() -> dict[str, dict[str, Any]]:
+    stats = {"primary": get_pool_metrics("primary").snapshot()}
+
+    if get_read_engine() is not None:
+        stats["replica"] = get_pool_metrics("replica").snapshot()
+
+    return stats
+
+
 @lru_cache
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return _create_session_factory(get_engine())
+
+
+@lru_cache
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    read_engine = get_read_engine()
+
+    if read_engine is None:
+        return get_session_factory()
+
+    return _create_session_factory(read_engine)
+
+
+def _create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
-        bind=get_engine(),
+        bind=engine,
         class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
     )
 
 
+@lru_cache
+def get_session_writer() -> SessionWriter:
+    db_config = get_config().DATABASE_CONFIG
+
+    if db_config.DRIVER == "sqlite" and db_config.SQLITE_PROFILE == "production":
+        return QueuedSessionWriter(get_session_factory(), max_batch_size=db_config.SQLITE_WRITE_BATCH_SIZE)
+
+    return SessionWriter(get_session_factory())
+
+
+@lru_cache
+def get_session_reader() -> SessionReader:
+    db_config = get_config().DATABASE_CONFIG
+
+    if get_read_engine() is None:
+        return SessionReader(get_session_factory())
+
+    return ReplicaSessionReader(
+        get_session_factory(),
+        get_read_session_factory(),
+        max_lag_seconds=db_config.READ_REPLICA_MAX_LAG_SECONDS,
+        lag_check_seconds=db_config.READ_REPLICA_LAG_CHECK_SECONDS,
+        retry_seconds=db_config.READ_REPLICA_RETRY_SECONDS,
+    )
+
+
 async def get_session() -> AsyncIterator[AsyncSession]:
     session_factory = get_session_factory()
 
@@ -88,9 +205,19 @@ async def session_scope() -> AsyncIterator[AsyncSession]:
 
 
 async def close_engine() -> None:
+    await get_session_writer().close()
     await get_engine().dispose()
 
+    read_engine = get_read_engine()
+    if read_engine is not None:
+        await read_engine.dispose()
+
 
 async def create_database_schema() -> None:
     async with get_engine().begin() as connection:
         await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(apply_migrations)
+
+
+async def migrate_database() -> list[int]:
+    return await run_migrations(get_engine())
@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+WriteJob = Callable[[AsyncSession], Awaitable[T]]
+
+
+class SessionWriter:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def run(self, job: WriteJob[T]) -> T:
+        async with self._session_factory() as session:
+            result = await job(session)
+            await session.commit()
+
+            return result
+
+    async def close(self) -> None:
+        return None
+
+
+class QueuedSessionWriter(SessionWriter):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int = 100,
+    ) -> None:
+        super().__init__(session_factory)
+        self._max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue[Optional[tuple[WriteJob[Any], asyncio.Future[Any]]]]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def run(self, job: WriteJob[T]) -> T:
+        if self._queue is None or self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._drain(self._queue))
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job, future))
+
+        return await future
+
+    async def close(self) -> None:
+        if self._queue is None or self._task is None:
+            return
+
+        if not self._task.done():
+            self._queue.put_nowait(None)
+            await self._task
+
+        self._queue = None
+        self._task = None
+
+    async def _drain(self, queue: asyncio.Queue[Optional[tuple[WriteJob[Any], asyncio.Future[Any]]]]) -> None:
+        batch: list[tuple[WriteJob[Any], asyncio.Future[Any]]] = []
+
+        try:
+            while True:
+                entry = await queue.get()
+
+                if entry is None:
+                    return
+
+                batch = [entry]
+                closing = False
+
+                while len(batch) < self._max_batch_size and not queue.empty():
+                    entry = queue.get_nowait()
+
+                    if entry is None:
+                        closing = True
+                        break
+
+                    batch.append(entry)
+
+                try:
+                    await self._write_batch(batch)
+                except Exception as error:
+                    self._fail(batch, error)
+
+                if closing:
+                    return
+        except BaseException:
+            stopped = RuntimeError("Write queue stopped before the job ran")
+            self._fail(batch, stopped)
+
+            while not queue.empty():
+                entry = queue.get_nowait()
+
+                if entry is not None:
+                    self._fail([entry], stopped)
+
+            raise
+
+    async def _write_batch(self, batch: list[tuple[WriteJob[Any], asyncio.Future[Any]]]) -> None:
+        outcomes: list[tuple[asyncio.Future[Any], Any, Optional[Exception]]] = []
+        committed = False
+
+        try:
+            async with self._session_factory() as session:
+                for job, future in batch:
+                    try:
+                        async with session.begin_nested():
+                            outcomes.append((future, await job(session), None))
+                    except Exception as error:
+                        outcomes.append((future, None, error))
+
+                await session.commit()
+                committed = True
+        except Exception as error:
+            if not committed:
+                self._fail(batch, error)
+                return
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _fail(self, batch: list[tuple[WriteJob[Any], asyncio.Future[Any]]], error: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
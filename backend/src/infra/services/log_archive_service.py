@@ -0,0 +1,40 @@
+import structlog
+from core.port.scheduler import Scheduler
+from use_cases.log.archive_logs_use_case import ArchiveLogsUseCase
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class LogArchiveService:
+    def __init__(
+        self,
+        interval_seconds: int,
+        retention_days: int,
+        scheduler: Scheduler,
+        archive_logs_use_case: ArchiveLogsUseCase,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.retention_days = retention_days
+        self.scheduler = scheduler
+        self.archive_logs_use_case = archive_logs_use_case
+
+    def start(self) -> None:
+        self.scheduler.add_job(
+            job_key="archive_health_checks",
+            func=self._archive_logs,
+            interval_seconds=self.interval_seconds,
+            job_name="Archive old health checks",
+        )
+
+        logger.info(
+            f"Health check archiving scheduled (retention: {self.retention_days}d, "
+            f"interval: {self.interval_seconds}s)"
+        )
+
+    async def _archive_logs(self) -> None:
+        try:
+            archived_rows = await self.archive_logs_use_case.execute(retention_days=self.retention_days)
+
+            logger.info(f"Archived {archived_rows} health check rows older than {self.retention_days} days")
+        except Exception as e:
+            logger.exception(f"Error archiving health checks: {e}")
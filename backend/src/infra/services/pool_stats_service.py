@@ -0,0 +1,35 @@
+from typing import Any, Callable
+
+import structlog
+from core.port.scheduler import Scheduler
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class PoolStatsService:
+    def __init__(
+        self,
+        interval_seconds: int,
+        scheduler: Scheduler,
+        get_pool_stats: Callable[[], dict[str, dict[str, Any]]],
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.scheduler = scheduler
+        self.get_pool_stats = get_pool_stats
+
+    def start(self) -> None:
+        self.scheduler.add_job(
+            job_key="log_db_pool_stats",
+            func=self._log_pool_stats,
+            interval_seconds=self.interval_seconds,
+            job_name="Log database pool stats",
+        )
+
+        logger.info(f"Database pool stats logging scheduled (interval: {self.interval_seconds}s)")
+
+    async def _log_pool_stats(self) -> None:
+        try:
+            for engine_name, stats in self.get_pool_stats().items():
+                logger.info("db_pool_stats", engine=engine_name, **stats)
+        except Exception as e:
+            logger.exception(f"Error collecting database pool stats: {e}")
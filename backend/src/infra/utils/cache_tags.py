@@ -0,0 +1,30 @@
+from collections.abc import Iterable
+from typing import Optional
+
+from core.domain.component import Component
+from core.domain.product import Product
+
+PRODUCT_LIST_TAG = "products"
+SEARCH_RESULTS_TAG = "search"
+
+
+def product_tag(product_id: Optional[int]) -> str:
+    return f"product:{product_id}"
+
+
+def component_tag(component_id: Optional[int]) -> str:
+    return f"component:{component_id}"
+
+
+def component_tags(components: Iterable[Component]) -> set[str]:
+    return {component_tag(component.id) for component in components if component.id is not None}
+
+
+def product_tags(products: Iterable[Product]) -> set[str]:
+    tags: set[str] = set()
+
+    for product in products:
+        tags.add(product_tag(product.id))
+        tags |= component_tags(product.components)
+
+    return tags
@@ -0,0 +1,214 @@
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+
+SEGMENT_MAGIC = b"HCS1"
+_HEADER = struct.Struct("<4sIqqI")
+_COLUMN_LENGTH = struct.Struct("<I")
+_STATUSES = list(StatusType)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class SegmentHeader:
+    component_id: int
+    first_checked_at: datetime
+    last_checked_at: datetime
+    row_count: int
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    if value < 0:
+        raise ValueError("Varint values must be non-negative")
+
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    out.append(value)
+
+
+def decode_varint(buffer: bytes, offset: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return result, offset
+
+        shift += 7
+
+
+def zigzag_encode(value: int) -> int:
+    return (value << 1) if value >= 0 else ((-value) << 1) - 1
+
+
+def zigzag_decode(value: int) -> int:
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+def pack_bits(flags: list[bool]) -> bytes:
+    packed = bytearray((len(flags) + 7) // 8)
+
+    for index, flag in enumerate(flags):
+        if flag:
+            packed[index >> 3] |= 1 << (index & 7)
+
+    return bytes(packed)
+
+
+def unpack_bits(packed: bytes, count: int) -> list[bool]:
+    return [bool(packed[index >> 3] & (1 << (index & 7))) for index in range(count)]
+
+
+def to_epoch_us(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_epoch_us(value: int) -> datetime:
+    seconds, microseconds = divmod(value, 1_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=microseconds)
+
+
+def encode_segment(component_id: int, logs: list[HealthcheckLog]) -> bytes:
+    if not logs:
+        raise ValueError("Cannot encode an empty segment")
+
+    ordered = sorted(logs, key=lambda log: log.checked_at)
+    timestamps = [to_epoch_us(log.checked_at) for log in ordered]
+
+    timestamp_column = bytearray()
+    previous = timestamps[0]
+    for timestamp in timestamps:
+        encode_varint(zigzag_encode(timestamp - previous), timestamp_column)
+        previous = timestamp
+
+    latency_column = bytearray()
+    status_code_column = bytearray()
+    status_column = bytearray()
+    error_column = bytearray()
+
+    for log in ordered:
+        encode_varint(zigzag_encode(log.response_time_ms), latency_column)
+        encode_varint(0 if log.status_code is None else log.status_code + 1, status_code_column)
+        status_column.append(_STATUSES.index(log.status_before) << 2 | _STATUSES.index(log.status_after))
+
+        if log.error_message is None:
+            encode_varint(0, error_column)
+        else:
+            encoded_message = log.error_message.encode("utf-8")
+            encode_varint(len(encoded_message) + 1, error_column)
+            error_column.extend(encoded_message)
+
+    columns = [
+        bytes(timestamp_column),
+        bytes(latency_column),
+        pack_bits([log.is_successful for log in ordered]),
+        bytes(status_code_column),
+        bytes(status_column),
+        bytes(error_column),
+    ]
+
+    segment = bytearray(_HEADER.pack(SEGMENT_MAGIC, component_id, timestamps[0], timestamps[-1], len(ordered)))
+    for column in columns:
+        compressed = zlib.compress(column, 6)
+        segment.extend(_COLUMN_LENGTH.pack(len(compressed)))
+        segment.extend(compressed)
+
+    return bytes(segment)
+
+
+def decode_segment_header(buffer: bytes) -> SegmentHeader:
+    magic, component_id, first_us, last_us, row_count = _HEADER.unpack_from(buffer, 0)
+
+    if magic != SEGMENT_MAGIC:
+        raise ValueError("Not a health check segment")
+
+    return SegmentHeader(
+        component_id=component_id,
+        first_checked_at=from_epoch_us(first_us),
+        last_checked_at=from_epoch_us(last_us),
+        row_count=row_count,
+    )
+
+
+def decode_segment(
+    buffer: bytes,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> list[HealthcheckLog]:
+    header = decode_segment_header(buffer)
+    first_us = to_epoch_us(header.first_checked_at)
+    row_count = header.row_count
+
+    columns: list[bytes] = []
+    offset = _HEADER.size
+    for _ in range(6):
+        (length,) = _COLUMN_LENGTH.unpack_from(buffer, offset)
+        offset += _COLUMN_LENGTH.size
+        columns.append(zlib.decompress(buffer[offset : offset + length]))
+        offset += length
+
+    timestamp_column, latency_column, success_column, status_code_column, status_column, error_column = columns
+
+    timestamps: list[int] = []
+    position = 0
+    previous = first_us
+    for _ in range(row_count):
+        delta, position = decode_varint(timestamp_column, position)
+        previous += zigzag_decode(delta)
+        timestamps.append(previous)
+
+    since_us = to_epoch_us(since) if since is not None else None
+    until_us = to_epoch_us(until) if until is not None else None
+    successes = unpack_bits(success_column, row_count)
+
+    logs: list[HealthcheckLog] = []
+    latency_position = status_code_position = error_position = 0
+
+    for index in range(row_count):
+        latency, latency_position = decode_varint(latency_column, latency_position)
+        raw_status_code, status_code_position = decode_varint(status_code_column, status_code_position)
+        raw_error_length, error_position = decode_varint(error_column, error_position)
+
+        error_message: Optional[str] = None
+        if raw_error_length:
+            error_end = error_position + raw_error_length - 1
+            error_message = error_column[error_position:error_end].decode("utf-8")
+            error_position = error_end
+
+        timestamp = timestamps[index]
+        if since_us is not None and timestamp < since_us:
+            continue
+
+        if until_us is not None and timestamp >= until_us:
+            continue
+
+        statuses = status_column[index]
+        logs.append(
+            HealthcheckLog(
+                component_id=header.component_id,
+                checked_at=from_epoch_us(timestamp),
+                is_successful=successes[index],
+                status_code=raw_status_code - 1 if raw_status_code else None,
+                response_time_ms=zigzag_decode(latency),
+                status_before=_STATUSES[statuses >> 2],
+                status_after=_STATUSES[statuses & 0b11],
+                error_message=error_message,
+            )
+        )
+
+    return logs
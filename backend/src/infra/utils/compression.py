@@ -0,0 +1,79 @@
+import asyncio
+import gzip
+from enum import Enum
+from typing import Optional
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+class ContentEncoding(str, Enum):
+    ZSTD = "zstd"
+    BROTLI = "br"
+    GZIP = "gzip"
+
+    @property
+    def is_available(self) -> bool:
+        return {
+            ContentEncoding.ZSTD: zstd is not None,
+            ContentEncoding.BROTLI: brotli is not None,
+            ContentEncoding.GZIP: True,
+        }[self]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[ContentEncoding]:
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+
+    for candidate in accept_encoding.lower().split(","):
+        name, _, parameters = candidate.strip().partition(";")
+        weight = 1.0
+
+        if parameters.strip().startswith("q="):
+            try:
+                weight = float(parameters.strip()[2:])
+            except ValueError:
+                weight = 0.0
+
+        weights[name.strip()] = weight
+
+    best: Optional[ContentEncoding] = None
+    best_weight = 0.0
+
+    for encoding in ContentEncoding:
+        weight = weights.get(encoding.value, weights.get("*", 0.0))
+
+        if encoding.is_available and weight > best_weight:
+            best, best_weight = encoding, weight
+
+    return best
+
+
+def compress(body: bytes, encoding: ContentEncoding) -> bytes:
+    if encoding is ContentEncoding.ZSTD:
+        return zstd.compress(body, level=ZSTD_LEVEL)
+
+    if encoding is ContentEncoding.BROTLI:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+async def compress_body(body: bytes, encoding: ContentEncoding, offload_size: int) -> bytes:
+    if len(body) < offload_size:
+        return compress(body, encoding)
+
+    return await asyncio.to_thread(compress, body, encoding)
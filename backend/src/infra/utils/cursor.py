@@ -0,0 +1,22 @@
+import base64
+import binascii
+from datetime import datetime
+
+from core.exceptions.invalid_cursor_error import InvalidCursorError
+from infra.utils.columnar_codec import from_epoch_us, to_epoch_us
+
+
+def encode_cursor(checked_at: datetime, row_id: int) -> str:
+    raw = f"{to_epoch_us(checked_at)}:{row_id}".encode("ascii")
+
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_timestamp, raw_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").split(":")
+
+        return from_epoch_us(int(raw_timestamp)), int(raw_id)
+    except (binascii.Error, UnicodeError, ValueError) as error:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from error
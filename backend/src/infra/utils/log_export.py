@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+
+EXPORT_FIELDS = (
+    "id",
+    "component_id",
+    "checked_at",
+    "is_successful",
+    "status_code",
+    "response_time_ms",
+    "status_before",
+    "status_after",
+    "error_message",
+)
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv; charset=utf-8",
+        }[self]
+
+
+def log_to_record(log: HealthcheckLog) -> dict[str, Any]:
+    return {
+        "id": log.id,
+        "component_id": log.component_id,
+        "checked_at": log.checked_at.isoformat(),
+        "is_successful": log.is_successful,
+        "status_code": log.status_code,
+        "response_time_ms": log.response_time_ms,
+        "status_before": log.status_before.value,
+        "status_after": log.status_after.value,
+        "error_message": log.error_message,
+    }
+
+
+def record_to_log(record: dict[str, Any]) -> HealthcheckLog:
+    status_code = record["status_code"]
+    is_successful = record["is_successful"]
+
+    return HealthcheckLog(
+        component_id=int(record["component_id"]),
+        checked_at=datetime.fromisoformat(record["checked_at"]),
+        is_successful=is_successful if isinstance(is_successful, bool) else is_successful == "True",
+        status_code=int(status_code) if status_code not in (None, "") else None,
+        response_time_ms=int(record["response_time_ms"]),
+        status_before=StatusType(record["status_before"]),
+        status_after=StatusType(record["status_after"]),
+        error_message=record["error_message"] or None,
+    )
+
+
+def decode_logs(lines: Iterable[str], export_format: ExportFormat) -> Iterator[HealthcheckLog]:
+    if export_format is ExportFormat.CSV:
+        records: Iterable[dict[str, Any]] = csv.DictReader(lines)
+    else:
+        records = (json.loads(line) for line in lines if line.strip())
+
+    for record in records:
+        yield record_to_log(record)
+
+
+async def encode_logs(
+    logs: AsyncIterator[HealthcheckLog],
+    export_format: ExportFormat,
+    compress: bool = False,
+    chunk_rows: int = 500,
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    pending_rows = 0
+
+    if export_format is ExportFormat.CSV:
+        writer.writeheader()
+
+    async for log in logs:
+        record = log_to_record(log)
+
+        if export_format is ExportFormat.CSV:
+            writer.writerow(record)
+        else:
+            buffer.write(json.dumps(record, separators=(",", ":")))
+            buffer.write("\n")
+
+        pending_rows += 1
+        if pending_rows < chunk_rows:
+            continue
+
+        chunk = _drain(buffer, compressor)
+        pending_rows = 0
+
+        if chunk:
+            yield chunk
+
+    chunk = _drain(buffer, compressor)
+    if compressor is not None:
+        chunk += compressor.flush()
+
+    if chunk:
+        yield chunk
+
+
+def _drain(buffer: io.StringIO, compressor: Any) -> bytes:
+    payload = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+
+    if compressor is None:
+        return payload
+
+    return compressor.compress(payload)
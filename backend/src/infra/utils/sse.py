@@ -0,0 +1,18 @@
+from typing import Optional
+
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def encode_retry(milliseconds: int) -> bytes:
+    return f"retry: {milliseconds}\n\n".encode("utf-8")
+
+
+def encode_event(event: str, data: str, event_id: Optional[str] = None) -> bytes:
+    lines = [f"event: {event}"]
+
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
@@ -9,19 +9,32 @@ from use_cases.component.get_all_components_unpaginated_use_case import (
 from use_cases.component.update_component_status_use_case import (
     UpdateComponentStatusUseCase,
 )
+from use_cases.log.archive_logs_use_case import ArchiveLogsUseCase
 
 from infra.adapter.dict_component_cache import get_dict_component_cache
 from infra.adapter.local_scheduler import get_local_scheduler
+from infra.adapter.memory_status_event_bus import get_status_event_bus
 from infra.adapter.postgres_component_repository import get_component_repository
+from infra.adapter.postgres_incident_repository import get_incident_repository
 from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.segment_log_archive import get_log_archive
 from infra.config.config import get_config
-from infra.db.session import close_engine, create_database_schema
+from infra.db.session import close_engine, create_database_schema, get_pool_stats
 from infra.logging.config import configure_logging
 from infra.services.healthcheck_service import HealthcheckService
+from infra.services.log_archive_service import LogArchiveService
+from infra.services.pool_stats_service import PoolStatsService
+from infra.web.middleware.compression_middleware import CompressionMiddleware
 from infra.web.middleware.request_event_log_middleware import RequestEventLogMiddleware
+from infra.web.routers.change_router import router as change_router
 from infra.web.routers.component_router import router as component_router
+from infra.web.routers.dashboard_router import router as dashboard_router
+from infra.web.routers.export_router import router as export_router
+from infra.web.routers.incident_router import router as incident_router
 from infra.web.routers.product_router import router as product_router
+from infra.web.routers.sla_router import router as sla_router
 from infra.web.routers.stats_router import router as stats_router
+from infra.web.routers.stream_router import router as stream_router
 
 
 def create_app() -> FastAPI:
@@ -53,9 +66,31 @@ def create_app() -> FastAPI:
         cache=cache,
         http_client=http_client,
         get_components_use_case=GetAllComponentsUnpaginatedUseCase(component_repository),
-        update_component_use_case=UpdateComponentStatusUseCase(component_repository, log_repository),
+        update_component_use_case=UpdateComponentStatusUseCase(
+            component_repository,
+            log_repository,
+            get_incident_repository(),
+            get_status_event_bus(),
+        ),
     )
 
+    log_archive_service: LogArchiveService | None = None
+    if config.ARCHIVE_CONFIG.ENABLED:
+        log_archive_service = LogArchiveService(
+            interval_seconds=config.ARCHIVE_CONFIG.INTERVAL_SECONDS,
+            retention_days=config.ARCHIVE_CONFIG.RETENTION_DAYS,
+            scheduler=scheduler,
+            archive_logs_use_case=ArchiveLogsUseCase(log_repository, get_log_archive()),
+        )
+
+    pool_stats_service: PoolStatsService | None = None
+    if config.DATABASE_CONFIG.POOL_STATS_LOG_INTERVAL_SECONDS > 0:
+        pool_stats_service = PoolStatsService(
+            interval_seconds=config.DATABASE_CONFIG.POOL_STATS_LOG_INTERVAL_SECONDS,
+            scheduler=scheduler,
+            get_pool_stats=get_pool_stats,
+        )
+
     @asynccontextmanager
     async def lifespan(_: FastAPI):
         if config.ENVIRONMENT in ["dev", "loc"]:
@@ -64,6 +99,12 @@ def create_app() -> FastAPI:
         scheduler.start()
         await healthcheck_service.start()
 
+        if log_archive_service is not None:
+            log_archive_service.start()
+
+        if pool_stats_service is not None:
+            pool_stats_service.start()
+
         yield
         await close_engine()
 
@@ -79,6 +120,13 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    if config.COMPRESSION_CONFIG.ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=config.COMPRESSION_CONFIG.MINIMUM_SIZE,
+            offload_size=config.COMPRESSION_CONFIG.OFFLOAD_SIZE,
+        )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[
@@ -93,7 +141,10 @@ def create_app() -> FastAPI:
     app.add_middleware(
         RequestEventLogMiddleware,
         request_id_header="x-request-id",
-        excluded_path_suffixes={"/stats/health"},
+        excluded_path_suffixes={"/stats/health", "/stats/db"},
+        mode=config.LOGGING_CONFIG.REQUEST_LOG_MODE,
+        sample_rate=config.LOGGING_CONFIG.REQUEST_LOG_SAMPLE_RATE,
+        slow_request_ms=config.LOGGING_CONFIG.REQUEST_LOG_SLOW_MS,
     )
 
     app.state.host = config.HOST
@@ -102,5 +153,11 @@ def create_app() -> FastAPI:
     app.include_router(stats_router)
     app.include_router(product_router)
     app.include_router(component_router)
+    app.include_router(dashboard_router)
+    app.include_router(export_router)
+    app.include_router(incident_router)
+    app.include_router(sla_router)
+    app.include_router(stream_router)
+    app.include_router(change_router)
 
     return app
@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+from datetime import date
+from enum import Enum
+from typing import Any, Optional
+
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.status-page.columnar+json"
+
+
+class DayBarsFormat(str, Enum):
+    OBJECTS = "objects"
+    COLUMNAR = "columnar"
+
+
+def negotiate_day_bars_format(requested: Optional[DayBarsFormat], accept: Optional[str]) -> DayBarsFormat:
+    if requested is not None:
+        return requested
+
+    if accept and any(
+        candidate.split(";")[0].strip().lower() == COLUMNAR_MEDIA_TYPE for candidate in accept.split(",")
+    ):
+        return DayBarsFormat.COLUMNAR
+
+    return DayBarsFormat.OBJECTS
+
+
+def day_bar_columns(summaries: Iterable[HealthcheckLogDaySummary]) -> dict[str, Any]:
+    by_day: dict[date, HealthcheckLogDaySummary] = {summary.date.date(): summary for summary in summaries}
+
+    if not by_day:
+        return {"start_date": None, "count": 0}
+
+    start_date = min(by_day)
+    count = (max(by_day) - start_date).days + 1
+    columns: dict[str, list[Any]] = {
+        "total_checks": [0] * count,
+        "successful_checks": [0] * count,
+        "uptime": [None] * count,
+        "avg_response_time": [None] * count,
+        "max_response_time": [None] * count,
+        "overall_status": [None] * count,
+    }
+
+    for day, summary in by_day.items():
+        index = (day - start_date).days
+        columns["total_checks"][index] = summary.total_checks
+        columns["successful_checks"][index] = summary.successful_checks
+        columns["uptime"][index] = summary.uptime
+        columns["avg_response_time"][index] = summary.avg_response_time
+        columns["max_response_time"][index] = summary.max_response_time
+        columns["overall_status"][index] = summary.overall_status.severity
+
+    return {"start_date": start_date, "count": count, **columns}
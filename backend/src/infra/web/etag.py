@@ -0,0 +1,40 @@
+import hashlib
+import secrets
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+LISTING_CACHE_CONTROL = "no-cache"
+
+_INSTANCE_TAG = secrets.token_hex(4)
+
+
+def listing_etag(version: int, **params: Any) -> str:
+    today = datetime.now(timezone.utc).date().isoformat()
+    query = "&".join(f"{name}={params[name]}" for name in sorted(params))
+    digest = hashlib.blake2b(f"{today}|{query}".encode("utf-8"), digest_size=6).hexdigest()
+
+    return f'"{_INSTANCE_TAG}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": LISTING_CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = f"W/{etag}" if "content-encoding" in response.headers else etag
+    response.headers["Cache-Control"] = LISTING_CACHE_CONTROL
@@ -0,0 +1,84 @@
+from functools import lru_cache
+from typing import Any, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, SchemaSerializer, core_schema
+
+from core.domain.component import Component
+from core.domain.dashboard_snapshot import DashboardSnapshot
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.page import Page
+from core.domain.product import Product
+from infra.config.config import get_config
+from infra.web.routers.schemas.component import (
+    ComponentResponseDTO,
+    HealthcheckLogDaySummaryResponseDTO,
+    MonitoringConfigResponseDTO,
+)
+from infra.web.routers.schemas.dashboard import DashboardResponseDTO
+from infra.web.routers.schemas.page import PageDTO
+from infra.web.routers.schemas.product import ProductResponseDTO
+
+DOMAIN_TYPES: dict[type[BaseModel], type] = {
+    PageDTO: Page,
+    DashboardResponseDTO: DashboardSnapshot,
+    ProductResponseDTO: Product,
+    ComponentResponseDTO: Component,
+    MonitoringConfigResponseDTO: HealthcheckConfig,
+    HealthcheckLogDaySummaryResponseDTO: HealthcheckLogDaySummary,
+}
+
+
+def encode_response(response_model: type[BaseModel], content: Any) -> bytes:
+    encoder = compile_encoder(response_model) if get_config().FAST_SERIALIZATION else None
+
+    if encoder is not None:
+        try:
+            return encoder.to_json(content, by_alias=True, warnings="error")
+        except PydanticSerializationError:
+            pass
+
+    return response_model.model_validate(content).model_dump_json(by_alias=True).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def compile_encoder(response_model: type[BaseModel]) -> Optional[SchemaSerializer]:
+    try:
+        return SchemaSerializer(_model_schema(response_model))
+    except KeyError:
+        return None
+
+
+def _model_schema(model: type[BaseModel]) -> core_schema.CoreSchema:
+    domain_type = DOMAIN_TYPES[model.__pydantic_generic_metadata__["origin"] or model]
+    fields = [
+        core_schema.dataclass_field(
+            name,
+            _annotation_schema(field.annotation),
+            serialization_alias=field.serialization_alias or field.alias or name,
+        )
+        for name, field in model.model_fields.items()
+    ]
+
+    return core_schema.dataclass_schema(
+        domain_type,
+        core_schema.dataclass_args_schema(domain_type.__name__, fields),
+        [field["name"] for field in fields],
+    )
+
+
+def _annotation_schema(annotation: Any) -> core_schema.CoreSchema:
+    origin = get_origin(annotation)
+
+    if origin is list:
+        return core_schema.list_schema(_annotation_schema(get_args(annotation)[0]))
+
+    if origin is Union and type(None) in get_args(annotation):
+        [inner] = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return core_schema.nullable_schema(_annotation_schema(inner))
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_schema(annotation)
+
+    return TypeAdapter(annotation).core_schema
@@ -0,0 +1,26 @@
+from enum import Enum
+from typing import Optional
+
+
+class ListingInclude(str, Enum):
+    COMPONENTS = "components"
+    SUMMARIES = "summaries"
+
+
+def parse_listing_include(raw: Optional[str]) -> frozenset[ListingInclude]:
+    if raw is None:
+        return frozenset(ListingInclude)
+
+    names = [name.strip().lower() for name in raw.split(",") if name.strip()]
+    unknown = sorted({name for name in names if name not in {include.value for include in ListingInclude}})
+
+    if unknown:
+        allowed = ", ".join(include.value for include in ListingInclude)
+        raise ValueError(f"Unknown include value(s): {', '.join(unknown)} (allowed: {allowed})")
+
+    includes = {ListingInclude(name) for name in names}
+
+    if ListingInclude.SUMMARIES in includes:
+        includes.add(ListingInclude.COMPONENTS)
+
+    return frozenset(includes)
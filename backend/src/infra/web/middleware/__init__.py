@@ -1,3 +1,4 @@
+from infra.web.middleware.compression_middleware import CompressionMiddleware
 from infra.web.middleware.request_event_log_middleware import RequestEventLogMiddleware
 
-__all__ = ["RequestEventLogMiddleware"]
+__all__ = ["CompressionMiddleware", "RequestEventLogMiddleware"]
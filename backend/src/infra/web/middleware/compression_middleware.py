@@ -0,0 +1,73 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infra.utils.compression import compress_body, negotiate_encoding
+
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        offload_size: int = 65_536,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                media_type = headers.get("content-type", "")
+
+                if "content-encoding" in headers or media_type.startswith(UNCOMPRESSED_MEDIA_TYPES):
+                    await send(message)
+                    return
+
+                start_message = message
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            pending_start, start_message = start_message, None
+            body = message.get("body", b"")
+
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(pending_start)
+                await send(message)
+                return
+
+            body = await compress_body(body, encoding, self.offload_size)
+
+            headers = MutableHeaders(raw=list(pending_start.get("headers", [])))
+            headers["Content-Encoding"] = encoding.value
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            await send({**pending_start, "headers": headers.raw})
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,5 +1,7 @@
 import logging
+from random import random
 from time import perf_counter
+from typing import Literal
 from urllib.parse import parse_qsl
 from uuid import uuid4
 
@@ -11,6 +13,8 @@ from starlette.types import ASGIApp, Message, Receive, Scope, Send
 request_logger = structlog.stdlib.get_logger("infra.web.request")
 fallback_logger = logging.getLogger(__name__)
 
+RequestLogMode = Literal["full", "summary", "sampled"]
+
 
 class RequestEventLogMiddleware:
     def __init__(
@@ -19,10 +23,17 @@ class RequestEventLogMiddleware:
         *,
         request_id_header: str = "x-request-id",
         excluded_path_suffixes: set[str] | None = None,
+        mode: RequestLogMode = "full",
+        sample_rate: float = 0.1,
+        slow_request_ms: float = 1000.0,
     ) -> None:
         self.app = app
         self.request_id_header = request_id_header.lower()
+        self.request_id_key = self.request_id_header.encode("latin-1")
         self.excluded_path_suffixes = excluded_path_suffixes or set()
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.slow_request_ms = slow_request_ms
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -34,6 +45,13 @@ class RequestEventLogMiddleware:
             await self.app(scope, receive, send)
             return
 
+        if self.mode == "full" or (self.mode == "sampled" and random() < self.sample_rate):
+            await self._handle_with_history(scope, receive, send, path)
+            return
+
+        await self._handle_with_summary(scope, receive, send, path)
+
+    async def _handle_with_history(self, scope: Scope, receive: Receive, send: Send, path: str) -> None:
         started_at = perf_counter()
         method = str(scope.get("method", ""))
         request_id = self._extract_or_generate_request_id(scope, header_name=self.request_id_header)
@@ -96,7 +114,7 @@ class RequestEventLogMiddleware:
                 headers = list(message.get("headers", []))
                 headers = self._upsert_header(
                     headers=headers,
-                    key=self.request_id_header.encode("latin-1"),
+                    key=self.request_id_key,
                     value=request_id.encode("latin-1"),
                 )
                 response_metadata = self._decode_response_headers(headers)
@@ -119,21 +137,7 @@ class RequestEventLogMiddleware:
             await self.app(scope, receive, send_wrapper)
         except Exception as error:
             if response_status_code is None:
-                # Ensure a canonical 500 response with request-id header is emitted once.
-                await send_wrapper(
-                    {
-                        "type": "http.response.start",
-                        "status": 500,
-                        "headers": [],
-                    }
-                )
-                await send_wrapper(
-                    {
-                        "type": "http.response.body",
-                        "body": b"Internal Server Error",
-                        "more_body": False,
-                    }
-                )
+                await self._send_internal_server_error(send_wrapper)
 
             ensure_route_resolved()
 
@@ -228,6 +232,120 @@ class RequestEventLogMiddleware:
         finally:
             clear_contextvars()
 
+    async def _handle_with_summary(self, scope: Scope, receive: Receive, send: Send, path: str) -> None:
+        started_at = perf_counter()
+        method = str(scope.get("method", ""))
+        request_id = self._extract_or_generate_request_id(scope, header_name=self.request_id_header)
+        response_status_code: int | None = None
+
+        bind_contextvars(request_id=request_id, http_method=method, http_path=path)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_status_code
+
+            if message["type"] == "http.response.start":
+                response_status_code = int(message.get("status", 200))
+                headers = self._upsert_header(
+                    headers=list(message.get("headers", [])),
+                    key=self.request_id_key,
+                    value=request_id.encode("latin-1"),
+                )
+                message = {**message, "headers": headers}
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as error:
+            if response_status_code is None:
+                await self._send_internal_server_error(send_wrapper)
+
+            self._log_compact_summary(
+                scope,
+                started_at,
+                request_id=request_id,
+                method=method,
+                path=path,
+                status_code=response_status_code or 500,
+                outcome="unhandled_exception",
+                error={"error_class": error.__class__.__name__, "error_message": str(error)},
+            )
+            raise
+        else:
+            status_code = response_status_code or 200
+            error_payload: dict[str, object | None] | None = None
+            if status_code >= 500:
+                error_payload = {
+                    "error_class": None,
+                    "error_message": f"Server error response with status {status_code}",
+                }
+
+            self._log_compact_summary(
+                scope,
+                started_at,
+                request_id=request_id,
+                method=method,
+                path=path,
+                status_code=status_code,
+                outcome=self._status_to_outcome(status_code),
+                error=error_payload,
+            )
+        finally:
+            clear_contextvars()
+
+    def _log_compact_summary(
+        self,
+        scope: Scope,
+        started_at: float,
+        *,
+        request_id: str,
+        method: str,
+        path: str,
+        status_code: int,
+        outcome: str,
+        error: dict[str, object | None] | None,
+    ) -> None:
+        duration_ms = self._elapsed_ms(started_at)
+
+        if self.mode == "sampled" and status_code < 400 and error is None and duration_ms < self.slow_request_ms:
+            return
+
+        route_path, route_name = self._resolve_route(scope)
+
+        self._log_summary(
+            status_code=status_code,
+            had_exception=outcome == "unhandled_exception",
+            logger=request_logger,
+            payload={
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "route_path": route_path,
+                "route_name": route_name,
+                "status_code": status_code,
+                "outcome": outcome,
+                "duration_ms": duration_ms,
+                "error": error,
+            },
+        )
+
+    async def _send_internal_server_error(self, send: Send) -> None:
+        # Ensure a canonical 500 response with request-id header is emitted once.
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"Internal Server Error",
+                "more_body": False,
+            }
+        )
+
     def _extract_or_generate_request_id(self, scope: Scope, header_name: str) -> str:
         request_id = self._extract_header(scope, header_name)
 
@@ -321,12 +439,11 @@ class RequestEventLogMiddleware:
         return client[0]
 
     def _extract_header(self, scope: Scope, header_name: str) -> str | None:
-        lookup = header_name.lower()
+        lookup = header_name.lower().encode("latin-1")
         headers = scope.get("headers", [])
 
         for raw_key, raw_value in headers:
-            key = raw_key.decode("latin-1").lower()
-            if key == lookup:
+            if raw_key.lower() == lookup:
                 return raw_value.decode("latin-1")
 
         return None
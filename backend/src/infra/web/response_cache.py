@@ -0,0 +1,87 @@
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional, TypeVar
+from urllib.parse import urlencode
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from core.port.response_cache import ResponseCache
+from infra.config.config import get_config
+from infra.db.reader import primary_reads
+from infra.utils.compression import ContentEncoding, compress_body, negotiate_encoding
+from infra.web.json_encoder import encode_response
+
+T = TypeVar("T")
+
+
+def response_cache_key(route: str, **params: Any) -> str:
+    return f"{route}?{urlencode(sorted(params.items()))}"
+
+
+async def cached_json(
+    cache: ResponseCache,
+    key: str,
+    load: Callable[[], Awaitable[T]],
+    response_model: type[BaseModel],
+    tags: Callable[[T], Iterable[str]],
+    accept_encoding: Optional[str] = None,
+    media_type: str = "application/json",
+) -> Response:
+    compression = get_config().COMPRESSION_CONFIG
+    encoding = negotiate_encoding(accept_encoding) if compression.ENABLED else None
+    encoded_key = f"{key}|{encoding.value}" if encoding is not None else key
+
+    generation = await cache.generation()
+
+    if encoding is not None:
+        body = await cache.get(encoded_key)
+
+        if body is not None:
+            return _json_response(body, encoding, media_type)
+
+    body = await cache.get(key)
+
+    if body is not None:
+        if encoding is None or len(body) < compression.MINIMUM_SIZE:
+            return _json_response(body, None, media_type)
+
+        body_tags = await cache.tags(key)
+
+        if body_tags is not None:
+            return await _compressed_response(cache, encoded_key, body, encoding, body_tags, generation, media_type)
+
+    with primary_reads():
+        content = await load()
+    body = encode_response(response_model, content)
+    content_tags = set(tags(content))
+
+    await cache.set(key, body, content_tags, generation)
+
+    if encoding is None or len(body) < compression.MINIMUM_SIZE:
+        return _json_response(body, None, media_type)
+
+    return await _compressed_response(cache, encoded_key, body, encoding, content_tags, generation, media_type)
+
+
+async def _compressed_response(
+    cache: ResponseCache,
+    encoded_key: str,
+    body: bytes,
+    encoding: ContentEncoding,
+    tags: Iterable[str],
+    generation: int,
+    media_type: str,
+) -> Response:
+    body = await compress_body(body, encoding, get_config().COMPRESSION_CONFIG.OFFLOAD_SIZE)
+    await cache.set(encoded_key, body, tags, generation)
+
+    return _json_response(body, encoding, media_type)
+
+
+def _json_response(body: bytes, encoding: Optional[ContentEncoding], media_type: str) -> Response:
+    headers = {"Vary": "Accept-Encoding"}
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding.value
+
+    return Response(content=body, media_type=media_type, headers=headers)
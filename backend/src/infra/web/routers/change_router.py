@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from core.domain.change_set import ChangeSet
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.postgres_component_repository import get_component_repository
+from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.postgres_product_repository import get_product_repository
+from infra.web.routers.schemas.change import ChangeSetResponseDTO
+from use_cases.change.get_changes_use_case import GetChangesUseCase
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+@router.get(
+    "",
+    response_model=ChangeSetResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Get products, components and today's day bars changed since a version",
+)
+async def get_changes(since: int = Query(..., ge=0)) -> ChangeSet:
+    use_case = GetChangesUseCase(
+        change_tracker=get_change_tracker(),
+        product_repository=get_product_repository(),
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
+    )
+
+    try:
+        return await use_case.execute(since)
+    except EventLogExpiredError:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"Version {since} is no longer retained, resync from the full listing",
+        )
@@ -1,22 +1,41 @@
-from fastapi import APIRouter, HTTPException, Query, status
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 
 from core.domain.component import Component
-from core.domain.page import Page
+from core.domain.cursor_page import CursorPage
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.healthcheck_rollup import HealthcheckHistory
+from core.domain.rollup_resolution import RollupResolution
 from core.exceptions.component_already_exists_error import ComponentAlreadyExistsError
 from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_cursor_error import InvalidCursorError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_response_cache import get_response_cache
 from infra.adapter.postgres_component_repository import get_component_repository
 from infra.adapter.postgres_log_repository import get_log_repository
+from infra.utils.cache_tags import component_tags, product_tag
+from infra.web.day_bars import COLUMNAR_MEDIA_TYPE, DayBarsFormat, negotiate_day_bars_format
+from infra.web.etag import etag_matches, listing_etag, not_modified, set_etag
+from infra.web.response_cache import cached_json, response_cache_key
 from infra.web.routers.schemas.component import (
+    ColumnarComponentResponseDTO,
     ComponentCreateDTO,
+    ComponentHistoryResponseDTO,
     ComponentResponseDTO,
     ComponentUpdateDTO,
+    HealthcheckLogResponseDTO,
 )
-from infra.web.routers.schemas.page import PageDTO
+from infra.web.routers.schemas.page import CursorPageDTO, PageDTO
 from use_cases.component.create_component_use_case import CreateComponentUseCase
 from use_cases.component.delete_component_use_case import DeleteComponentUseCase
 from use_cases.component.get_all_components_by_product_use_case import (
     GetAllComponentsByProductUseCase,
 )
+from use_cases.component.get_component_checks_use_case import GetComponentChecksUseCase
+from use_cases.component.get_component_history_use_case import GetComponentHistoryUseCase
 from use_cases.component.update_component_use_case import UpdateComponentUseCase
 
 router = APIRouter(prefix="/component", tags=["Component"])
@@ -48,20 +67,112 @@ async def get_all_components(
     product_id: int = Query(...),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1),
-    summary_days: int = Query(default=100, ge=1, le=365),
-) -> Page[Component]:
+    summary_days: int = Query(default=100, ge=0, le=365),
+    include_total: bool = Query(default=True),
+    search: Optional[str] = Query(default=None, max_length=255),
+    day_bars: Optional[DayBarsFormat] = Query(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    accept: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+) -> Response:
+    params = {
+        "product_id": product_id,
+        "page": page,
+        "page_size": page_size,
+        "summary_days": summary_days,
+        "include_total": include_total,
+        "search": search,
+    }
+    bars_format = negotiate_day_bars_format(day_bars, accept)
+    etag = listing_etag(await get_change_tracker().current_version(), **params, day_bars=bars_format.value)
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     use_case = GetAllComponentsByProductUseCase(
         component_repository=get_component_repository(),
         log_repository=get_log_repository(),
     )
+    columnar = bars_format is DayBarsFormat.COLUMNAR
+    response = await cached_json(
+        get_response_cache(),
+        response_cache_key("get_all_components", **params, day_bars=bars_format.value),
+        lambda: use_case.execute(**params),
+        PageDTO[ColumnarComponentResponseDTO] if columnar else PageDTO[ComponentResponseDTO],
+        lambda component_page: {product_tag(product_id), *component_tags(component_page)},
+        accept_encoding,
+        COLUMNAR_MEDIA_TYPE if columnar else "application/json",
+    )
+    response.headers.add_vary_header("Accept")
+    set_etag(response, etag)
+
+    return response
+
+
+@router.get(
+    "/{component_id}/history",
+    response_model=ComponentHistoryResponseDTO,
+    status_code=status.HTTP_200_OK,
+)
+async def get_component_history(
+    component_id: int,
+    since: Optional[datetime] = Query(default=None),
+    until: Optional[datetime] = Query(default=None),
+    resolution: Optional[RollupResolution] = Query(default=None),
+) -> HealthcheckHistory:
+    use_case = GetComponentHistoryUseCase(
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
+    )
+
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=1)
+
+    try:
+        return await use_case.execute(
+            component_id=component_id,
+            since=since,
+            until=until,
+            resolution=resolution,
+        )
+    except ComponentNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Component not found")
+    except InvalidTimeRangeError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
 
-    return await use_case.execute(
-        product_id=product_id,
-        page=page,
-        page_size=page_size,
-        summary_days=summary_days,
+
+@router.get(
+    "/{component_id}/checks",
+    response_model=CursorPageDTO[HealthcheckLogResponseDTO],
+    status_code=status.HTTP_200_OK,
+)
+async def get_component_checks(
+    component_id: int,
+    page_size: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None),
+    since: Optional[datetime] = Query(default=None),
+    until: Optional[datetime] = Query(default=None),
+    outcome: Optional[Literal["SUCCESS", "FAILURE"]] = Query(default=None),
+) -> CursorPage[HealthcheckLog]:
+    use_case = GetComponentChecksUseCase(
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
     )
 
+    try:
+        return await use_case.execute(
+            component_id=component_id,
+            page_size=page_size,
+            cursor=cursor,
+            since=since,
+            until=until,
+            is_successful=None if outcome is None else outcome == "SUCCESS",
+        )
+    except ComponentNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Component not found")
+    except (InvalidCursorError, InvalidTimeRangeError) as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
+
 
 @router.patch(
     "/{component_id}",
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Response, status
+
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_dashboard_cache import get_dashboard_cache
+from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.postgres_product_repository import get_product_repository
+from infra.db.reader import primary_reads
+from infra.web.json_encoder import encode_response
+from infra.web.routers.schemas.dashboard import DashboardResponseDTO
+from use_cases.dashboard.get_dashboard_use_case import GetDashboardUseCase
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get(
+    "",
+    response_model=DashboardResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Get every visible product with components and day bars",
+)
+async def get_dashboard() -> Response:
+    dashboard_cache = get_dashboard_cache()
+    use_case = GetDashboardUseCase(
+        product_repository=get_product_repository(),
+        log_repository=get_log_repository(),
+        change_tracker=get_change_tracker(),
+        dashboard_cache=dashboard_cache,
+    )
+
+    with primary_reads():
+        snapshot = await use_case.execute()
+
+    body = await dashboard_cache.encoded(snapshot, lambda item: encode_response(DashboardResponseDTO, item))
+
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from infra.adapter.postgres_component_repository import get_component_repository
+from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.postgres_product_repository import get_product_repository
+from infra.utils.log_export import ExportFormat, encode_logs
+from use_cases.log.export_logs_use_case import ExportLogsUseCase
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get(
+    "/checks",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Stream raw health checks as NDJSON or CSV",
+)
+async def export_checks(
+    request: Request,
+    component_id: Optional[int] = Query(default=None),
+    product_id: Optional[int] = Query(default=None),
+    since: Optional[datetime] = Query(default=None),
+    until: Optional[datetime] = Query(default=None),
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    use_case = ExportLogsUseCase(
+        product_repository=get_product_repository(),
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
+    )
+
+    try:
+        logs = await use_case.execute(
+            component_id=component_id,
+            product_id=product_id,
+            since=since,
+            until=until,
+        )
+    except ComponentNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Component not found")
+    except ProductNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+    except InvalidTimeRangeError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
+
+    compress = "gzip" in request.headers.get("accept-encoding", "").lower()
+    headers = {
+        "Content-Disposition": f'attachment; filename="health_checks.{export_format.value}"',
+        "Vary": "Accept-Encoding",
+    }
+
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        encode_logs(logs, export_format=export_format, compress=compress),
+        media_type=export_format.media_type,
+        headers=headers,
+    )
@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from core.domain.incident import Incident
+from core.domain.page import Page
+from core.domain.status_type import StatusType
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from infra.adapter.postgres_incident_repository import get_incident_repository
+from infra.web.routers.schemas.incident import IncidentResponseDTO
+from infra.web.routers.schemas.page import PageDTO
+from use_cases.incident.get_incidents_use_case import GetIncidentsUseCase
+
+router = APIRouter(prefix="/incidents", tags=["Incident"])
+
+
+@router.get(
+    "",
+    response_model=PageDTO[IncidentResponseDTO],
+    status_code=status.HTTP_200_OK,
+)
+async def get_incidents(
+    component_id: Optional[int] = Query(default=None),
+    product_id: Optional[int] = Query(default=None),
+    incident_status: Optional[StatusType] = Query(default=None, alias="status"),
+    is_open: Optional[bool] = Query(default=None),
+    since: Optional[datetime] = Query(default=None),
+    until: Optional[datetime] = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=10, ge=1, le=100),
+) -> Page[Incident]:
+    use_case = GetIncidentsUseCase(get_incident_repository())
+
+    try:
+        return await use_case.execute(
+            page=page,
+            page_size=page_size,
+            component_id=component_id,
+            product_id=product_id,
+            status=incident_status,
+            is_open=is_open,
+            since=since,
+            until=until,
+        )
+    except InvalidTimeRangeError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
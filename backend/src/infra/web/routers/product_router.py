@@ -1,12 +1,21 @@
-from fastapi import APIRouter, HTTPException, Query, status
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 
-from core.domain.page import Page
 from core.domain.product import Product
 from core.exceptions.product_not_found_error import ProductNotFoundError
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_response_cache import get_response_cache
 from infra.adapter.postgres_log_repository import get_log_repository
 from infra.adapter.postgres_product_repository import get_product_repository
+from infra.utils.cache_tags import PRODUCT_LIST_TAG, SEARCH_RESULTS_TAG, product_tags
+from infra.web.day_bars import COLUMNAR_MEDIA_TYPE, DayBarsFormat, negotiate_day_bars_format
+from infra.web.etag import etag_matches, listing_etag, not_modified, set_etag
+from infra.web.listing_include import ListingInclude, parse_listing_include
+from infra.web.response_cache import cached_json, response_cache_key
 from infra.web.routers.schemas.page import PageDTO
 from infra.web.routers.schemas.product import (
+    ColumnarProductResponseDTO,
     ProductCreateDTO,
     ProductResponseDTO,
     ProductUpdateDTO,
@@ -41,15 +50,51 @@ async def get_all_products(
     is_visible: bool = Query(default=True),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1),
-    summary_days: int = Query(default=100, ge=1, le=365),
-) -> Page[Product]:
+    summary_days: int = Query(default=100, ge=0, le=365),
+    include_total: bool = Query(default=True),
+    search: Optional[str] = Query(default=None, max_length=255),
+    include: Optional[str] = Query(default=None, max_length=255),
+    day_bars: Optional[DayBarsFormat] = Query(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    accept: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+) -> Response:
+    try:
+        includes = parse_listing_include(include)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
+
+    params = {
+        "is_visible": is_visible,
+        "page": page,
+        "page_size": page_size,
+        "summary_days": summary_days if ListingInclude.SUMMARIES in includes else 0,
+        "include_total": include_total,
+        "search": search,
+        "include_components": ListingInclude.COMPONENTS in includes,
+    }
+    bars_format = negotiate_day_bars_format(day_bars, accept)
+    etag = listing_etag(await get_change_tracker().current_version(), **params, day_bars=bars_format.value)
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     use_case = GetAllProductsUseCase(get_product_repository(), get_log_repository())
-    return await use_case.execute(
-        is_visible=is_visible,
-        page=page,
-        page_size=page_size,
-        summary_days=summary_days,
+    list_tags = {PRODUCT_LIST_TAG, SEARCH_RESULTS_TAG} if search is not None else {PRODUCT_LIST_TAG}
+    columnar = bars_format is DayBarsFormat.COLUMNAR
+    response = await cached_json(
+        get_response_cache(),
+        response_cache_key("get_all_products", **params, day_bars=bars_format.value),
+        lambda: use_case.execute(**params),
+        PageDTO[ColumnarProductResponseDTO] if columnar else PageDTO[ProductResponseDTO],
+        lambda product_page: {*list_tags, *product_tags(product_page)},
+        accept_encoding,
+        COLUMNAR_MEDIA_TYPE if columnar else "application/json",
     )
+    response.headers.add_vary_header("Accept")
+    set_etag(response, etag)
+
+    return response
 
 
 @router.get(
@@ -57,11 +102,18 @@ async def get_all_products(
     response_model=ProductResponseDTO,
     status_code=status.HTTP_200_OK,
 )
-async def get_product_by_id(product_id: int) -> Product:
+async def get_product_by_id(product_id: int, accept_encoding: Optional[str] = Header(default=None)) -> Response:
     use_case = GetProductByIdUseCase(get_product_repository())
 
     try:
-        return await use_case.execute(product_id)
+        return await cached_json(
+            get_response_cache(),
+            response_cache_key("get_product_by_id", product_id=product_id),
+            lambda: use_case.execute(product_id),
+            ProductResponseDTO,
+            lambda product: product_tags([product]),
+            accept_encoding,
+        )
     except ProductNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
@@ -71,11 +123,21 @@ async def get_product_by_id(product_id: int) -> Product:
     response_model=ProductResponseDTO,
     status_code=status.HTTP_200_OK,
 )
-async def get_product_by_name(product_name: str) -> Product:
+async def get_product_by_name(
+    product_name: str,
+    accept_encoding: Optional[str] = Header(default=None),
+) -> Response:
     use_case = GetProductByNameUseCase(get_product_repository())
 
     try:
-        return await use_case.execute(product_name)
+        return await cached_json(
+            get_response_cache(),
+            response_cache_key("get_product_by_name", product_name=product_name),
+            lambda: use_case.execute(product_name),
+            ProductResponseDTO,
+            lambda product: product_tags([product]),
+            accept_encoding,
+        )
     except ProductNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
@@ -0,0 +1,18 @@
+from pydantic import Field
+
+from infra.web.routers.schemas import CamelModel
+from infra.web.routers.schemas.component import ComponentResponseDTO, HealthcheckLogDaySummaryResponseDTO
+from infra.web.routers.schemas.product import ProductResponseDTO
+
+
+class ComponentDaySummaryResponseDTO(HealthcheckLogDaySummaryResponseDTO):
+    component_id: int
+
+
+class ChangeSetResponseDTO(CamelModel):
+    version: int
+    products: list[ProductResponseDTO] = Field(default_factory=list)
+    deleted_product_ids: list[int] = Field(default_factory=list)
+    components: list[ComponentResponseDTO] = Field(default_factory=list)
+    deleted_component_ids: list[int] = Field(default_factory=list)
+    day_summaries: list[ComponentDaySummaryResponseDTO] = Field(default_factory=list)
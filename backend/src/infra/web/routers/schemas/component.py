@@ -1,11 +1,13 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Optional
 from urllib.parse import urlparse
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from core.domain.component_type import ComponentType
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
+from infra.web.day_bars import day_bar_columns
 from infra.web.routers.schemas import CamelModel
 
 
@@ -93,3 +95,65 @@ class ComponentResponseDTO(CamelModel):
     current_status: Optional[StatusType] = None
     is_active: bool
     healthcheck_day_logs: list[HealthcheckLogDaySummaryResponseDTO] = Field(default_factory=list)
+
+
+class HealthcheckDayBarsResponseDTO(CamelModel):
+    start_date: Optional[date] = None
+    count: int = 0
+    total_checks: list[int] = Field(default_factory=list)
+    successful_checks: list[int] = Field(default_factory=list)
+    uptime: list[Optional[float]] = Field(default_factory=list)
+    avg_response_time: list[Optional[int]] = Field(default_factory=list)
+    max_response_time: list[Optional[int]] = Field(default_factory=list)
+    overall_status: list[Optional[int]] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_day_summaries(cls, value: Any) -> Any:
+        if isinstance(value, list):
+            return day_bar_columns(value)
+
+        return value
+
+
+class ColumnarComponentResponseDTO(CamelModel):
+    id: int
+    product_id: int
+    name: str
+    type: ComponentType
+    monitoring_config: MonitoringConfigResponseDTO
+    current_status: Optional[StatusType] = None
+    is_active: bool
+    healthcheck_day_bars: HealthcheckDayBarsResponseDTO = Field(
+        default_factory=HealthcheckDayBarsResponseDTO,
+        validation_alias="healthcheck_day_logs",
+    )
+
+
+class HealthcheckLogResponseDTO(CamelModel):
+    id: Optional[int] = None
+    checked_at: datetime
+    is_successful: bool
+    status_code: Optional[int] = None
+    response_time_ms: int
+    status_before: StatusType
+    status_after: StatusType
+    error_message: Optional[str] = None
+
+
+class HealthcheckRollupResponseDTO(CamelModel):
+    bucket_start: datetime
+    total_checks: int
+    successful_checks: int
+    uptime: float
+    avg_response_time: int
+    max_response_time: int
+    overall_status: StatusType
+
+
+class ComponentHistoryResponseDTO(CamelModel):
+    component_id: int
+    resolution: RollupResolution
+    since: datetime
+    until: datetime
+    buckets: list[HealthcheckRollupResponseDTO] = Field(default_factory=list)
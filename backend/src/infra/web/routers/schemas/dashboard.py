@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import Field
+
+from infra.web.routers.schemas import CamelModel
+from infra.web.routers.schemas.product import ProductResponseDTO
+
+
+class DashboardResponseDTO(CamelModel):
+    version: int
+    generated_at: datetime
+    products: list[ProductResponseDTO] = Field(default_factory=list)
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Optional
+
+from core.domain.status_type import StatusType
+from infra.web.routers.schemas import CamelModel
+
+
+class IncidentResponseDTO(CamelModel):
+    id: int
+    component_id: int
+    started_at: datetime
+    ended_at: Optional[datetime]
+    status: StatusType
+    is_open: bool
+    duration_seconds: Optional[int]
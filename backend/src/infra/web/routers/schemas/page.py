@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from infra.web.routers.schemas.product import CamelModel
 
@@ -8,6 +8,13 @@ T = TypeVar("T")
 class PageDTO(CamelModel, Generic[T]):
     page_size: int
     page_count: int
-    total_elements: int
-    total_pages: int
+    total_elements: Optional[int] = None
+    total_pages: Optional[int] = None
     content: list[T]
+    has_next: bool = False
+
+
+class CursorPageDTO(CamelModel, Generic[T]):
+    page_size: int
+    content: list[T]
+    next_cursor: Optional[str] = None
@@ -4,7 +4,7 @@ from typing import Optional, Self
 from pydantic import Field, model_validator
 
 from infra.web.routers.schemas import CamelModel
-from infra.web.routers.schemas.component import ComponentResponseDTO
+from infra.web.routers.schemas.component import ColumnarComponentResponseDTO, ComponentResponseDTO
 
 
 class ProductCreateDTO(CamelModel):
@@ -37,3 +37,13 @@ class ProductResponseDTO(CamelModel):
     created_at: datetime
     updated_at: datetime
     components: list[ComponentResponseDTO] = Field(default_factory=list)
+
+
+class ColumnarProductResponseDTO(CamelModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    is_visible: bool
+    created_at: datetime
+    updated_at: datetime
+    components: list[ColumnarComponentResponseDTO] = Field(default_factory=list)
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from infra.web.routers.schemas import CamelModel
+
+
+class ComponentSlaResponseDTO(CamelModel):
+    component_id: int
+    total_checks: int
+    successful_checks: int
+    uptime: Optional[float]
+
+
+class SlaReportResponseDTO(CamelModel):
+    since: datetime
+    until: datetime
+    total_checks: int
+    successful_checks: int
+    uptime: Optional[float]
+    components: list[ComponentSlaResponseDTO] = Field(default_factory=list)
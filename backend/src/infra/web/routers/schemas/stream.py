@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from core.domain.status_type import StatusType
+from infra.web.routers.schemas import CamelModel
+
+
+class StatusEventDTO(CamelModel):
+    component_id: int
+    product_id: int
+    previous_status: StatusType
+    status: StatusType
+    changed_at: datetime
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from core.domain.sla_report import SlaReport
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from infra.adapter.postgres_component_repository import get_component_repository
+from infra.adapter.postgres_log_repository import get_log_repository
+from infra.adapter.postgres_product_repository import get_product_repository
+from infra.web.routers.schemas.sla import SlaReportResponseDTO
+from use_cases.log.get_sla_report_use_case import GetSlaReportUseCase
+
+router = APIRouter(prefix="/sla", tags=["SLA"])
+
+
+@router.get(
+    "",
+    response_model=SlaReportResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Get uptime over an arbitrary window",
+)
+async def get_sla_report(
+    component_id: Optional[list[int]] = Query(default=None),
+    product_id: Optional[list[int]] = Query(default=None),
+    since: Optional[datetime] = Query(default=None),
+    until: Optional[datetime] = Query(default=None),
+) -> SlaReport:
+    if not component_id and not product_id:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="At least one component_id or product_id is required",
+        )
+
+    use_case = GetSlaReportUseCase(
+        product_repository=get_product_repository(),
+        component_repository=get_component_repository(),
+        log_repository=get_log_repository(),
+    )
+
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=30)
+
+    try:
+        return await use_case.execute(
+            since=since,
+            until=until,
+            component_ids=component_id,
+            product_ids=product_id,
+        )
+    except ComponentNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Component not found")
+    except ProductNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+    except InvalidTimeRangeError as error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(error))
@@ -7,6 +7,7 @@ import psutil
 from fastapi import APIRouter, Response, status
 
 from infra.config.config import get_config
+from infra.db.session import get_pool_stats
 from infra.utils.formatters import format_bytes, format_time
 
 router = APIRouter(prefix="/stats", tags=["Stats"])
@@ -49,3 +50,13 @@ async def get_health(response: Response):
             "error": str(e),
             "timestamp": time.time(),
         }
+
+
+@router.get(
+    "/db",
+    response_model=dict[str, Any],
+    status_code=status.HTTP_200_OK,
+    summary="Get database connection pool stats",
+)
+async def get_db_stats():
+    return get_pool_stats()
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import APIRouter, Header, Query, status
+from fastapi.responses import StreamingResponse
+
+from core.domain.status_event import StatusEvent
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from core.port.status_event_bus import StatusEventBus
+from infra.adapter.memory_status_event_bus import get_status_event_bus
+from infra.config.config import get_config
+from infra.utils.sse import HEARTBEAT, encode_event, encode_retry
+from infra.web.routers.schemas.stream import StatusEventDTO
+
+STREAM_RETRY_MS = 3000
+
+router = APIRouter(prefix="/stream", tags=["Stream"])
+
+
+@router.get(
+    "/status",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Stream component status changes as Server-Sent Events",
+)
+async def stream_status(
+    product_id: list[int] = Query(default=[]),
+    last_event_id: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    bus = get_status_event_bus()
+
+    return StreamingResponse(
+        stream_status_events(
+            bus,
+            product_ids=set(product_id),
+            last_event_id=last_event_id or bus.latest_event_id(),
+            heartbeat_seconds=get_config().STREAM_CONFIG.HEARTBEAT_SECONDS,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def stream_status_events(
+    bus: StatusEventBus,
+    product_ids: set[int],
+    last_event_id: str,
+    heartbeat_seconds: float,
+) -> AsyncIterator[bytes]:
+    yield encode_retry(STREAM_RETRY_MS)
+
+    cursor = last_event_id
+
+    while True:
+        try:
+            events = await bus.read_after(cursor, timeout_seconds=heartbeat_seconds)
+        except EventLogExpiredError:
+            cursor = bus.latest_event_id()
+            yield encode_event("resync", "{}", event_id=cursor)
+            continue
+
+        if not events:
+            yield HEARTBEAT
+            continue
+
+        cursor = events[-1].id
+
+        for event in events:
+            if not product_ids or event.product_id in product_ids:
+                yield _encode_status_event(event)
+
+
+@lru_cache(maxsize=1024)
+def _encode_status_event(event: StatusEvent) -> bytes:
+    return encode_event("status", StatusEventDTO.model_validate(event).model_dump_json(by_alias=True), event.id)
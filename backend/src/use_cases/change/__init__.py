@@ -0,0 +1,5 @@
+from use_cases.change.get_changes_use_case import GetChangesUseCase
+
+__all__ = [
+    "GetChangesUseCase",
+]
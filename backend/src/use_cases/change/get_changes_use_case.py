@@ -0,0 +1,56 @@
+from core.domain.change import ChangeKind
+from core.domain.change_set import ChangeSet
+from core.port.change_tracker import ChangeTracker
+from core.port.component_repository import ComponentRepository
+from core.port.log_repository import LogRepository
+from core.port.product_repository import ProductRepository
+
+
+class GetChangesUseCase:
+    def __init__(
+        self,
+        change_tracker: ChangeTracker,
+        product_repository: ProductRepository,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+    ) -> None:
+        self.change_tracker = change_tracker
+        self.product_repository = product_repository
+        self.component_repository = component_repository
+        self.log_repository = log_repository
+
+    async def execute(self, since: int) -> ChangeSet:
+        version, changes = await self.change_tracker.changes_since(since)
+        changed_ids: dict[ChangeKind, dict[int, None]] = {kind: {} for kind in ChangeKind}
+
+        for change in changes:
+            changed_ids[change.kind][change.entity_id] = None
+
+        change_set = ChangeSet(version=version)
+
+        for product_id in changed_ids[ChangeKind.PRODUCT]:
+            product = await self.product_repository.find_by_id(product_id)
+
+            if product is None:
+                change_set.deleted_product_ids.append(product_id)
+            else:
+                change_set.products.append(product)
+
+        component_ids = list(changed_ids[ChangeKind.COMPONENT])
+        change_set.components = await self.component_repository.find_all_by_ids(component_ids)
+        found_component_ids = {component.id for component in change_set.components}
+        change_set.deleted_component_ids = [
+            component_id for component_id in component_ids if component_id not in found_component_ids
+        ]
+
+        summary_component_ids = list(changed_ids[ChangeKind.DAY_SUMMARY])
+        if summary_component_ids:
+            summaries = await self.log_repository.get_last_n_day_summary_bulk(
+                component_ids=summary_component_ids,
+                last_n_days=1,
+            )
+            change_set.day_summaries = [
+                summary for component_id in summary_component_ids for summary in summaries.get(component_id, [])
+            ]
+
+        return change_set
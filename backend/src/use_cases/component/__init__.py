@@ -1,11 +1,15 @@
 from use_cases.component.create_component_use_case import CreateComponentUseCase
 from use_cases.component.delete_component_use_case import DeleteComponentUseCase
 from use_cases.component.get_all_components_by_product_use_case import GetAllComponentsByProductUseCase
+from use_cases.component.get_component_checks_use_case import GetComponentChecksUseCase
+from use_cases.component.get_component_history_use_case import GetComponentHistoryUseCase
 from use_cases.component.update_component_use_case import UpdateComponentUseCase
 
 __all__ = [
     "CreateComponentUseCase",
     "DeleteComponentUseCase",
     "GetAllComponentsByProductUseCase",
+    "GetComponentChecksUseCase",
+    "GetComponentHistoryUseCase",
     "UpdateComponentUseCase",
 ]
@@ -1,4 +1,5 @@
 from dataclasses import replace
+from typing import Optional
 
 from core.domain.component import Component
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
@@ -16,7 +17,15 @@ class GetAllComponentsByProductUseCase:
         self.component_repository = component_repository
         self.log_repository = log_repository
 
-    async def execute(self, product_id: int, page: int, page_size: int, summary_days: int = 100) -> Page[Component]:
+    async def execute(
+        self,
+        product_id: int,
+        page: int,
+        page_size: int,
+        summary_days: int = 100,
+        include_total: bool = True,
+        search: Optional[str] = None,
+    ) -> Page[Component]:
         if page < 1:
             page = 1
 
@@ -27,12 +36,14 @@ class GetAllComponentsByProductUseCase:
             product_id=product_id,
             page=page,
             page_size=page_size,
+            include_total=include_total,
+            search=(search or "").strip() or None,
         )
         component_ids = [component.id for component in component_page if component.id is not None]
         deduped_component_ids = list(dict.fromkeys(component_ids))
         summary_by_component: dict[int, list[HealthcheckLogDaySummary]] = {}
 
-        if deduped_component_ids:
+        if deduped_component_ids and summary_days > 0:
             summary_by_component = await self.log_repository.get_last_n_day_summary_bulk(
                 component_ids=deduped_component_ids,
                 last_n_days=summary_days,
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.domain.cursor_page import CursorPage
+from core.domain.healthcheck_log import HealthcheckLog
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.port.component_repository import ComponentRepository
+from core.port.log_repository import LogRepository
+
+
+class GetComponentChecksUseCase:
+    def __init__(
+        self,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+    ) -> None:
+        self.component_repository = component_repository
+        self.log_repository = log_repository
+
+    async def execute(
+        self,
+        component_id: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        is_successful: Optional[bool] = None,
+    ) -> CursorPage[HealthcheckLog]:
+        if page_size < 1:
+            page_size = 50
+
+        if since is not None:
+            since = self._as_utc(since)
+
+        if until is not None:
+            until = self._as_utc(until)
+
+        if since is not None and until is not None and since >= until:
+            raise InvalidTimeRangeError("'since' must be earlier than 'until'")
+
+        component = await self.component_repository.find_by_id(component_id)
+
+        if not component:
+            raise ComponentNotFoundError
+
+        return await self.log_repository.get_logs_page(
+            component_id=component_id,
+            page_size=page_size,
+            cursor=cursor,
+            since=since,
+            until=until,
+            is_successful=is_successful,
+        )
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value.astimezone(timezone.utc)
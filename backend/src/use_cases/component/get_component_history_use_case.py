@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.domain.healthcheck_rollup import HealthcheckHistory
+from core.domain.rollup_resolution import RollupResolution
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.port.component_repository import ComponentRepository
+from core.port.log_repository import LogRepository
+
+MAX_HISTORY_POINTS = 1_440
+
+
+class GetComponentHistoryUseCase:
+    def __init__(
+        self,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+    ) -> None:
+        self.component_repository = component_repository
+        self.log_repository = log_repository
+
+    async def execute(
+        self,
+        component_id: int,
+        since: datetime,
+        until: datetime,
+        resolution: Optional[RollupResolution] = None,
+    ) -> HealthcheckHistory:
+        since = self._as_utc(since)
+        until = self._as_utc(until)
+
+        if since >= until:
+            raise InvalidTimeRangeError("'since' must be earlier than 'until'")
+
+        if resolution is None:
+            resolution = self._select_resolution(since, until)
+        elif resolution.bucket_count(since, until) > MAX_HISTORY_POINTS:
+            raise InvalidTimeRangeError(
+                f"Range spans more than {MAX_HISTORY_POINTS} {resolution.value.lower()} buckets, "
+                "use a coarser resolution"
+            )
+
+        component = await self.component_repository.find_by_id(component_id)
+
+        if not component:
+            raise ComponentNotFoundError
+
+        buckets = await self.log_repository.get_rollups(
+            component_id=component_id,
+            resolution=resolution,
+            since=since,
+            until=until,
+        )
+
+        return HealthcheckHistory(
+            component_id=component_id,
+            resolution=resolution,
+            since=since,
+            until=until,
+            buckets=buckets,
+        )
+
+    def _select_resolution(self, since: datetime, until: datetime) -> RollupResolution:
+        for resolution in RollupResolution:
+            if resolution.bucket_count(since, until) <= MAX_HISTORY_POINTS:
+                return resolution
+
+        return RollupResolution.DAY
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value.astimezone(timezone.utc)
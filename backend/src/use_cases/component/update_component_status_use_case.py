@@ -1,18 +1,30 @@
 import asyncio
 from dataclasses import replace
+from typing import Optional
 
 from core.domain.component import Component
 from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.incident import Incident
 from core.domain.status_type import StatusType
 from core.exceptions.component_not_found_error import ComponentNotFoundError
 from core.port.component_repository import ComponentRepository
+from core.port.incident_repository import IncidentRepository
 from core.port.log_repository import LogRepository
+from core.port.status_event_bus import StatusEventBus
 
 
 class UpdateComponentStatusUseCase:
-    def __init__(self, component_repository: ComponentRepository, log_repository: LogRepository) -> None:
+    def __init__(
+        self,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+        incident_repository: IncidentRepository,
+        status_event_bus: Optional[StatusEventBus] = None,
+    ) -> None:
         self.component_repository = component_repository
         self.log_repository = log_repository
+        self.incident_repository = incident_repository
+        self.status_event_bus = status_event_bus
 
     async def execute(
         self,
@@ -25,13 +37,37 @@ class UpdateComponentStatusUseCase:
         if not component:
             raise ComponentNotFoundError
 
+        previous_status = component.current_status or StatusType.OPERATIONAL
         updated_component = replace(component, current_status=current_status)
 
-        await asyncio.gather(
-            *[
-                self.component_repository.save(updated_component),
-                self.log_repository.add_log(new_log),
-            ]
+        saved_component, _, _ = await asyncio.gather(
+            self.component_repository.save(updated_component),
+            self.log_repository.add_log(new_log),
+            self._track_incident(previous_status, new_log),
         )
 
-        return await self.component_repository.save(updated_component)
+        if self.status_event_bus is not None and previous_status is not current_status:
+            await self.status_event_bus.publish(
+                component_id=component_id,
+                product_id=saved_component.product_id,
+                previous_status=previous_status,
+                status=current_status,
+                changed_at=new_log.checked_at,
+            )
+
+        return saved_component
+
+    async def _track_incident(self, previous_status: StatusType, new_log: HealthcheckLog) -> None:
+        if previous_status is StatusType.OPERATIONAL and new_log.status_after is StatusType.OPERATIONAL:
+            return
+
+        open_incident = await self.incident_repository.find_open(new_log.component_id)
+
+        if open_incident is None:
+            if new_log.status_after is not StatusType.OPERATIONAL:
+                await self.incident_repository.save(Incident.open_from(new_log))
+
+            return
+
+        if open_incident.absorb(new_log):
+            await self.incident_repository.save(open_incident)
@@ -0,0 +1,5 @@
+from use_cases.dashboard.get_dashboard_use_case import GetDashboardUseCase
+
+__all__ = [
+    "GetDashboardUseCase",
+]
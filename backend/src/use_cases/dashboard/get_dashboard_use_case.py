@@ -0,0 +1,55 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from core.domain.dashboard_snapshot import DashboardSnapshot
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.port.change_tracker import ChangeTracker
+from core.port.dashboard_cache import DashboardCache
+from core.port.log_repository import LogRepository
+from core.port.product_repository import ProductRepository
+
+DASHBOARD_SUMMARY_DAYS = 100
+
+
+class GetDashboardUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        log_repository: LogRepository,
+        change_tracker: ChangeTracker,
+        dashboard_cache: DashboardCache,
+    ) -> None:
+        self.product_repository = product_repository
+        self.log_repository = log_repository
+        self.change_tracker = change_tracker
+        self.dashboard_cache = dashboard_cache
+
+    async def execute(self) -> DashboardSnapshot:
+        version = await self.change_tracker.current_version()
+
+        return await self.dashboard_cache.get_or_build(version, lambda: self._build(version))
+
+    async def _build(self, version: int) -> DashboardSnapshot:
+        products = await self.product_repository.find_all_without_pagination(is_visible=True)
+        component_ids = list(
+            dict.fromkeys(
+                component.id for product in products for component in product.components if component.id is not None
+            )
+        )
+        summary_by_component: dict[int, list[HealthcheckLogDaySummary]] = {}
+
+        if component_ids:
+            summary_by_component = await self.log_repository.get_last_n_day_summary_bulk(
+                component_ids=component_ids,
+                last_n_days=DASHBOARD_SUMMARY_DAYS,
+            )
+
+        for product in products:
+            product.components = [
+                replace(component, healthcheck_day_logs=summary_by_component.get(component.id, []))
+                if component.id is not None
+                else component
+                for component in product.components
+            ]
+
+        return DashboardSnapshot(version=version, generated_at=datetime.now(timezone.utc), products=products)
@@ -0,0 +1,7 @@
+from use_cases.incident.backfill_incidents_use_case import BackfillIncidentsUseCase
+from use_cases.incident.get_incidents_use_case import GetIncidentsUseCase
+
+__all__ = [
+    "BackfillIncidentsUseCase",
+    "GetIncidentsUseCase",
+]
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from core.domain.incident import Incident
+from core.domain.status_type import StatusType
+from core.port.incident_repository import IncidentRepository
+from core.port.log_repository import LogRepository
+
+
+class BackfillIncidentsUseCase:
+    def __init__(self, log_repository: LogRepository, incident_repository: IncidentRepository) -> None:
+        self.log_repository = log_repository
+        self.incident_repository = incident_repository
+
+    async def execute(self, component_ids: Optional[list[int]] = None) -> int:
+        current_component_id: Optional[int] = None
+        open_incident: Optional[Incident] = None
+        incidents: list[Incident] = []
+        written = 0
+
+        async for log in self.log_repository.stream_logs(component_ids=component_ids):
+            if log.component_id != current_component_id:
+                if current_component_id is not None:
+                    await self.incident_repository.replace_for_component(current_component_id, incidents)
+                    written += len(incidents)
+
+                current_component_id = log.component_id
+                open_incident = None
+                incidents = []
+
+            if open_incident is None:
+                if log.status_after is not StatusType.OPERATIONAL:
+                    open_incident = Incident.open_from(log)
+                    incidents.append(open_incident)
+
+                continue
+
+            open_incident.absorb(log)
+
+            if not open_incident.is_open:
+                open_incident = None
+
+        if current_component_id is not None:
+            await self.incident_repository.replace_for_component(current_component_id, incidents)
+            written += len(incidents)
+
+        return written
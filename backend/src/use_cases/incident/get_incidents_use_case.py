@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.domain.incident import Incident
+from core.domain.page import Page
+from core.domain.status_type import StatusType
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.port.incident_repository import IncidentRepository
+
+
+class GetIncidentsUseCase:
+    def __init__(self, incident_repository: IncidentRepository) -> None:
+        self.incident_repository = incident_repository
+
+    async def execute(
+        self,
+        page: int,
+        page_size: int,
+        component_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        status: Optional[StatusType] = None,
+        is_open: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Page[Incident]:
+        if page < 1:
+            page = 1
+
+        if page_size < 1:
+            page_size = 10
+
+        if since is not None:
+            since = self._as_utc(since)
+
+        if until is not None:
+            until = self._as_utc(until)
+
+        if since is not None and until is not None and since >= until:
+            raise InvalidTimeRangeError("'since' must be earlier than 'until'")
+
+        return await self.incident_repository.find_all(
+            page=page,
+            page_size=page_size,
+            component_id=component_id,
+            product_id=product_id,
+            status=status,
+            is_open=is_open,
+            since=since,
+            until=until,
+        )
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value.astimezone(timezone.utc)
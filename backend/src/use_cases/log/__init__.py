@@ -0,0 +1,11 @@
+from use_cases.log.archive_logs_use_case import ArchiveLogsUseCase
+from use_cases.log.export_logs_use_case import ExportLogsUseCase
+from use_cases.log.get_sla_report_use_case import GetSlaReportUseCase
+from use_cases.log.import_logs_use_case import ImportLogsUseCase
+
+__all__ = [
+    "ArchiveLogsUseCase",
+    "ExportLogsUseCase",
+    "GetSlaReportUseCase",
+    "ImportLogsUseCase",
+]
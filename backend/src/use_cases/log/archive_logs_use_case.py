@@ -0,0 +1,90 @@
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.port.log_archive import LogArchive
+from core.port.log_repository import LogRepository
+
+
+class ArchiveLogsUseCase:
+    def __init__(self, log_repository: LogRepository, log_archive: LogArchive) -> None:
+        self.log_repository = log_repository
+        self.log_archive = log_archive
+
+    async def execute(self, retention_days: int, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        cutoff = self._start_of_day(now) - timedelta(days=retention_days)
+
+        archivable_components = await self.log_repository.find_archivable_components(until=cutoff)
+        archived_rows = 0
+
+        for component_id, oldest_checked_at in sorted(archivable_components.items()):
+            archived_until = await self.log_archive.archived_until(component_id)
+            day_start = self._start_of_day(oldest_checked_at)
+
+            while day_start < cutoff:
+                day_end = day_start + timedelta(days=1)
+                logs = await self.log_repository.get_logs_between(component_id, since=day_start, until=day_end)
+
+                if logs:
+                    pending = logs
+                    if archived_until is not None and archived_until >= day_start:
+                        pending = await self._not_yet_archived(component_id, logs, day_start, day_end)
+
+                    if pending:
+                        await self.log_archive.write_segment(component_id, pending)
+                        archived_rows += len(pending)
+
+                    await self.log_repository.delete_logs(
+                        component_id,
+                        [log.id for log in logs if log.id is not None],
+                    )
+
+                day_start = day_end
+
+        return archived_rows
+
+    async def _not_yet_archived(
+        self,
+        component_id: int,
+        logs: list[HealthcheckLog],
+        day_start: datetime,
+        day_end: datetime,
+    ) -> list[HealthcheckLog]:
+        archived = Counter(
+            self._log_key(log)
+            for log in await self.log_archive.read_logs(component_id, since=day_start, until=day_end)
+        )
+        pending: list[HealthcheckLog] = []
+
+        for log in logs:
+            key = self._log_key(log)
+
+            if archived[key] > 0:
+                archived[key] -= 1
+            else:
+                pending.append(log)
+
+        return pending
+
+    def _log_key(self, log: HealthcheckLog) -> tuple[object, ...]:
+        checked_at = log.checked_at
+        if checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=timezone.utc)
+
+        return (
+            checked_at.astimezone(timezone.utc),
+            log.is_successful,
+            log.status_code,
+            log.response_time_ms,
+            log.status_before,
+            log.status_after,
+            log.error_message,
+        )
+
+    def _start_of_day(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+
+        return datetime.combine(value.astimezone(timezone.utc).date(), time.min, tzinfo=timezone.utc)
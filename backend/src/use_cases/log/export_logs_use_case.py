@@ -0,0 +1,90 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Optional
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from core.port.component_repository import ComponentRepository
+from core.port.log_repository import LogRepository
+from core.port.product_repository import ProductRepository
+
+PRODUCT_COMPONENTS_PAGE_SIZE = 100
+
+
+class ExportLogsUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+    ) -> None:
+        self.product_repository = product_repository
+        self.component_repository = component_repository
+        self.log_repository = log_repository
+
+    async def execute(
+        self,
+        component_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[HealthcheckLog]:
+        if since is not None:
+            since = self._as_utc(since)
+
+        if until is not None:
+            until = self._as_utc(until)
+
+        if since is not None and until is not None and since >= until:
+            raise InvalidTimeRangeError("'since' must be earlier than 'until'")
+
+        component_ids: Optional[list[int]] = None
+
+        if component_id is not None:
+            component = await self.component_repository.find_by_id(component_id)
+
+            if not component or (product_id is not None and component.product_id != product_id):
+                raise ComponentNotFoundError
+
+            component_ids = [component_id]
+        elif product_id is not None:
+            component_ids = await self._product_component_ids(product_id)
+
+        return self.log_repository.stream_logs(
+            component_ids=component_ids,
+            since=since,
+            until=until,
+            batch_size=batch_size,
+        )
+
+    async def _product_component_ids(self, product_id: int) -> list[int]:
+        product = await self.product_repository.find_by_id(product_id)
+
+        if not product:
+            raise ProductNotFoundError
+
+        component_ids: list[int] = []
+        page = 1
+
+        while True:
+            component_page = await self.component_repository.find_all_by_product_id(
+                product_id=product_id,
+                page=page,
+                page_size=PRODUCT_COMPONENTS_PAGE_SIZE,
+                include_total=False,
+            )
+            component_ids.extend(component.id for component in component_page if component.id is not None)
+
+            if not component_page.has_next:
+                return component_ids
+
+            page += 1
+
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+
+        return value.astimezone(timezone.utc)
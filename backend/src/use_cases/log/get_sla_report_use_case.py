@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Optional
+
+from core.domain.rollup_resolution import RollupResolution
+from core.domain.sla_report import ComponentSla, SlaReport
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from core.port.component_repository import ComponentRepository
+from core.port.log_repository import LogRepository
+from core.port.product_repository import ProductRepository
+
+
+class GetSlaReportUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        component_repository: ComponentRepository,
+        log_repository: LogRepository,
+    ) -> None:
+        self.product_repository = product_repository
+        self.component_repository = component_repository
+        self.log_repository = log_repository
+
+    async def execute(
+        self,
+        since: datetime,
+        until: datetime,
+        component_ids: Optional[list[int]] = None,
+        product_ids: Optional[list[int]] = None,
+    ) -> SlaReport:
+        since = RollupResolution.MINUTE.bucket_start(since)
+        until = RollupResolution.MINUTE.bucket_start(until)
+
+        if since >= until:
+            raise InvalidTimeRangeError("The window must span at least one full minute")
+
+        resolved_component_ids: list[int] = []
+
+        for component_id in component_ids or []:
+            if not await self.component_repository.find_by_id(component_id):
+                raise ComponentNotFoundError
+
+            resolved_component_ids.append(component_id)
+
+        for product_id in product_ids or []:
+            product = await self.product_repository.find_by_id(product_id)
+
+            if not product:
+                raise ProductNotFoundError
+
+            resolved_component_ids.extend(component.id for component in product.components if component.id is not None)
+
+        deduped_component_ids = list(dict.fromkeys(resolved_component_ids))
+        counts = await self.log_repository.get_check_counts(deduped_component_ids, since=since, until=until)
+
+        components: list[ComponentSla] = []
+
+        for component_id in deduped_component_ids:
+            component_checks, component_successful_checks = counts.get(component_id, (0, 0))
+            components.append(
+                ComponentSla(
+                    component_id=component_id,
+                    total_checks=component_checks,
+                    successful_checks=component_successful_checks,
+                    uptime=self._uptime(component_checks, component_successful_checks),
+                )
+            )
+
+        total_checks = sum(component.total_checks for component in components)
+        successful_checks = sum(component.successful_checks for component in components)
+
+        return SlaReport(
+            since=since,
+            until=until,
+            total_checks=total_checks,
+            successful_checks=successful_checks,
+            uptime=self._uptime(total_checks, successful_checks),
+            components=components,
+        )
+
+    def _uptime(self, total_checks: int, successful_checks: int) -> Optional[float]:
+        if not total_checks:
+            return None
+
+        return round((successful_checks / total_checks) * 100, 4)
@@ -0,0 +1,28 @@
+from collections.abc import Iterable
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.port.log_repository import LogRepository
+
+
+class ImportLogsUseCase:
+    def __init__(
+        self,
+        log_repository: LogRepository,
+    ) -> None:
+        self.log_repository = log_repository
+
+    async def execute(self, logs: Iterable[HealthcheckLog], batch_size: int = 5000) -> int:
+        imported = 0
+        batch: list[HealthcheckLog] = []
+
+        for log in logs:
+            batch.append(log)
+
+            if len(batch) >= batch_size:
+                imported += await self.log_repository.add_logs(batch)
+                batch = []
+
+        if batch:
+            imported += await self.log_repository.add_logs(batch)
+
+        return imported
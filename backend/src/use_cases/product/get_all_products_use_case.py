@@ -1,4 +1,5 @@
 from dataclasses import replace
+from typing import Optional
 
 from core.domain.component import Component
 from core.domain.page import Page
@@ -17,18 +18,41 @@ class GetAllProductsUseCase:
         self.product_repository = product_repository
         self.log_repository = log_repository
 
-    async def execute(self, is_visible: bool, page: int, page_size: int, summary_days: int = 100) -> Page[Product]:
+    async def execute(
+        self,
+        is_visible: bool,
+        page: int,
+        page_size: int,
+        summary_days: int = 100,
+        include_total: bool = True,
+        search: Optional[str] = None,
+        include_components: bool = True,
+    ) -> Page[Product]:
         if page < 1:
             page = 1
 
         if page_size < 1:
             page_size = 10
 
-        products_page = await self.product_repository.find_all(is_visible=is_visible, page=page, page_size=page_size)
+        search = (search or "").strip() or None
+
+        products_page = await self.product_repository.find_all(
+            is_visible=is_visible,
+            page=page,
+            page_size=page_size,
+            include_total=include_total,
+            search=search,
+            include_components=include_components,
+        )
+
+        if search is not None:
+            for product in products_page:
+                product.components = self._matching_components(product, search)
+
         component_ids = self._collect_component_ids(products_page)
         summary_by_component: dict[int, list[HealthcheckLogDaySummary]] = {}
 
-        if component_ids:
+        if component_ids and summary_days > 0:
             summary_by_component = await self.log_repository.get_last_n_day_summary_bulk(
                 component_ids=component_ids,
                 last_n_days=summary_days,
@@ -52,6 +76,14 @@ class GetAllProductsUseCase:
 
         return replace(component, healthcheck_day_logs=summary_by_component.get(component.id, []))
 
+    def _matching_components(self, product: Product, search: str) -> list[Component]:
+        term = search.casefold()
+
+        if term in product.name.casefold():
+            return product.components
+
+        return [component for component in product.components if term in component.name.casefold()]
+
     def _collect_component_ids(self, products_page: Page[Product]) -> list[int]:
         component_ids = [
             component.id
@@ -9,6 +9,10 @@ from sqlalchemy.pool import StaticPool
 import infra.db.session as db_session
 from infra.adapter.dict_component_cache import get_dict_component_cache
 from infra.adapter.local_scheduler import get_local_scheduler
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_count_cache import get_count_cache
+from infra.adapter.memory_response_cache import get_response_cache
+from infra.adapter.memory_status_event_bus import get_status_event_bus
 from infra.adapter.postgres_component_repository import get_component_repository
 from infra.adapter.postgres_log_repository import get_log_repository
 from infra.adapter.postgres_product_repository import get_product_repository
@@ -33,11 +37,20 @@ def _reset_cached_singletons() -> AsyncGenerator[None, None]:
         get_config,
         db_session.get_engine,
         db_session.get_session_factory,
+        db_session.get_session_writer,
+        db_session.get_read_engine,
+        db_session.get_read_session_factory,
+        db_session.get_session_reader,
+        db_session.get_pool_metrics,
         get_product_repository,
         get_component_repository,
         get_log_repository,
         get_dict_component_cache,
         get_local_scheduler,
+        get_count_cache,
+        get_change_tracker,
+        get_response_cache,
+        get_status_event_bus,
     ]
 
     for cacheable in cacheables:
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta, timezone
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.incident import Incident
+from core.domain.status_type import StatusType
+
+START = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _log(minute: int, status: StatusType) -> HealthcheckLog:
+    return HealthcheckLog(
+        component_id=3,
+        checked_at=START + timedelta(minutes=minute),
+        is_successful=status is StatusType.OPERATIONAL,
+        status_code=None,
+        response_time_ms=10,
+        status_before=StatusType.OPERATIONAL,
+        status_after=status,
+        error_message=None,
+    )
+
+
+def test_incident_keeps_worst_status_until_recovery() -> None:
+    incident = Incident.open_from(_log(0, StatusType.DEGRADED))
+
+    assert incident.is_open
+    assert incident.duration_seconds is None
+    assert incident.absorb(_log(1, StatusType.OUTAGE)) is True
+    assert incident.absorb(_log(2, StatusType.DEGRADED)) is False
+    assert incident.absorb(_log(3, StatusType.OPERATIONAL)) is True
+    assert incident.status is StatusType.OUTAGE
+    assert not incident.is_open
+    assert incident.duration_seconds == 180
@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, timezone
+
+from core.domain.rollup_resolution import RollupResolution
+
+
+def test_bucket_start_truncates_to_resolution() -> None:
+    value = datetime(2026, 5, 4, 13, 47, 21, 500, tzinfo=timezone.utc)
+
+    assert RollupResolution.MINUTE.bucket_start(value) == datetime(2026, 5, 4, 13, 47, tzinfo=timezone.utc)
+    assert RollupResolution.HOUR.bucket_start(value) == datetime(2026, 5, 4, 13, tzinfo=timezone.utc)
+    assert RollupResolution.DAY.bucket_start(value) == datetime(2026, 5, 4, tzinfo=timezone.utc)
+
+
+def test_bucket_start_treats_naive_values_as_utc() -> None:
+    assert RollupResolution.HOUR.bucket_start(datetime(2026, 5, 4, 13, 47)) == datetime(
+        2026, 5, 4, 13, tzinfo=timezone.utc
+    )
+
+
+def test_bucket_count_includes_partial_edges() -> None:
+    since = datetime(2026, 5, 4, 13, 30, tzinfo=timezone.utc)
+
+    assert RollupResolution.HOUR.bucket_count(since, since + timedelta(hours=2)) == 3
+    assert RollupResolution.DAY.bucket_count(since, since + timedelta(hours=2)) == 1
@@ -0,0 +1,37 @@
+import pytest
+
+from core.domain.change import Change, ChangeKind
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+
+
+@pytest.mark.asyncio
+async def test_changes_since_returns_changes_recorded_after_the_version() -> None:
+    tracker = InMemoryChangeTracker(initial_version=100)
+
+    await tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    await tracker.record_change(Change(ChangeKind.COMPONENT, 10), Change(ChangeKind.DAY_SUMMARY, 10))
+
+    assert await tracker.changes_since(100) == (
+        102,
+        [Change(ChangeKind.PRODUCT, 1), Change(ChangeKind.COMPONENT, 10), Change(ChangeKind.DAY_SUMMARY, 10)],
+    )
+    assert await tracker.changes_since(101) == (
+        102,
+        [Change(ChangeKind.COMPONENT, 10), Change(ChangeKind.DAY_SUMMARY, 10)],
+    )
+    assert await tracker.changes_since(102) == (102, [])
+
+
+@pytest.mark.asyncio
+async def test_changes_since_rejects_versions_outside_the_retained_window() -> None:
+    tracker = InMemoryChangeTracker(initial_version=100, max_changes=2)
+
+    for component_id in range(3):
+        await tracker.record_change(Change(ChangeKind.COMPONENT, component_id))
+
+    assert await tracker.changes_since(101) == (103, [Change(ChangeKind.COMPONENT, 1), Change(ChangeKind.COMPONENT, 2)])
+
+    for version in (99, 100, 104):
+        with pytest.raises(EventLogExpiredError):
+            await tracker.changes_since(version)
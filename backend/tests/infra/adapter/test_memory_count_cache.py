@@ -0,0 +1,27 @@
+import pytest
+
+from infra.adapter.memory_count_cache import InMemoryCountCache
+
+
+@pytest.mark.asyncio
+async def test_count_cache_stores_totals_per_namespace() -> None:
+    cache = InMemoryCountCache()
+
+    await cache.set("products", True, 12, await cache.generation("products"))
+    await cache.set("components", 1, 3, await cache.generation("components"))
+    await cache.invalidate("components")
+
+    assert await cache.get("products", True) == 12
+    assert await cache.get("products", False) is None
+    assert await cache.get("components", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_count_cache_drops_totals_counted_before_a_write() -> None:
+    cache = InMemoryCountCache()
+    generation = await cache.generation("products")
+
+    await cache.invalidate("products")
+    await cache.set("products", True, 12, generation)
+
+    assert await cache.get("products", True) is None
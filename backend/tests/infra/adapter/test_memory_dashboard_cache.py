@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from core.domain.dashboard_snapshot import DashboardSnapshot
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from infra.adapter.memory_dashboard_cache import InMemoryDashboardCache
+
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_builds_once_per_version() -> None:
+    cache = InMemoryDashboardCache()
+    builds: list[int] = []
+
+    def _builder(version: int):
+        async def _build() -> DashboardSnapshot:
+            builds.append(version)
+            await asyncio.sleep(0)
+            return DashboardSnapshot(version=version, generated_at=datetime.now(timezone.utc))
+
+        return _build
+
+    concurrent = await asyncio.gather(*[cache.get_or_build(1, _builder(1)) for _ in range(5)])
+    repeated = await cache.get_or_build(1, _builder(1))
+    rebuilt = await cache.get_or_build(2, _builder(2))
+
+    assert builds == [1, 2]
+    assert all(snapshot is concurrent[0] for snapshot in concurrent)
+    assert repeated is concurrent[0]
+    assert rebuilt.version == 2
+
+
+@pytest.mark.asyncio
+async def test_change_tracker_increments_version() -> None:
+    tracker = InMemoryChangeTracker()
+
+    assert await tracker.current_version() == 0
+    assert await tracker.record_change() == 1
+    assert await tracker.current_version() == 1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_waits_for_the_refresh_interval_before_rebuilding() -> None:
+    now = [100.0]
+    cache = InMemoryDashboardCache(refresh_seconds=5.0, clock=lambda: now[0])
+
+    async def _build(version: int) -> DashboardSnapshot:
+        return DashboardSnapshot(version=version, generated_at=datetime.now(timezone.utc))
+
+    first = await cache.get_or_build(1, lambda: _build(1))
+    now[0] += 4.0
+    within_interval = await cache.get_or_build(2, lambda: _build(2))
+    now[0] += 2.0
+    after_interval = await cache.get_or_build(2, lambda: _build(2))
+    now[0] += 10.0
+    unchanged = await cache.get_or_build(2, lambda: _build(3))
+
+    assert within_interval is first
+    assert after_interval.version == 2
+    assert unchanged is after_interval
+
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_encodes_each_snapshot_once() -> None:
+    cache = InMemoryDashboardCache()
+    encoded: list[int] = []
+
+    def _encode(snapshot: DashboardSnapshot) -> bytes:
+        encoded.append(snapshot.version)
+        return str(snapshot.version).encode()
+
+    first = DashboardSnapshot(version=1, generated_at=datetime.now(timezone.utc))
+    second = DashboardSnapshot(version=2, generated_at=datetime.now(timezone.utc))
+
+    assert await cache.encoded(first, _encode) == b"1"
+    assert await cache.encoded(first, _encode) == b"1"
+    assert await cache.encoded(second, _encode) == b"2"
+    assert encoded == [1, 2]
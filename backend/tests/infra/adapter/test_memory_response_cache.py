@@ -0,0 +1,49 @@
+import pytest
+
+from infra.adapter.memory_response_cache import InMemoryResponseCache
+
+
+@pytest.mark.asyncio
+async def test_response_cache_invalidates_only_tagged_entries() -> None:
+    cache = InMemoryResponseCache(max_bytes=1024)
+
+    await cache.set("products?page=1", b"[1]", {"products", "product:1"}, await cache.generation())
+    await cache.set("product?id=2", b"{2}", {"product:2"}, await cache.generation())
+    await cache.invalidate(["product:1"])
+
+    assert await cache.get("products?page=1") is None
+    assert await cache.get("product?id=2") == b"{2}"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_drops_bodies_built_before_a_write() -> None:
+    cache = InMemoryResponseCache(max_bytes=1024)
+    generation = await cache.generation()
+
+    await cache.invalidate(["component:7"])
+    await cache.set("stale", b"old", {"component:7"}, generation)
+    await cache.set("unrelated", b"ok", {"component:8"}, generation)
+
+    assert await cache.get("stale") is None
+    assert await cache.get("unrelated") == b"ok"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_evicts_least_recently_used_within_byte_budget() -> None:
+    cache = InMemoryResponseCache(max_bytes=25)
+
+    await cache.set("a", b"x" * 9, {"t"}, 0)
+    await cache.set("b", b"x" * 9, {"t"}, 0)
+    await cache.get("a")
+    await cache.set("c", b"x" * 9, {"t"}, 0)
+    await cache.set("huge", b"x" * 64, {"t"}, 0)
+
+    assert await cache.get("a") is not None
+    assert await cache.get("b") is None
+    assert await cache.get("c") is not None
+    assert await cache.get("huge") is None
+    assert cache.size_bytes == 20
+
+    await cache.invalidate(["t"])
+
+    assert cache.size_bytes == 0
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from core.domain.status_type import StatusType
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from infra.adapter.memory_status_event_bus import InMemoryStatusEventBus
+
+CHANGED_AT = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+async def _publish(bus: InMemoryStatusEventBus, component_id: int, product_id: int = 1) -> str:
+    event = await bus.publish(
+        component_id=component_id,
+        product_id=product_id,
+        previous_status=StatusType.OPERATIONAL,
+        status=StatusType.OUTAGE,
+        changed_at=CHANGED_AT,
+    )
+    return event.id
+
+
+@pytest.mark.asyncio
+async def test_read_after_resumes_from_event_id_and_times_out_when_idle() -> None:
+    bus = InMemoryStatusEventBus(max_events=10)
+    start = bus.latest_event_id()
+    first = await _publish(bus, 1)
+    await _publish(bus, 2)
+
+    assert [event.component_id for event in await bus.read_after(start, timeout_seconds=0.01)] == [1, 2]
+    assert [event.component_id for event in await bus.read_after(first, timeout_seconds=0.01)] == [2]
+    assert await bus.read_after(bus.latest_event_id(), timeout_seconds=0.01) == []
+
+
+@pytest.mark.asyncio
+async def test_one_publish_wakes_every_idle_reader() -> None:
+    bus = InMemoryStatusEventBus(max_events=10)
+    cursor = bus.latest_event_id()
+    readers = [asyncio.create_task(bus.read_after(cursor, timeout_seconds=5)) for _ in range(2000)]
+    await asyncio.sleep(0)
+
+    await _publish(bus, 7)
+    batches = await asyncio.gather(*readers)
+
+    assert all([event.component_id for event in batch] == [7] for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_read_after_rejects_ids_outside_the_retained_log() -> None:
+    bus = InMemoryStatusEventBus(max_events=2)
+    start = bus.latest_event_id()
+    for component_id in range(3):
+        await _publish(bus, component_id)
+
+    with pytest.raises(EventLogExpiredError):
+        await bus.read_after(start, timeout_seconds=0.01)
+
+    with pytest.raises(EventLogExpiredError):
+        await bus.read_after(InMemoryStatusEventBus(max_events=2).latest_event_id(), timeout_seconds=0.01)
+
+    with pytest.raises(EventLogExpiredError):
+        await bus.read_after("garbage", timeout_seconds=0.01)
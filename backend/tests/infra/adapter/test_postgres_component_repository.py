@@ -1,13 +1,24 @@
+import json
+from dataclasses import replace
+
 import pytest
 
+from core.domain.change import Change, ChangeKind
 from core.domain.component import Component
 from core.domain.component_type import ComponentType
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.product import Product
 from core.domain.status_type import StatusType
 from core.exceptions.component_already_exists_error import ComponentAlreadyExistsError
-from infra.adapter.postgres_component_repository import PostgresComponentRepository
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from infra.adapter.memory_count_cache import InMemoryCountCache
+from infra.adapter.memory_response_cache import InMemoryResponseCache
+from infra.adapter.postgres_component_repository import COMPONENT_COUNT_NAMESPACE, PostgresComponentRepository
 from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.utils.cache_tags import PRODUCT_LIST_TAG, SEARCH_RESULTS_TAG, component_tags, product_tag
+from infra.web.response_cache import cached_json
+from infra.web.routers.schemas.component import ComponentResponseDTO
+from infra.web.routers.schemas.page import PageDTO
 
 
 async def _create_product(product_repository: PostgresProductRepository, name: str = "Product") -> int:
@@ -34,10 +45,54 @@ async def test_save_and_find_component_by_id(sqlite_session_factory) -> None:
     )
 
     found = await component_repository.find_by_id(saved.id or 0)
+    updated = await component_repository.save(replace(saved, current_status=StatusType.OUTAGE, is_active=False))
 
     assert saved.id is not None
     assert found is not None
     assert found.name == "payments-api"
+    assert (updated.id, updated.current_status, updated.is_active) == (saved.id, StatusType.OUTAGE, False)
+    assert await component_repository.find_by_id(saved.id) == updated
+
+
+@pytest.mark.asyncio
+async def test_component_writes_record_changes_and_invalidate_responses(sqlite_session_factory) -> None:
+    response_cache = InMemoryResponseCache(max_bytes=1024)
+    change_tracker = InMemoryChangeTracker()
+    product_repository = PostgresProductRepository(sqlite_session_factory, response_cache=response_cache)
+    component_repository = PostgresComponentRepository(
+        sqlite_session_factory,
+        change_tracker=change_tracker,
+        response_cache=response_cache,
+    )
+    first_product_id = await _create_product(product_repository, "First")
+    second_product_id = await _create_product(product_repository, "Second")
+    component = await component_repository.save(
+        Component(
+            id=None,
+            product_id=first_product_id,
+            name="payments-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://payments.example.com/health"),
+        )
+    )
+
+    tags = {
+        "first": {f"product:{first_product_id}", f"component:{component.id}"},
+        "second": {f"product:{second_product_id}"},
+        "products": {"products"},
+    }
+    for key, entry_tags in tags.items():
+        await response_cache.set(key, b"{}", entry_tags, await response_cache.generation())
+
+    await component_repository.save(replace(component, product_id=second_product_id))
+
+    assert await response_cache.get("first") is None
+    assert await response_cache.get("second") is None
+    assert await response_cache.get("products") == b"{}"
+    assert await change_tracker.changes_since(0) == (2, [Change(ChangeKind.COMPONENT, component.id)] * 2)
+    assert await component_repository.find_all_by_ids([component.id or 0, 999]) == [
+        replace(component, product_id=second_product_id)
+    ]
 
 
 @pytest.mark.asyncio
@@ -120,10 +175,54 @@ async def test_find_all_by_product_id_paginates(sqlite_session_factory) -> None:
     first_page = await component_repository.find_all_by_product_id(product_id, page=1, page_size=2)
     second_page = await component_repository.find_all_by_product_id(product_id, page=2, page_size=2)
 
+    past_last_page = await component_repository.find_all_by_product_id(product_id, page=5, page_size=2)
+
     assert first_page.total_elements == 3
     assert first_page.total_pages == 2
+    assert first_page.has_next is True
     assert [item.name for item in first_page.content] == ["component-1", "component-2"]
     assert [item.name for item in second_page.content] == ["component-3"]
+    assert second_page.has_next is False
+    assert (past_last_page.total_elements, past_last_page.page_count, past_last_page.has_next) == (3, 0, False)
+
+
+@pytest.mark.asyncio
+async def test_status_updates_keep_cached_component_totals(sqlite_session_factory) -> None:
+    count_cache = InMemoryCountCache()
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory, count_cache=count_cache)
+    product_id = await _create_product(product_repository)
+    component = await component_repository.save(
+        Component(
+            id=None,
+            product_id=product_id,
+            name="payments-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://payments.example.com/health"),
+        )
+    )
+
+    await component_repository.find_all_by_product_id(product_id, page=1, page_size=10)
+    await component_repository.save(replace(component, current_status=StatusType.OUTAGE))
+
+    assert await count_cache.get(COMPONENT_COUNT_NAMESPACE, product_id) == 1
+
+    await component_repository.save(
+        Component(
+            id=None,
+            product_id=product_id,
+            name="ledger-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://ledger.example.com/health"),
+        )
+    )
+
+    assert await count_cache.get(COMPONENT_COUNT_NAMESPACE, product_id) is None
+
+    await component_repository.find_all_by_product_id(product_id, page=1, page_size=10)
+    await component_repository.delete(component.id or 0)
+
+    assert await count_cache.get(COMPONENT_COUNT_NAMESPACE, product_id) is None
 
 
 @pytest.mark.asyncio
@@ -177,6 +276,55 @@ async def test_delete_component_removes_row(sqlite_session_factory) -> None:
 
     deleted = await component_repository.delete(saved.id or 0)
     found = await component_repository.find_by_id(saved.id or 0)
+    deleted_again = await component_repository.delete(saved.id or 0)
 
     assert deleted is True
     assert found is None
+    assert deleted_again is False
+
+
+@pytest.mark.asyncio
+async def test_component_deletes_and_renames_invalidate_cached_listings(sqlite_session_factory) -> None:
+    response_cache = InMemoryResponseCache(max_bytes=4096)
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory, response_cache=response_cache)
+    product_id = await _create_product(product_repository)
+    first, second = [
+        await component_repository.save(
+            Component(
+                id=None,
+                product_id=product_id,
+                name=name,
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url=f"https://{name}.example.com/health"),
+            )
+        )
+        for name in ("payments-api", "ledger-api")
+    ]
+
+    async def _first_page() -> dict:
+        response = await cached_json(
+            response_cache,
+            "components?page=1",
+            lambda: component_repository.find_all_by_product_id(product_id, page=1, page_size=1),
+            PageDTO[ComponentResponseDTO],
+            lambda component_page: {product_tag(product_id), *component_tags(component_page)},
+        )
+
+        return json.loads(response.body)
+
+    assert (await _first_page())["totalElements"] == 2
+
+    await component_repository.delete(second.id or 0)
+
+    assert (await _first_page())["totalElements"] == 1
+
+    search_tags = {PRODUCT_LIST_TAG, SEARCH_RESULTS_TAG}
+    await response_cache.set("search=billing", b"[]", search_tags, await response_cache.generation())
+    await component_repository.save(replace(first, current_status=StatusType.OUTAGE))
+
+    assert await response_cache.get("search=billing") == b"[]"
+
+    await component_repository.save(replace(first, name="billing-api"))
+
+    assert await response_cache.get("search=billing") is None
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.incident import Incident
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.adapter.postgres_component_repository import PostgresComponentRepository
+from infra.adapter.postgres_incident_repository import PostgresIncidentRepository
+from infra.adapter.postgres_product_repository import PostgresProductRepository
+
+START = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+async def _create_components(session_factory) -> tuple[int, int, int]:
+    product_repository = PostgresProductRepository(session_factory)
+    component_repository = PostgresComponentRepository(session_factory)
+    component_ids: list[int] = []
+
+    for index, product_name in enumerate(["Payments", "Payments", "Search"]):
+        product = await product_repository.find_by_name(product_name)
+        if product is None:
+            product = await product_repository.save(Product(id=None, name=product_name))
+
+        component = await component_repository.save(
+            Component(
+                id=None,
+                product_id=product.id or 0,
+                name=f"incident-{index}",
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url=f"https://incident-{index}.example.com/health"),
+            )
+        )
+        component_ids.append(component.id or 0)
+
+    first, second, third = component_ids
+    return first, second, third
+
+
+@pytest.mark.asyncio
+async def test_save_find_open_and_close_incident(sqlite_session_factory) -> None:
+    repository = PostgresIncidentRepository(sqlite_session_factory)
+    component_id, _, _ = await _create_components(sqlite_session_factory)
+
+    opened = await repository.save(
+        Incident(id=None, component_id=component_id, started_at=START, status=StatusType.DEGRADED)
+    )
+    found_open = await repository.find_open(component_id)
+
+    assert found_open is not None
+    assert found_open.id == opened.id
+    assert found_open.started_at == START
+
+    found_open.status = StatusType.OUTAGE
+    found_open.ended_at = START + timedelta(minutes=5)
+    closed = await repository.save(found_open)
+
+    assert closed.id == opened.id
+    assert closed.status is StatusType.OUTAGE
+    assert closed.duration_seconds == 300
+    assert await repository.find_open(component_id) is None
+
+
+@pytest.mark.asyncio
+async def test_find_all_filters_by_product_status_state_and_window(sqlite_session_factory) -> None:
+    repository = PostgresIncidentRepository(sqlite_session_factory)
+    first, second, third = await _create_components(sqlite_session_factory)
+
+    for component_id in (first, second, third):
+        await repository.replace_for_component(
+            component_id,
+            [
+                Incident(
+                    id=None,
+                    component_id=component_id,
+                    started_at=START + timedelta(hours=hour),
+                    status=StatusType.OUTAGE if hour == 2 else StatusType.DEGRADED,
+                    ended_at=START + timedelta(hours=hour, minutes=10) if hour < 2 else None,
+                )
+                for hour in range(3)
+            ],
+        )
+
+    payments_product_id = await _product_id(sqlite_session_factory)
+    payments = await repository.find_all(page=1, page_size=4, product_id=payments_product_id)
+    open_outages = await repository.find_all(page=1, page_size=10, status=StatusType.OUTAGE, is_open=True)
+    overlapping = await repository.find_all(
+        page=1,
+        page_size=10,
+        component_id=third,
+        since=START + timedelta(hours=1, minutes=5),
+        until=START + timedelta(hours=2),
+    )
+
+    assert payments.total_elements == 6
+    assert payments.total_pages == 2
+    assert [incident.started_at for incident in payments][:2] == [START + timedelta(hours=2)] * 2
+    assert open_outages.total_elements == 3
+    assert [incident.started_at for incident in overlapping] == [START + timedelta(hours=1)]
+
+    await repository.replace_for_component(third, [])
+    assert (await repository.find_all(page=1, page_size=10, component_id=third)).total_elements == 0
+
+
+async def _product_id(session_factory) -> int:
+    product = await PostgresProductRepository(session_factory).find_by_name("Payments")
+    assert product is not None and product.id is not None
+    return product.id
@@ -1,16 +1,21 @@
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
 
 from core.domain.component import Component
 from core.domain.component_type import ComponentType
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.healthcheck_log import HealthcheckLog
 from core.domain.product import Product
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
 from infra.adapter.postgres_component_repository import PostgresComponentRepository
 from infra.adapter.postgres_log_repository import PostgresLogRepository
 from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.adapter.segment_log_archive import SegmentLogArchive
 
 
 async def _create_component(
@@ -194,3 +199,578 @@ async def test_get_last_n_day_summary_bulk_returns_empty_for_no_component_ids(sq
     repository = PostgresLogRepository(sqlite_session_factory)
 
     assert await repository.get_last_n_day_summary_bulk(component_ids=[], last_n_days=5) == {}
+
+
+@pytest.mark.asyncio
+async def test_reads_transparently_include_archived_logs(sqlite_session_factory, tmp_path) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    archive = SegmentLogArchive(tmp_path)
+    log_repository = PostgresLogRepository(sqlite_session_factory, archive=archive)
+
+    component_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="api-archived",
+        health_url="https://api-archived.example.com/health",
+    )
+
+    now = datetime.now(timezone.utc)
+    archived_log = HealthcheckLog(
+        component_id=component_id,
+        checked_at=now - timedelta(days=3),
+        is_successful=False,
+        status_code=503,
+        response_time_ms=400,
+        status_before=StatusType.OPERATIONAL,
+        status_after=StatusType.OUTAGE,
+        error_message="down",
+    )
+    await archive.write_segment(component_id, [archived_log])
+    await log_repository.add_log(
+        HealthcheckLog(
+            component_id=component_id,
+            checked_at=now,
+            is_successful=True,
+            status_code=200,
+            response_time_ms=100,
+            status_before=StatusType.OUTAGE,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+    )
+
+    logs = await log_repository.get_logs(component_id=component_id, limit=5)
+    summaries = await log_repository.get_last_n_day_summary(component_id=component_id, last_n_days=7)
+
+    assert [log.status_code for log in logs] == [200, 503]
+    assert len(summaries) == 2
+    assert summaries[-1].overall_status is StatusType.OUTAGE
+    assert summaries[-1].uptime == 0.0
+
+
+@pytest.mark.asyncio
+async def test_archival_queries_select_and_delete_old_rows(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+
+    component_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="api-old",
+        health_url="https://api-old.example.com/health",
+    )
+
+    now = datetime.now(timezone.utc)
+    for age in (timedelta(days=40), timedelta(days=35), timedelta(days=1)):
+        await log_repository.add_log(
+            HealthcheckLog(
+                component_id=component_id,
+                checked_at=now - age,
+                is_successful=True,
+                status_code=200,
+                response_time_ms=10,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+        )
+
+    cutoff = now - timedelta(days=30)
+    archivable = await log_repository.find_archivable_components(until=cutoff)
+    old_logs = await log_repository.get_logs_between(component_id, since=now - timedelta(days=60), until=cutoff)
+    deleted = await log_repository.delete_logs(component_id, [log.id or 0 for log in old_logs])
+
+    assert list(archivable) == [component_id]
+    assert archivable[component_id].date() == (now - timedelta(days=40)).date()
+    assert len(old_logs) == 2
+    assert deleted == 2
+    assert len(await log_repository.get_logs(component_id=component_id, limit=10)) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_log_maintains_multi_resolution_rollups(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+
+    component_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="api-rollup",
+        health_url="https://api-rollup.example.com/health",
+    )
+
+    hour_start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    checks = [
+        (hour_start + timedelta(minutes=1, seconds=5), True, 100, StatusType.OPERATIONAL),
+        (hour_start + timedelta(minutes=1, seconds=35), False, 500, StatusType.DEGRADED),
+        (hour_start + timedelta(minutes=2), True, 60, StatusType.OPERATIONAL),
+    ]
+
+    for checked_at, is_successful, response_time_ms, status_after in checks:
+        await log_repository.add_log(
+            HealthcheckLog(
+                component_id=component_id,
+                checked_at=checked_at,
+                is_successful=is_successful,
+                status_code=200 if is_successful else 500,
+                response_time_ms=response_time_ms,
+                status_before=StatusType.OPERATIONAL,
+                status_after=status_after,
+                error_message=None,
+            )
+        )
+
+    since = hour_start
+    until = hour_start + timedelta(hours=1)
+    minutes = await log_repository.get_rollups(component_id, RollupResolution.MINUTE, since, until)
+    hours = await log_repository.get_rollups(component_id, RollupResolution.HOUR, since, until)
+
+    assert [bucket.total_checks for bucket in minutes] == [2, 1]
+    assert minutes[0].bucket_start == hour_start + timedelta(minutes=1)
+    assert minutes[0].uptime == 50.0
+    assert minutes[0].avg_response_time == 300
+    assert minutes[0].max_response_time == 500
+    assert minutes[0].overall_status is StatusType.DEGRADED
+    assert len(hours) == 1
+    assert hours[0].total_checks == 3
+    assert hours[0].successful_checks == 2
+    assert hours[0].overall_status is StatusType.DEGRADED
+
+
+@pytest.mark.asyncio
+async def test_get_logs_page_walks_keyset_pages_into_archive(sqlite_session_factory, tmp_path) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    archive = SegmentLogArchive(tmp_path)
+    log_repository = PostgresLogRepository(sqlite_session_factory, archive=archive)
+
+    component_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="api-pages",
+        health_url="https://api-pages.example.com/health",
+    )
+
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def _check(checked_at: datetime, is_successful: bool) -> HealthcheckLog:
+        return HealthcheckLog(
+            component_id=component_id,
+            checked_at=checked_at,
+            is_successful=is_successful,
+            status_code=200 if is_successful else 500,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+
+    await archive.write_segment(
+        component_id,
+        [_check(now - timedelta(days=40, minutes=minute), minute % 2 == 0) for minute in range(3)],
+    )
+    for minute in range(4):
+        await log_repository.add_log(_check(now - timedelta(minutes=minute), minute % 2 == 0))
+    await log_repository.add_log(_check(now - timedelta(minutes=1), False))
+
+    seen: list[datetime] = []
+    cursor = None
+    pages = 0
+
+    while True:
+        page = await log_repository.get_logs_page(component_id, page_size=2, cursor=cursor)
+        seen.extend(log.checked_at.replace(tzinfo=timezone.utc) for log in page)
+        pages += 1
+        cursor = page.next_cursor
+
+        if cursor is None:
+            break
+
+    assert pages == 4
+    assert len(seen) == 8
+    assert seen == sorted(seen, reverse=True)
+
+    failures = await log_repository.get_logs_page(component_id, page_size=10, is_successful=False)
+    recent = await log_repository.get_logs_page(component_id, page_size=10, since=now - timedelta(minutes=2))
+
+    assert len(failures) == 4
+    assert failures.next_cursor is None
+    assert len(recent) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_logs_skips_archived_rows_still_in_the_table(sqlite_session_factory, tmp_path) -> None:
+    archive = SegmentLogArchive(tmp_path)
+    log_repository = PostgresLogRepository(sqlite_session_factory, archive=archive)
+    component_id = await _create_component(
+        PostgresProductRepository(sqlite_session_factory),
+        PostgresComponentRepository(sqlite_session_factory),
+        name="api-mid-archive",
+        health_url="https://api-mid-archive.example.com/health",
+    )
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=component_id,
+            checked_at=start + timedelta(minutes=minute),
+            is_successful=True,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for minute in range(6)
+    ]
+
+    await archive.write_segment(component_id, logs[:2])
+    await log_repository.add_logs(logs)
+
+    latest = await log_repository.get_logs(component_id, limit=10)
+
+    assert [log.checked_at.replace(tzinfo=timezone.utc) for log in latest] == [
+        log.checked_at for log in reversed(logs)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_logs_yields_archive_then_hot_rows_in_order(sqlite_session_factory, tmp_path) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    archive = SegmentLogArchive(tmp_path)
+    log_repository = PostgresLogRepository(sqlite_session_factory, archive=archive)
+
+    first_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="api-stream",
+        health_url="https://api-stream.example.com/health",
+    )
+    second_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="web-stream",
+        health_url="https://web-stream.example.com/health",
+    )
+
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def _check(component_id: int, checked_at: datetime) -> HealthcheckLog:
+        return HealthcheckLog(
+            component_id=component_id,
+            checked_at=checked_at,
+            is_successful=True,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+
+    archived = [_check(first_id, now - timedelta(days=40, minutes=minute)) for minute in range(3)]
+    await archive.write_segment(first_id, archived)
+    await log_repository.add_log(archived[0])
+
+    for component_id in (first_id, second_id):
+        for minute in range(5):
+            await log_repository.add_log(_check(component_id, now - timedelta(minutes=minute)))
+
+    streamed = [log async for log in log_repository.stream_logs(batch_size=2)]
+    recent = [
+        log
+        async for log in log_repository.stream_logs(
+            component_ids=[second_id],
+            since=now - timedelta(minutes=2),
+        )
+    ]
+
+    assert len(streamed) == 13
+    assert [log.component_id for log in streamed] == [first_id] * 8 + [second_id] * 5
+    first_checks = [log.checked_at.replace(tzinfo=timezone.utc) for log in streamed[:8]]
+    assert first_checks == sorted(first_checks)
+    assert len(recent) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_check_counts_matches_brute_force_scan(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+
+    component_ids = [
+        await _create_component(
+            product_repository,
+            component_repository,
+            name=f"sla-{index}",
+            health_url=f"https://sla-{index}.example.com/health",
+        )
+        for index in range(3)
+    ]
+
+    generator = random.Random(30)
+    start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=generator.choice(component_ids[:2]),
+            checked_at=start + timedelta(seconds=generator.randrange(0, 6 * 3_600)),
+            is_successful=generator.random() < 0.9,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for _ in range(300)
+    ]
+
+    # Timestamps are random, so most checks arrive late and have to shift later prefixes.
+    for log in logs:
+        await log_repository.add_log(log)
+
+    windows = [(start, start + timedelta(hours=6)), (start - timedelta(days=1), start)]
+    for _ in range(25):
+        first, second = sorted(generator.sample(range(0, 6 * 60 + 1), 2))
+        windows.append((start + timedelta(minutes=first), start + timedelta(minutes=second)))
+
+    for since, until in windows:
+        counts = await log_repository.get_check_counts(component_ids, since=since, until=until)
+
+        for component_id in component_ids:
+            in_window = [
+                log
+                for log in logs
+                if log.component_id == component_id
+                and since <= RollupResolution.MINUTE.bucket_start(log.checked_at) < until
+            ]
+            expected = (len(in_window), sum(1 for log in in_window if log.is_successful))
+
+            assert counts[component_id] == expected
+
+
+@pytest.mark.asyncio
+async def test_late_batch_shifts_counters_in_constant_statements(sqlite_engine, sqlite_session_factory) -> None:
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+    component_id = await _create_component(
+        PostgresProductRepository(sqlite_session_factory),
+        PostgresComponentRepository(sqlite_session_factory),
+        name="late-batch",
+        health_url="https://late-batch.example.com/health",
+    )
+    start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+    def _check(minute: int, is_successful: bool = True) -> HealthcheckLog:
+        return HealthcheckLog(
+            component_id=component_id,
+            checked_at=start + timedelta(minutes=minute, seconds=30),
+            is_successful=is_successful,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+
+    on_time = [_check(minute) for minute in range(0, 240, 2)]
+    late = [_check(minute, is_successful=minute % 3 == 0) for minute in range(61, 181, 2)]
+    await log_repository.add_logs(on_time)
+
+    statements: list[str] = []
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _record(_connection, _cursor, statement, *_args) -> None:
+        if "health_check_counters" in statement:
+            statements.append(statement)
+
+    await log_repository.add_logs(late)
+    event.remove(sqlite_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 5
+
+    logs = on_time + late
+    windows = [(start, start + timedelta(hours=4)), (start + timedelta(minutes=90), start + timedelta(hours=3))]
+    for since, until in windows:
+        in_window = [log for log in logs if since <= log.checked_at < until]
+        counts = await log_repository.get_check_counts([component_id], since=since, until=until)
+
+        assert counts[component_id] == (len(in_window), sum(1 for log in in_window if log.is_successful))
+
+
+@pytest.mark.asyncio
+async def test_counter_updates_take_a_per_component_lock_on_postgres(sqlite_session_factory) -> None:
+    statements: list[str] = []
+
+    class _Session:
+        def get_bind(self) -> object:
+            return type("Bind", (), {"dialect": postgresql.dialect()})()
+
+        async def execute(self, statement) -> None:
+            compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+            statements.append(str(compiled))
+
+    repository = PostgresLogRepository(sqlite_session_factory)
+    await repository._lock_counters(_Session(), 42)  # type: ignore
+
+    async with sqlite_session_factory() as session:
+        await repository._lock_counters(session, 42)
+
+    assert statements == ["SELECT pg_advisory_xact_lock(7342002, 42) AS pg_advisory_xact_lock_1"]
+
+
+@pytest.mark.asyncio
+async def test_add_logs_bulk_inserts_rows_rollups_and_counters(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+
+    component_ids = [
+        await _create_component(
+            product_repository,
+            component_repository,
+            name=f"bulk-{index}",
+            health_url=f"https://bulk-{index}.example.com/health",
+        )
+        for index in range(2)
+    ]
+
+    generator = random.Random(33)
+    start = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=generator.choice(component_ids),
+            checked_at=start + timedelta(seconds=generator.randrange(0, 3 * 3_600)),
+            is_successful=generator.random() < 0.8,
+            status_code=200,
+            response_time_ms=generator.randrange(5, 50),
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for _ in range(1_200)
+    ]
+    in_order = sorted(logs[:1_000], key=lambda item: item.checked_at)
+
+    # Two in-order batches append to the counters; the last batch lands in the middle and shifts them.
+    assert await log_repository.add_logs(in_order[:600]) == 600
+    assert await log_repository.add_logs(in_order[600:]) == 400
+    assert await log_repository.add_logs(logs[1_000:]) == 200
+    assert await log_repository.add_logs([]) == 0
+
+    windows = [(start, start + timedelta(hours=3))]
+    for _ in range(10):
+        first, second = sorted(generator.sample(range(0, 3 * 60 + 1), 2))
+        windows.append((start + timedelta(minutes=first), start + timedelta(minutes=second)))
+
+    for since, until in windows:
+        counts = await log_repository.get_check_counts(component_ids, since=since, until=until)
+
+        for component_id in component_ids:
+            in_window = [
+                log
+                for log in logs
+                if log.component_id == component_id
+                and since <= RollupResolution.MINUTE.bucket_start(log.checked_at) < until
+            ]
+
+            assert counts[component_id] == (len(in_window), sum(1 for log in in_window if log.is_successful))
+
+    for component_id in component_ids:
+        component_logs = [log for log in logs if log.component_id == component_id]
+        stored = await log_repository.get_logs(component_id, limit=2_000)
+        rollups = await log_repository.get_rollups(
+            component_id,
+            RollupResolution.HOUR,
+            since=start,
+            until=start + timedelta(hours=3),
+        )
+
+        assert len(stored) == len(component_logs)
+        assert sum(rollup.total_checks for rollup in rollups) == len(component_logs)
+        assert max(rollup.max_response_time for rollup in rollups) == max(
+            log.response_time_ms for log in component_logs
+        )
+
+
+@pytest.mark.asyncio
+async def test_add_logs_reads_back_aware_utc_timestamps(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+
+    component_id = await _create_component(
+        product_repository,
+        component_repository,
+        name="aware",
+        health_url="https://aware.example.com/health",
+    )
+    checked_at = datetime(2026, 5, 1, 9, 30, tzinfo=timezone(timedelta(hours=-3)))
+
+    await log_repository.add_logs(
+        [
+            HealthcheckLog(
+                component_id=component_id,
+                checked_at=checked_at,
+                is_successful=True,
+                status_code=200,
+                response_time_ms=15,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+        ]
+    )
+
+    [stored] = await log_repository.get_logs(component_id, limit=10)
+
+    assert stored.checked_at == checked_at
+    assert stored.checked_at.tzinfo is timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_copy_logs_sends_aware_utc_timestamps(sqlite_session_factory) -> None:
+    copied: dict = {}
+
+    class _DriverConnection:
+        async def copy_records_to_table(self, table_name, records, columns) -> None:
+            copied.update(table_name=table_name, records=records, columns=columns)
+
+    class _RawConnection:
+        driver_connection = _DriverConnection()
+
+    class _Connection:
+        async def get_raw_connection(self) -> _RawConnection:
+            return _RawConnection()
+
+    class _Session:
+        async def connection(self) -> _Connection:
+            return _Connection()
+
+    log = HealthcheckLog(
+        component_id=7,
+        checked_at=datetime(2026, 5, 1, 9, 30, tzinfo=timezone(timedelta(hours=-3))),
+        is_successful=False,
+        status_code=503,
+        response_time_ms=120,
+        status_before=StatusType.OPERATIONAL,
+        status_after=StatusType.DEGRADED,
+        error_message="unavailable",
+    )
+
+    await PostgresLogRepository(sqlite_session_factory)._copy_logs(_Session(), [log])  # type: ignore
+
+    assert copied["table_name"] == "health_checks"
+    assert copied["records"] == [
+        (
+            7,
+            datetime(2026, 5, 1, 12, 30, tzinfo=timezone.utc),
+            False,
+            503,
+            120,
+            "OPERATIONAL",
+            "DEGRADED",
+            "unavailable",
+        ),
+    ]
+    assert copied["records"][0][1].tzinfo is timezone.utc
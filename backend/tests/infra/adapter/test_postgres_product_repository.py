@@ -1,14 +1,18 @@
 from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy import event
 
 from core.domain.component import Component
 from core.domain.component_type import ComponentType
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.product import Product
 from core.domain.status_type import StatusType
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from infra.adapter.memory_count_cache import InMemoryCountCache
 from infra.adapter.postgres_component_repository import PostgresComponentRepository
 from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.db.reader import ReplicaSessionReader
 
 
 @pytest.mark.asyncio
@@ -85,6 +89,10 @@ async def test_find_all_paginates_and_maps_components(sqlite_session_factory) ->
     second_page = await product_repository.find_all(is_visible=True, page=2, page_size=1)
     assert second_page.content[0].id == second.id
 
+    visible = await product_repository.find_all_without_pagination(is_visible=True)
+    assert [product.name for product in visible] == ["A", "B"]
+    assert [len(product.components) for product in visible] == [2, 0]
+
 
 @pytest.mark.asyncio
 async def test_delete_product_removes_row(sqlite_session_factory) -> None:
@@ -93,6 +101,194 @@ async def test_delete_product_removes_row(sqlite_session_factory) -> None:
 
     deleted = await repository.delete(saved.id or 0)
     found = await repository.find_by_id(saved.id or 0)
+    deleted_again = await repository.delete(saved.id or 0)
 
     assert deleted is True
     assert found is None
+    assert deleted_again is False
+
+
+@pytest.mark.asyncio
+async def test_writes_record_changes(sqlite_session_factory) -> None:
+    change_tracker = InMemoryChangeTracker()
+    product_repository = PostgresProductRepository(sqlite_session_factory, change_tracker=change_tracker)
+    component_repository = PostgresComponentRepository(sqlite_session_factory, change_tracker=change_tracker)
+
+    product = await product_repository.save(Product(id=None, name="Tracked", is_visible=True))
+    component = await component_repository.save(
+        Component(
+            id=None,
+            product_id=product.id or 0,
+            name="tracked-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://tracked.example.com/health"),
+        )
+    )
+    await product_repository.find_all_without_pagination(is_visible=True)
+
+    assert await change_tracker.current_version() == 2
+
+    await component_repository.delete(component.id or 0)
+    await product_repository.delete(product.id or 0)
+
+    assert await change_tracker.current_version() == 4
+
+
+@pytest.mark.asyncio
+async def test_writes_take_one_statement_each(sqlite_engine, sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory)
+    statements: list[str] = []
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _record(_connection, _cursor, statement, *_args) -> None:
+        statements.append(statement.split()[0])
+
+    created = await repository.save(Product(id=None, name="Single", is_visible=True))
+    updated = await repository.save(Product(id=created.id, name="Single", description="changed", is_visible=False))
+    upserted = await repository.save(Product(id=500, name="Explicit id"))
+    deleted = await repository.delete(created.id or 0)
+
+    assert statements == ["INSERT", "INSERT", "INSERT", "DELETE"]
+    assert (updated.id, updated.description, updated.is_visible) == (created.id, "changed", False)
+    assert updated.created_at == created.created_at
+    assert upserted.id == 500
+    assert deleted is True
+
+
+@pytest.mark.asyncio
+async def test_find_all_counts_in_the_page_query_and_caches_totals(sqlite_engine, sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory, count_cache=InMemoryCountCache())
+    statements: list[str] = []
+
+    for name in ("A", "B", "C"):
+        await repository.save(Product(id=None, name=name, is_visible=True))
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _record(_connection, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    counted = await repository.find_all(is_visible=True, page=1, page_size=2)
+    cached = await repository.find_all(is_visible=True, page=2, page_size=2)
+
+    assert (counted.total_elements, counted.total_pages, counted.has_next) == (3, 2, True)
+    assert (cached.total_elements, cached.has_next) == (3, False)
+    assert [product.name for product in cached] == ["C"]
+    assert sum("over ()" in statement.lower() for statement in statements) == 1
+    assert not any(statement.lower().startswith("select count") for statement in statements)
+
+    await repository.save(Product(id=None, name="D", is_visible=True))
+    refreshed = await repository.find_all(is_visible=True, page=2, page_size=2)
+
+    assert (refreshed.total_elements, refreshed.has_next) == (4, False)
+    assert sum("over ()" in statement.lower() for statement in statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_find_all_fills_the_count_cache_from_the_primary(sqlite_session_factory) -> None:
+    replica_sessions: list[str] = []
+
+    def _replica_session_factory():
+        replica_sessions.append("replica")
+        return sqlite_session_factory()
+
+    reader = ReplicaSessionReader(
+        sqlite_session_factory,
+        _replica_session_factory,  # type: ignore
+        max_lag_seconds=5,
+        lag_query="SELECT 0",
+    )
+    repository = PostgresProductRepository(sqlite_session_factory, count_cache=InMemoryCountCache(), reader=reader)
+
+    for name in ("A", "B", "C"):
+        await repository.save(Product(id=None, name=name, is_visible=True))
+
+    counted = await repository.find_all(is_visible=True, page=1, page_size=2)
+
+    assert counted.total_elements == 3
+    assert replica_sessions == []
+
+    cached = await repository.find_all(is_visible=True, page=2, page_size=2)
+
+    assert cached.total_elements == 3
+    assert replica_sessions != []
+
+
+@pytest.mark.asyncio
+async def test_find_all_can_skip_totals(sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory)
+
+    for name in ("A", "B", "C"):
+        await repository.save(Product(id=None, name=name, is_visible=True))
+
+    first = await repository.find_all(is_visible=True, page=1, page_size=2, include_total=False)
+    last = await repository.find_all(is_visible=True, page=2, page_size=2, include_total=False)
+
+    assert (first.total_elements, first.total_pages, first.page_count, first.has_next) == (None, None, 2, True)
+    assert ([product.name for product in last], last.has_next) == (["C"], False)
+
+
+@pytest.mark.asyncio
+async def test_find_all_can_skip_the_component_query(sqlite_engine, sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory)
+    product = await repository.save(Product(id=None, name="Lean", is_visible=True))
+    await PostgresComponentRepository(sqlite_session_factory).save(
+        Component(
+            id=None,
+            product_id=product.id or 0,
+            name="lean-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://lean.example.com/health"),
+        )
+    )
+    statements: list[str] = []
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _record(_connection, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    lean = await repository.find_all(is_visible=True, page=1, page_size=10, include_components=False)
+    event.remove(sqlite_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert [(item.name, item.components) for item in lean] == [("Lean", [])]
+    assert statements and not any("FROM components" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_find_all_searches_product_and_component_names(sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory, count_cache=InMemoryCountCache())
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+
+    payments = await repository.save(Product(id=None, name="Payments", is_visible=True))
+    await repository.save(Product(id=None, name="Search 100%", is_visible=True))
+    await repository.save(Product(id=None, name="Hidden payments", is_visible=False))
+    billing = await repository.save(Product(id=None, name="Billing", is_visible=True))
+    await component_repository.save(
+        Component(
+            id=None,
+            product_id=billing.id or 0,
+            name="invoice-PAYMENT-worker",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://invoices.example.com/health"),
+        )
+    )
+
+    async def names(search: str) -> list[str]:
+        return [product.name for product in await repository.find_all(True, page=1, page_size=10, search=search)]
+
+    assert await names("payment") == ["Payments", "Billing"]
+    assert await names("PAY") == ["Payments", "Billing"]
+    assert await names("bi") == ["Billing"]
+    assert await names("0%") == ["Search 100%"]
+    assert await names('"') == []
+
+    await repository.save(Product(id=payments.id, name="Checkout", is_visible=True))
+    await repository.delete(billing.id or 0)
+
+    assert await names("payment") == []
+    assert await names("kout") == ["Checkout"]
+
+    filtered = await repository.find_all(True, page=1, page_size=1, search="c")
+    unfiltered = await repository.find_all(True, page=1, page_size=1)
+
+    assert (filtered.total_elements, filtered.has_next) == (2, True)
+    assert unfiltered.total_elements == 2
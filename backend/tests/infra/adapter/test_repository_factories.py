@@ -1,44 +1,78 @@
 import infra.adapter.dict_component_cache as cache_module
 import infra.adapter.local_scheduler as scheduler_module
 import infra.adapter.postgres_component_repository as component_repo_module
+import infra.adapter.postgres_incident_repository as incident_repo_module
 import infra.adapter.postgres_log_repository as log_repo_module
 import infra.adapter.postgres_product_repository as product_repo_module
 
 
 def test_get_product_repository_is_cached(monkeypatch) -> None:
     fake_session_factory = object()
+    fake_writer = object()
+    fake_reader = object()
     product_repo_module.get_product_repository.cache_clear()
     monkeypatch.setattr(product_repo_module, "get_session_factory", lambda: fake_session_factory)
+    monkeypatch.setattr(product_repo_module, "get_session_writer", lambda: fake_writer)
+    monkeypatch.setattr(product_repo_module, "get_session_reader", lambda: fake_reader)
 
     first = product_repo_module.get_product_repository()
     second = product_repo_module.get_product_repository()
 
     assert first is second
     assert first._session_factory is fake_session_factory
+    assert first._writer is fake_writer
+    assert first._reader is fake_reader
 
 
 def test_get_component_repository_is_cached(monkeypatch) -> None:
     fake_session_factory = object()
+    fake_writer = object()
+    fake_reader = object()
     component_repo_module.get_component_repository.cache_clear()
     monkeypatch.setattr(component_repo_module, "get_session_factory", lambda: fake_session_factory)
+    monkeypatch.setattr(component_repo_module, "get_session_writer", lambda: fake_writer)
+    monkeypatch.setattr(component_repo_module, "get_session_reader", lambda: fake_reader)
 
     first = component_repo_module.get_component_repository()
     second = component_repo_module.get_component_repository()
 
     assert first is second
     assert first._session_factory is fake_session_factory
+    assert first._writer is fake_writer
+    assert first._reader is fake_reader
 
 
 def test_get_log_repository_is_cached(monkeypatch) -> None:
     fake_session_factory = object()
+    fake_writer = object()
+    fake_reader = object()
     log_repo_module.get_log_repository.cache_clear()
     monkeypatch.setattr(log_repo_module, "get_session_factory", lambda: fake_session_factory)
+    monkeypatch.setattr(log_repo_module, "get_session_writer", lambda: fake_writer)
+    monkeypatch.setattr(log_repo_module, "get_session_reader", lambda: fake_reader)
 
     first = log_repo_module.get_log_repository()
     second = log_repo_module.get_log_repository()
 
     assert first is second
     assert first._session_factory is fake_session_factory
+    assert first._writer is fake_writer
+    assert first._reader is fake_reader
+
+
+def test_get_incident_repository_is_cached(monkeypatch) -> None:
+    fake_session_factory = object()
+    fake_writer = object()
+    incident_repo_module.get_incident_repository.cache_clear()
+    monkeypatch.setattr(incident_repo_module, "get_session_factory", lambda: fake_session_factory)
+    monkeypatch.setattr(incident_repo_module, "get_session_writer", lambda: fake_writer)
+
+    first = incident_repo_module.get_incident_repository()
+    second = incident_repo_module.get_incident_repository()
+
+    assert first is second
+    assert first._session_factory is fake_session_factory
+    assert first._writer is fake_writer
 
 
 def test_get_dict_component_cache_is_cached() -> None:
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+from infra.adapter.segment_log_archive import SegmentLogArchive
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _logs(component_id: int, day: int, count: int) -> list[HealthcheckLog]:
+    return [
+        HealthcheckLog(
+            component_id=component_id,
+            checked_at=START + timedelta(days=day, minutes=index),
+            is_successful=index % 3 != 0,
+            status_code=200 if index % 3 != 0 else 500,
+            response_time_ms=50 + index,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL if index % 3 != 0 else StatusType.DEGRADED,
+            error_message=None if index % 3 != 0 else "boom",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_and_read_segments_per_component(tmp_path: Path) -> None:
+    archive = SegmentLogArchive(tmp_path)
+
+    await archive.write_segment(1, _logs(1, day=0, count=4))
+    await archive.write_segment(1, _logs(1, day=1, count=3))
+    await archive.write_segment(2, _logs(2, day=0, count=2))
+
+    assert len(list((tmp_path / "1").glob("*.seg"))) == 2
+    assert len(await archive.read_logs(1)) == 7
+    assert len(await archive.read_logs(2)) == 2
+    assert await archive.read_logs(3) == []
+
+
+@pytest.mark.asyncio
+async def test_read_logs_skips_segments_outside_range(tmp_path: Path) -> None:
+    archive = SegmentLogArchive(tmp_path)
+    await archive.write_segment(1, _logs(1, day=0, count=4))
+    await archive.write_segment(1, _logs(1, day=1, count=4))
+
+    logs = await archive.read_logs(1, since=START + timedelta(days=1), until=START + timedelta(days=1, minutes=2))
+
+    assert [log.checked_at for log in logs] == [
+        START + timedelta(days=1),
+        START + timedelta(days=1, minutes=1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_latest_logs_returns_newest_first(tmp_path: Path) -> None:
+    archive = SegmentLogArchive(tmp_path)
+    await archive.write_segment(1, _logs(1, day=0, count=4))
+    await archive.write_segment(1, _logs(1, day=1, count=2))
+
+    latest = await archive.read_latest_logs(1, limit=3)
+
+    assert [log.checked_at for log in latest] == [
+        START + timedelta(days=1, minutes=1),
+        START + timedelta(days=1),
+        START + timedelta(minutes=3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_archived_until_survives_reopening_archive(tmp_path: Path) -> None:
+    await SegmentLogArchive(tmp_path).write_segment(1, _logs(1, day=2, count=5))
+
+    reopened = SegmentLogArchive(tmp_path)
+
+    assert await reopened.archived_until(1) == START + timedelta(days=2, minutes=4)
+    assert await reopened.archived_until(2) is None
+
+
+@pytest.mark.asyncio
+async def test_overlapping_merge_segments_are_read_in_order(tmp_path: Path) -> None:
+    archive = SegmentLogArchive(tmp_path)
+    day = _logs(1, day=0, count=6)
+
+    await archive.write_segment(1, day[0::2])
+    await archive.write_segment(1, day[1::2])
+    await archive.write_segment(1, _logs(1, day=1, count=2))
+
+    expected = [log.checked_at for log in day + _logs(1, day=1, count=2)]
+    chunks = [chunk async for chunk in archive.iter_logs(1)]
+
+    assert [log.checked_at for log in await archive.read_logs(1)] == expected
+    assert [log.checked_at for chunk in chunks for log in chunk] == expected
+    assert len(chunks) == 2
+    assert [log.checked_at for log in await archive.read_latest_logs(1, limit=4)] == expected[::-1][:4]
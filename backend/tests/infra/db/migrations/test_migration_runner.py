@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_mock_engine, event, text
+
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.adapter.postgres_component_repository import PostgresComponentRepository
+from infra.adapter.postgres_log_repository import PostgresLogRepository
+from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.db.migrations import MIGRATIONS, run_migrations, v0001_health_check_indexes, v0003_timestamptz_columns
+
+
+async def _health_check_indexes(engine) -> dict[str, str]:
+    async with engine.connect() as connection:
+        rows = await connection.execute(
+            text("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'health_checks'")
+        )
+
+        return {name: sql for name, sql in rows if sql is not None}
+
+
+async def _explain(engine, statement: str, parameters) -> str:
+    async with engine.connect() as connection:
+        rows = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+
+        return " | ".join(row[-1] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_migrations_bring_a_legacy_schema_to_the_model_index_set(sqlite_engine) -> None:
+    model_indexes = await _health_check_indexes(sqlite_engine)
+
+    async with sqlite_engine.begin() as connection:
+        for name in model_indexes:
+            await connection.exec_driver_sql(f"DROP INDEX {name}")
+
+        await connection.exec_driver_sql("CREATE INDEX ix_health_checks_component_id ON health_checks (component_id)")
+
+    applied = await run_migrations(sqlite_engine)
+    applied_again = await run_migrations(sqlite_engine)
+
+    assert applied == [migration.version for migration in MIGRATIONS]
+    assert applied_again == []
+    assert await _health_check_indexes(sqlite_engine) == model_indexes
+    assert set(model_indexes) == {"ix_health_checks_component_id_checked_at", "ix_health_checks_checked_at"}
+
+
+@pytest.mark.parametrize("isolation_level", ["AUTOCOMMIT", "READ COMMITTED"])
+def test_health_check_indexes_build_concurrently_outside_a_transaction_on_postgres(isolation_level: str) -> None:
+    statements: list[str] = []
+    engine = create_mock_engine(
+        "postgresql://",
+        lambda statement, *_args, **_kwargs: statements.append(str(statement.compile(dialect=engine.dialect))),
+    )
+
+    class _Connection:
+        dialect = engine.dialect
+
+        def get_execution_options(self) -> dict[str, str]:
+            return {"isolation_level": isolation_level}
+
+        def exec_driver_sql(self, statement: str) -> None:
+            statements.append(statement)
+
+        def _run_ddl_visitor(self, *args, **kwargs) -> None:
+            engine._run_ddl_visitor(*args, **kwargs)
+
+    v0001_health_check_indexes.upgrade(_Connection())  # type: ignore
+
+    created = sorted(statement for statement in statements if statement.startswith("CREATE INDEX"))
+    concurrently = "CONCURRENTLY " if isolation_level == "AUTOCOMMIT" else ""
+
+    assert created == [
+        f"CREATE INDEX {concurrently}ix_health_checks_checked_at_brin ON health_checks USING brin (checked_at)",
+        f"CREATE INDEX {concurrently}ix_health_checks_component_id_checked_at ON health_checks "
+        "(component_id, checked_at) INCLUDE (is_successful, response_time_ms, status_after)",
+    ]
+    assert all(statement.startswith(f"DROP INDEX {concurrently}IF EXISTS") for statement in statements[:4])
+
+
+def test_timestamptz_migration_converts_naive_model_columns_on_postgres() -> None:
+    statements: list[str] = []
+    engine = create_mock_engine("postgresql://", lambda *_args, **_kwargs: None)
+
+    class _Row:
+        def __init__(self, table_name: str, column_name: str) -> None:
+            self.table_name = table_name
+            self.column_name = column_name
+
+    class _Connection:
+        dialect = engine.dialect
+
+        def execute(self, _statement) -> list[_Row]:
+            return [_Row("health_checks", "checked_at"), _Row("components", "last_checked_at")]
+
+        def exec_driver_sql(self, statement: str) -> None:
+            statements.append(statement)
+
+    v0003_timestamptz_columns.upgrade(_Connection())  # type: ignore
+
+    assert statements == [
+        'ALTER TABLE health_checks ALTER COLUMN "checked_at" TYPE timestamptz '
+        "USING \"checked_at\" AT TIME ZONE 'UTC'",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_hot_health_check_queries_use_the_index_set(sqlite_engine, sqlite_session_factory) -> None:
+    product = await PostgresProductRepository(sqlite_session_factory).save(Product(id=None, name="Indexed"))
+    component = await PostgresComponentRepository(sqlite_session_factory).save(
+        Component(
+            id=None,
+            product_id=product.id or 0,
+            name="indexed-api",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url="https://indexed.example.com/health"),
+        )
+    )
+    log_repository = PostgresLogRepository(sqlite_session_factory)
+    now = datetime.now(timezone.utc)
+    await log_repository.add_logs(
+        [
+            HealthcheckLog(
+                component_id=component.id or 0,
+                checked_at=now - timedelta(hours=hour),
+                is_successful=True,
+                status_code=200,
+                response_time_ms=20,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+            for hour in range(48)
+        ]
+    )
+
+    captured: list[tuple[str, object]] = []
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _capture(_connection, _cursor, statement, parameters, *_args) -> None:
+        if "FROM health_checks" in statement:
+            captured.append((statement, parameters))
+
+    await log_repository.get_last_n_day_summary_bulk([component.id or 0], last_n_days=7)
+    await log_repository.get_logs(component.id or 0, limit=10)
+    await log_repository.find_archivable_components(now - timedelta(days=1))
+    event.remove(sqlite_engine.sync_engine, "before_cursor_execute", _capture)
+
+    summary_plan, recent_plan, archive_plan = [await _explain(sqlite_engine, *query) for query in captured]
+
+    assert "COVERING INDEX ix_health_checks_component_id_checked_at" in summary_plan
+    assert "INDEX ix_health_checks_component_id_checked_at" in recent_plan
+    assert "SCAN health_checks" not in recent_plan
+    assert "INDEX ix_health_checks_" in archive_plan
+
+
+@pytest.mark.asyncio
+async def test_name_search_migration_indexes_existing_rows(sqlite_engine, sqlite_session_factory) -> None:
+    repository = PostgresProductRepository(sqlite_session_factory)
+    await repository.save(Product(id=None, name="Legacy Payments", is_visible=True))
+
+    async with sqlite_engine.begin() as connection:
+        for table_name in ("products", "components"):
+            for suffix in ("ai", "ad", "au"):
+                await connection.exec_driver_sql(f"DROP TRIGGER {table_name}_name_fts_{suffix}")
+            await connection.exec_driver_sql(f"DROP TABLE {table_name}_name_fts")
+
+    await run_migrations(sqlite_engine)
+
+    captured: list[tuple[str, object]] = []
+
+    @event.listens_for(sqlite_engine.sync_engine, "before_cursor_execute")
+    def _capture(_connection, _cursor, statement, parameters, *_args) -> None:
+        if "products_name_fts" in statement:
+            captured.append((statement, parameters))
+
+    page = await repository.find_all(True, page=1, page_size=10, include_total=False, search="payment")
+    event.remove(sqlite_engine.sync_engine, "before_cursor_execute", _capture)
+
+    assert [product.name for product in page] == ["Legacy Payments"]
+    assert "VIRTUAL TABLE INDEX" in await _explain(sqlite_engine, *captured[0])
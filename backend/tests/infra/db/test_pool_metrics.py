@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infra.db.pool_metrics import InstrumentedAsyncAdaptedQueuePool, PoolMetrics
+
+
+@pytest.fixture
+async def small_pool_engine(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_gauges_waits_and_timeouts(small_pool_engine) -> None:
+    metrics = PoolMetrics("primary").attach(small_pool_engine.sync_engine)
+
+    async with small_pool_engine.connect() as first, small_pool_engine.connect() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+        busy = metrics.snapshot()
+
+        with pytest.raises(exc.TimeoutError):
+            async with small_pool_engine.connect():
+                pass
+
+    idle = metrics.snapshot()
+
+    assert (busy["size"], busy["in_use"], busy["idle"], busy["overflow"]) == (1, 2, 0, 1)
+    assert (idle["in_use"], idle["idle"], idle["overflow"]) == (0, 1, 0)
+    assert idle["peak_in_use"] == 2
+    assert idle["checkouts"] == 2
+    assert idle["connects"] == 2
+    assert idle["checkout_timeouts"] == 1
+    assert idle["checkout_wait_ms"]["count"] == 2
+    assert sum(idle["checkout_wait_ms"]["buckets"].values()) == 2
+    assert idle["checkout_wait_ms"]["p99"] is not None
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_survive_pool_recreate(small_pool_engine) -> None:
+    metrics = PoolMetrics("primary").attach(small_pool_engine.sync_engine)
+
+    await small_pool_engine.dispose()
+
+    async with small_pool_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["pool"] == "InstrumentedAsyncAdaptedQueuePool"
+    assert (snapshot["checkouts"], snapshot["checkout_wait_ms"]["count"]) == (1, 1)
+
+
+def test_checkout_wait_percentiles_use_bucket_bounds() -> None:
+    metrics = PoolMetrics("primary")
+
+    for seconds in (0.0005, 0.0005, 0.003, 0.2, 12.0):
+        metrics.record_checkout_wait(seconds)
+
+    wait = metrics.snapshot()["checkout_wait_ms"]
+
+    assert wait["buckets"]["1"] == 2
+    assert wait["buckets"]["5"] == 1
+    assert wait["buckets"]["250"] == 1
+    assert wait["buckets"]["+Inf"] == 1
+    assert (wait["p50"], wait["p95"], wait["max"]) == (5.0, 12000.0, 12000.0)
+    assert metrics.snapshot()["in_use"] is None
@@ -0,0 +1,42 @@
+import pytest
+
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.adapter.postgres_component_repository import PostgresComponentRepository
+from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.db.projections import components_by_product
+
+
+@pytest.mark.asyncio
+async def test_components_by_product_groups_rows_into_domain_objects(sqlite_session_factory) -> None:
+    product_repository = PostgresProductRepository(sqlite_session_factory)
+    component_repository = PostgresComponentRepository(sqlite_session_factory)
+    first = await product_repository.save(Product(id=None, name="First"))
+    second = await product_repository.save(Product(id=None, name="Second"))
+    empty = await product_repository.save(Product(id=None, name="Empty"))
+
+    for product, name in [(second, "b"), (first, "a"), (second, "c")]:
+        await component_repository.save(
+            Component(
+                id=None,
+                product_id=product.id or 0,
+                name=name,
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url=f"https://{name}.example.com/health", timeout_seconds=7),
+                current_status=StatusType.DEGRADED,
+            )
+        )
+
+    async with sqlite_session_factory() as session:
+        grouped = await components_by_product(session, [first.id or 0, second.id or 0, empty.id or 0])
+        nothing = await components_by_product(session, [])
+
+    assert [component.name for component in grouped[first.id or 0]] == ["a"]
+    assert [component.name for component in grouped[second.id or 0]] == ["b", "c"]
+    assert grouped[empty.id or 0] == []
+    assert grouped[first.id or 0][0].monitoring_config.timeout_seconds == 7
+    assert grouped[first.id or 0][0].current_status is StatusType.DEGRADED
+    assert nothing == {}
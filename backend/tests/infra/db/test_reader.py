@@ -0,0 +1,144 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from infra.db.reader import ReplicaSessionReader, primary_reads
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _which(session: AsyncSession) -> str:
+    return (await session.execute(text("SELECT name FROM marker"))).scalar_one()
+
+
+@pytest.fixture
+async def replica_session_factory(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE marker (name TEXT)"))
+        await connection.execute(text("INSERT INTO marker VALUES ('replica')"))
+
+    try:
+        yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def primary_session_factory(sqlite_session_factory):
+    async with sqlite_session_factory() as session:
+        await session.execute(text("CREATE TABLE marker (name TEXT)"))
+        await session.execute(text("INSERT INTO marker VALUES ('primary')"))
+        await session.commit()
+
+    return sqlite_session_factory
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_while_lag_is_within_bound(primary_session_factory, replica_session_factory) -> None:
+    clock = FakeClock()
+    reader = ReplicaSessionReader(
+        primary_session_factory,
+        replica_session_factory,
+        max_lag_seconds=5,
+        lag_check_seconds=10,
+        lag_query="SELECT lag FROM replica_lag",
+        clock=clock,
+    )
+    async with replica_session_factory() as session:
+        await session.execute(text("CREATE TABLE replica_lag (lag REAL)"))
+        await session.execute(text("INSERT INTO replica_lag VALUES (1)"))
+        await session.commit()
+
+    assert await reader.run(_which) == "replica"
+
+    async with replica_session_factory() as session:
+        await session.execute(text("UPDATE replica_lag SET lag = 60"))
+        await session.commit()
+
+    # The lag is re-checked only once the check interval has passed.
+    assert await reader.run(_which) == "replica"
+
+    clock.now = 10
+    assert await reader.run(_which) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_when_replica_fails(primary_session_factory, tmp_path: Path) -> None:
+    clock = FakeClock()
+    broken_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    broken_session_factory = async_sessionmaker(bind=broken_engine, expire_on_commit=False)
+    reader = ReplicaSessionReader(
+        primary_session_factory,
+        broken_session_factory,
+        max_lag_seconds=5,
+        retry_seconds=30,
+        lag_query="SELECT 0",
+        clock=clock,
+    )
+
+    assert await reader.run(_which) == "primary"
+    assert reader._unavailable_until == 30
+
+    clock.now = 29
+    assert await reader.run(_which) == "primary"
+    assert reader._unavailable_until == 30
+
+    clock.now = 31
+    assert await reader.run(_which) == "primary"
+    assert reader._unavailable_until == 61
+
+    await broken_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_errors_on_replica_are_retried_on_primary(primary_session_factory, replica_session_factory) -> None:
+    reader = ReplicaSessionReader(
+        primary_session_factory,
+        replica_session_factory,
+        max_lag_seconds=5,
+        lag_query="SELECT 0",
+        clock=FakeClock(),
+    )
+
+    async def _primary_only(session: AsyncSession) -> str:
+        return (await session.execute(text("SELECT name FROM marker WHERE name = 'primary'"))).scalar_one()
+
+    async with replica_session_factory() as session:
+        await session.execute(text("DROP TABLE marker"))
+        await session.commit()
+
+    assert await reader.run(_primary_only) == "primary"
+    assert reader._unavailable_until == 30
+
+
+@pytest.mark.asyncio
+async def test_primary_reads_bypass_a_fresh_replica(primary_session_factory, replica_session_factory) -> None:
+    reader = ReplicaSessionReader(
+        primary_session_factory,
+        replica_session_factory,
+        max_lag_seconds=5,
+        lag_query="SELECT 0",
+        clock=FakeClock(),
+    )
+
+    with primary_reads():
+        assert await reader.run(_which) == "primary"
+
+        with primary_reads(False):
+            assert await reader.run(_which) == "primary"
+
+    with primary_reads(False):
+        assert await reader.run(_which) == "replica"
+
+    assert await reader.run(_which) == "replica"
@@ -15,6 +15,15 @@ class FakeEngine:
         self.disposed = True
 
 
+class RecordingPoolMetrics:
+    def __init__(self) -> None:
+        self.attached: list[object] = []
+
+    def attach(self, engine) -> "RecordingPoolMetrics":
+        self.attached.append(engine)
+        return self
+
+
 class FakeConnection:
     def __init__(self) -> None:
         self.run_sync_calls: list[object] = []
@@ -78,6 +87,7 @@ async def test_get_engine_uses_configured_connection_values(monkeypatch: pytest.
         DATABASE_CONFIG=SimpleNamespace(
             DRIVER="postgres",
             SQLITE_PATH="./status_page.db",
+            SQLITE_PROFILE="default",
             USER="db_user",
             PASSWORD="db_password",
             HOST="localhost",
@@ -96,8 +106,11 @@ async def test_get_engine_uses_configured_connection_values(monkeypatch: pytest.
         captured["kwargs"] = kwargs
         return fake_engine
 
+    pool_metrics = RecordingPoolMetrics()
+
     monkeypatch.setattr(session_module, "get_config", lambda: config)
     monkeypatch.setattr(session_module, "create_async_engine", fake_create_async_engine)
+    monkeypatch.setattr(session_module, "get_pool_metrics", lambda name: pool_metrics)
 
     engine = session_module.get_engine()
 
@@ -110,7 +123,9 @@ async def test_get_engine_uses_configured_connection_values(monkeypatch: pytest.
         "max_overflow": 10,
         "pool_timeout": 12,
         "pool_recycle": 120,
+        "poolclass": session_module.InstrumentedAsyncAdaptedQueuePool,
     }
+    assert pool_metrics.attached == [fake_engine.sync_engine]
 
 
 @pytest.mark.asyncio
@@ -123,6 +138,7 @@ async def test_get_engine_uses_sqlite_driver_configuration(monkeypatch: pytest.M
         DATABASE_CONFIG=SimpleNamespace(
             DRIVER="sqlite",
             SQLITE_PATH="./tmp/status_page.db",
+            SQLITE_PROFILE="default",
             USER=None,
             PASSWORD=None,
             HOST=None,
@@ -151,6 +167,7 @@ async def test_get_engine_uses_sqlite_driver_configuration(monkeypatch: pytest.M
     monkeypatch.setattr(session_module, "get_config", lambda: config)
     monkeypatch.setattr(session_module, "create_async_engine", fake_create_async_engine)
     monkeypatch.setattr(session_module.event, "listens_for", fake_listens_for)
+    monkeypatch.setattr(session_module, "get_pool_metrics", lambda name: RecordingPoolMetrics())
 
     engine = session_module.get_engine()
 
@@ -159,6 +176,7 @@ async def test_get_engine_uses_sqlite_driver_configuration(monkeypatch: pytest.M
     assert captured["kwargs"] == {
         "echo": False,
         "pool_pre_ping": True,
+        "poolclass": session_module.InstrumentedAsyncAdaptedQueuePool,
     }
     assert len(listeners) == 1
     assert listeners[0][0] is fake_engine.sync_engine
@@ -222,7 +240,66 @@ async def test_create_database_schema_runs_create_all(monkeypatch: pytest.Monkey
 
     await session_module.create_database_schema()
 
-    assert len(fake_connection.run_sync_calls) == 1
+    assert len(fake_connection.run_sync_calls) == 2
     run_sync_argument = fake_connection.run_sync_calls[0]
     assert getattr(run_sync_argument, "__name__", "") == "create_all"
     assert getattr(run_sync_argument, "__self__", None) is session_module.Base.metadata
+    assert fake_connection.run_sync_calls[1] is session_module.apply_migrations
+
+
+@pytest.mark.asyncio
+async def test_get_session_writer_queues_writes_only_for_production_sqlite(monkeypatch: pytest.MonkeyPatch) -> None:
+    database_config = SimpleNamespace(DRIVER="sqlite", SQLITE_PROFILE="default", SQLITE_WRITE_BATCH_SIZE=50)
+    monkeypatch.setattr(session_module, "get_config", lambda: SimpleNamespace(DATABASE_CONFIG=database_config))
+    monkeypatch.setattr(session_module, "get_session_factory", lambda: object())
+
+    default_writer = session_module.get_session_writer()
+    session_module.get_session_writer.cache_clear()
+    database_config.SQLITE_PROFILE = "production"
+    production_writer = session_module.get_session_writer()
+
+    assert type(default_writer) is session_module.SessionWriter
+    assert isinstance(production_writer, session_module.QueuedSessionWriter)
+    assert production_writer._max_batch_size == 50
+
+
+@pytest.mark.asyncio
+async def test_get_read_engine_targets_replica_host_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: list[str] = []
+    database_config = SimpleNamespace(
+        DRIVER="postgres",
+        USER="db_user",
+        PASSWORD="db_password",
+        HOST="primary",
+        PORT=5432,
+        DATABASE="status",
+        ECHO=False,
+        POOL_SIZE=5,
+        MAX_OVERFLOW=10,
+        POOL_TIMEOUT=12,
+        POOL_RECYCLE=120,
+        READ_REPLICA_HOST=None,
+        READ_REPLICA_PORT=None,
+        READ_REPLICA_MAX_LAG_SECONDS=5.0,
+        READ_REPLICA_LAG_CHECK_SECONDS=5.0,
+        READ_REPLICA_RETRY_SECONDS=30.0,
+    )
+
+    def fake_create_async_engine(url, **kwargs):
+        captured.append(str(url))
+        return FakeEngine()
+
+    monkeypatch.setattr(session_module, "get_config", lambda: SimpleNamespace(DATABASE_CONFIG=database_config))
+    monkeypatch.setattr(session_module, "create_async_engine", fake_create_async_engine)
+    monkeypatch.setattr(session_module, "get_pool_metrics", lambda name: RecordingPoolMetrics())
+
+    assert session_module.get_read_engine() is None
+    assert type(session_module.get_session_reader()) is session_module.SessionReader
+
+    session_module.get_read_engine.cache_clear()
+    session_module.get_session_reader.cache_clear()
+    database_config.READ_REPLICA_HOST = "replica"
+
+    assert session_module.get_read_engine() is not None
+    assert isinstance(session_module.get_session_reader(), session_module.ReplicaSessionReader)
+    assert [url.split("@")[1] for url in captured] == ["primary:5432/status", "replica:5432/status"]
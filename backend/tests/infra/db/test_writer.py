@@ -0,0 +1,154 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+import infra.db.session as session_module
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.product import Product
+from core.exceptions.component_already_exists_error import ComponentAlreadyExistsError
+from infra.adapter.postgres_component_repository import PostgresComponentRepository
+from infra.adapter.postgres_product_repository import PostgresProductRepository
+from infra.db.writer import QueuedSessionWriter
+
+
+class RecordingWriter(QueuedSessionWriter):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_sizes: list[int] = []
+
+    async def _write_batch(self, batch) -> None:
+        self.batch_sizes.append(len(batch))
+        await super()._write_batch(batch)
+
+
+@pytest.fixture
+async def production_sqlite(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+
+    config = SimpleNamespace(
+        DATABASE_CONFIG=SimpleNamespace(
+            DRIVER="sqlite",
+            SQLITE_PATH=str(tmp_path / "status_page.db"),
+            SQLITE_PROFILE="production",
+            SQLITE_SYNCHRONOUS="NORMAL",
+            SQLITE_CACHE_SIZE_KIB=2_048,
+            SQLITE_MMAP_SIZE_BYTES=1_048_576,
+            SQLITE_BUSY_TIMEOUT_MS=1_000,
+            SQLITE_WRITE_BATCH_SIZE=8,
+            ECHO=False,
+        )
+    )
+    monkeypatch.setattr(session_module, "get_config", lambda: config)
+
+    await session_module.create_database_schema()
+
+    try:
+        yield session_module.get_session_factory()
+    finally:
+        await session_module.close_engine()
+
+
+def _component(product_id: int, name: str) -> Component:
+    return Component(
+        id=None,
+        product_id=product_id,
+        name=name,
+        type=ComponentType.BACKEND,
+        monitoring_config=HealthcheckConfig(health_url=f"https://{name}.example.com/health"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_production_profile_applies_wal_and_pragmas(production_sqlite) -> None:
+    async with production_sqlite() as session:
+        journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar_one()
+        synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar_one()
+        cache_size = (await session.execute(text("PRAGMA cache_size"))).scalar_one()
+        foreign_keys = (await session.execute(text("PRAGMA foreign_keys"))).scalar_one()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1
+    assert cache_size == -2_048
+    assert foreign_keys == 1
+    assert isinstance(session_module.get_session_writer(), QueuedSessionWriter)
+
+
+@pytest.mark.asyncio
+async def test_queued_writer_batches_concurrent_writes_and_isolates_failures(production_sqlite) -> None:
+    writer = RecordingWriter(production_sqlite, max_batch_size=8)
+    product_repository = PostgresProductRepository(production_sqlite, writer=writer)
+    component_repository = PostgresComponentRepository(production_sqlite, writer=writer)
+
+    product = await product_repository.save(Product(id=None, name="Payments"))
+    await component_repository.save(_component(product.id or 0, "taken"))
+
+    results = await asyncio.gather(
+        *[component_repository.save(_component(product.id or 0, f"api-{index}")) for index in range(12)],
+        component_repository.save(_component(product.id or 0, "taken")),
+        return_exceptions=True,
+    )
+    stored = await product_repository.find_by_id(product.id or 0)
+    await writer.close()
+
+    assert [isinstance(result, Component) for result in results] == [True] * 12 + [False]
+    assert isinstance(results[-1], ComponentAlreadyExistsError)
+    assert stored is not None
+    assert sorted(component.name for component in stored.components) == sorted(
+        ["taken", *[f"api-{index}" for index in range(12)]]
+    )
+    assert writer.batch_sizes[:2] == [1, 1]
+    assert writer.batch_sizes[2:] == [8, 5]
+
+
+@pytest.mark.asyncio
+async def test_queued_writer_close_drains_pending_jobs(production_sqlite) -> None:
+    writer = QueuedSessionWriter(production_sqlite)
+    product_repository = PostgresProductRepository(production_sqlite, writer=writer)
+
+    pending = [asyncio.create_task(product_repository.save(Product(id=None, name=f"p-{index}"))) for index in range(3)]
+    await asyncio.sleep(0)
+    await writer.close()
+
+    assert [task.result().name for task in pending] == ["p-0", "p-1", "p-2"]
+
+
+@pytest.mark.asyncio
+async def test_queued_writer_survives_a_failing_session_factory(production_sqlite) -> None:
+    failures = [ConnectionError("database unavailable")]
+
+    def _session_factory():
+        if failures:
+            raise failures.pop()
+
+        return production_sqlite()
+
+    writer = QueuedSessionWriter(_session_factory)  # type: ignore
+
+    async def _select_one(session) -> int:
+        return (await session.execute(text("SELECT 1"))).scalar_one()
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(writer.run(_select_one), timeout=5)
+
+    assert await asyncio.wait_for(writer.run(_select_one), timeout=5) == 1
+
+    blocker = asyncio.Event()
+
+    async def _blocked(session) -> None:
+        await blocker.wait()
+
+    pending = [asyncio.create_task(writer.run(_blocked)), asyncio.create_task(writer.run(_select_one))]
+    await asyncio.sleep(0.05)
+    assert writer._task is not None
+    writer._task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=5)
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+    await writer.close()
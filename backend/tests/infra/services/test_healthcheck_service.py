@@ -10,7 +10,7 @@ from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.status_type import StatusType
 from infra.adapter.dict_component_cache import DictComponentCache
 from infra.services.healthcheck_service import HealthcheckService
-from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeScheduler
+from tests.support.fakes import FakeComponentRepository, FakeIncidentRepository, FakeLogRepository, FakeScheduler
 from use_cases.component.get_all_components_unpaginated_use_case import GetAllComponentsUnpaginatedUseCase
 from use_cases.component.update_component_status_use_case import UpdateComponentStatusUseCase
 
@@ -66,7 +66,11 @@ async def service_factory() -> AsyncGenerator:
             cache=cache,
             http_client=http_client,
             get_components_use_case=GetAllComponentsUnpaginatedUseCase(component_repository),
-            update_component_use_case=UpdateComponentStatusUseCase(component_repository, log_repository),
+            update_component_use_case=UpdateComponentStatusUseCase(
+                component_repository,
+                log_repository,
+                FakeIncidentRepository(),
+            ),
         )
 
         return service, component_repository, log_repository, scheduler, cache
@@ -0,0 +1,47 @@
+import pytest
+
+from infra.services.log_archive_service import LogArchiveService
+from tests.support.fakes import FakeScheduler
+
+
+class RecordingArchiveUseCase:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls: list[int] = []
+        self.error = error
+
+    async def execute(self, retention_days: int) -> int:
+        self.calls.append(retention_days)
+
+        if self.error is not None:
+            raise self.error
+
+        return 3
+
+
+def test_start_registers_archive_job() -> None:
+    scheduler = FakeScheduler()
+    service = LogArchiveService(
+        interval_seconds=600,
+        retention_days=14,
+        scheduler=scheduler,
+        archive_logs_use_case=RecordingArchiveUseCase(),
+    )
+
+    service.start()
+
+    assert scheduler.jobs["archive_health_checks"]["interval_seconds"] == 600
+
+
+@pytest.mark.asyncio
+async def test_archive_job_runs_use_case_and_swallows_errors() -> None:
+    use_case = RecordingArchiveUseCase(error=RuntimeError("disk full"))
+    service = LogArchiveService(
+        interval_seconds=600,
+        retention_days=14,
+        scheduler=FakeScheduler(),
+        archive_logs_use_case=use_case,
+    )
+
+    await service._archive_logs()
+
+    assert use_case.calls == [14]
@@ -0,0 +1,41 @@
+import pytest
+
+from infra.services.pool_stats_service import PoolStatsService
+from tests.support.fakes import FakeScheduler
+
+
+def test_start_registers_pool_stats_job() -> None:
+    scheduler = FakeScheduler()
+    service = PoolStatsService(interval_seconds=30, scheduler=scheduler, get_pool_stats=dict)
+
+    service.start()
+
+    assert scheduler.jobs["log_db_pool_stats"]["interval_seconds"] == 30
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_job_logs_each_engine_and_swallows_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    logged: list[tuple[str, dict]] = []
+
+    class RecordingLogger:
+        def info(self, event: str, **kwargs) -> None:
+            logged.append((event, kwargs))
+
+        def exception(self, event: str, **kwargs) -> None:
+            logged.append((event, kwargs))
+
+    def failing_stats() -> dict:
+        raise RuntimeError("pool gone")
+
+    monkeypatch.setattr("infra.services.pool_stats_service.logger", RecordingLogger())
+
+    stats = {"primary": {"in_use": 2}, "replica": {"in_use": 0}}
+
+    await PoolStatsService(30, FakeScheduler(), lambda: stats)._log_pool_stats()
+    await PoolStatsService(30, FakeScheduler(), failing_stats)._log_pool_stats()
+
+    assert logged[:2] == [
+        ("db_pool_stats", {"engine": "primary", "in_use": 2}),
+        ("db_pool_stats", {"engine": "replica", "in_use": 0}),
+    ]
+    assert "pool gone" in logged[2][0]
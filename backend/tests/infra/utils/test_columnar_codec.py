@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+from infra.utils.columnar_codec import (
+    decode_segment,
+    decode_segment_header,
+    decode_varint,
+    encode_segment,
+    encode_varint,
+    pack_bits,
+    unpack_bits,
+    zigzag_decode,
+    zigzag_encode,
+)
+
+
+def _log(checked_at: datetime, **overrides) -> HealthcheckLog:
+    values = {
+        "component_id": 7,
+        "checked_at": checked_at,
+        "is_successful": True,
+        "status_code": 200,
+        "response_time_ms": 120,
+        "status_before": StatusType.OPERATIONAL,
+        "status_after": StatusType.OPERATIONAL,
+        "error_message": None,
+    }
+    values.update(overrides)
+
+    return HealthcheckLog(**values)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**35])
+def test_varint_round_trip(value: int) -> None:
+    buffer = bytearray()
+    encode_varint(value, buffer)
+
+    decoded, offset = decode_varint(bytes(buffer), 0)
+
+    assert decoded == value
+    assert offset == len(buffer)
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 63, -64, 10_000_000, -10_000_000])
+def test_zigzag_round_trip(value: int) -> None:
+    assert zigzag_encode(value) >= 0
+    assert zigzag_decode(zigzag_encode(value)) == value
+
+
+def test_pack_bits_round_trip() -> None:
+    flags = [True, False, False, True, True, False, True, True, False, True]
+
+    packed = pack_bits(flags)
+
+    assert len(packed) == 2
+    assert unpack_bits(packed, len(flags)) == flags
+
+
+def test_encode_segment_round_trips_all_columns() -> None:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    logs = [
+        _log(start + timedelta(seconds=60 * index), response_time_ms=100 + index)
+        for index in range(5)
+    ]
+    logs.append(
+        _log(
+            start + timedelta(minutes=10, microseconds=123),
+            is_successful=False,
+            status_code=None,
+            response_time_ms=30,
+            status_before=StatusType.DEGRADED,
+            status_after=StatusType.OUTAGE,
+            error_message="Request timeout ⏱",
+        )
+    )
+
+    payload = encode_segment(7, list(reversed(logs)))
+    header = decode_segment_header(payload)
+    decoded = decode_segment(payload)
+
+    assert header.component_id == 7
+    assert header.row_count == 6
+    assert header.first_checked_at == logs[0].checked_at
+    assert header.last_checked_at == logs[-1].checked_at
+    assert decoded == logs
+
+
+def test_decode_segment_filters_by_time_range() -> None:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    logs = [_log(start + timedelta(minutes=index)) for index in range(10)]
+
+    decoded = decode_segment(
+        encode_segment(7, logs),
+        since=start + timedelta(minutes=3),
+        until=start + timedelta(minutes=6),
+    )
+
+    assert [log.checked_at for log in decoded] == [start + timedelta(minutes=index) for index in (3, 4, 5)]
+
+
+def test_decode_segment_rejects_foreign_payload() -> None:
+    with pytest.raises(ValueError, match="Not a health check segment"):
+        decode_segment_header(b"\x00" * 64)
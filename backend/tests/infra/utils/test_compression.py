@@ -0,0 +1,48 @@
+import gzip
+
+import pytest
+
+import infra.utils.compression as compression_module
+from infra.utils.compression import ContentEncoding, compress, compress_body, negotiate_encoding
+
+
+def test_negotiate_encoding_honours_weights_and_availability(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression_module, "zstd", None)
+    monkeypatch.setattr(compression_module, "brotli", object())
+
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") is ContentEncoding.GZIP
+    assert negotiate_encoding("gzip, br, zstd") is ContentEncoding.BROTLI
+    assert negotiate_encoding("br;q=0.5, gzip;q=0.8") is ContentEncoding.GZIP
+    assert negotiate_encoding("gzip;q=0, *") is ContentEncoding.BROTLI
+    assert negotiate_encoding("zstd") is None
+    assert negotiate_encoding("gzip;q=bogus") is None
+
+
+def test_gzip_output_round_trips_and_is_stable() -> None:
+    body = b'{"uptime":100.0}' * 200
+
+    compressed = compress(body, ContentEncoding.GZIP)
+
+    assert gzip.decompress(compressed) == body
+    assert compress(body, ContentEncoding.GZIP) == compressed
+    assert len(compressed) < len(body) // 10
+
+
+@pytest.mark.asyncio
+async def test_compress_body_offloads_large_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    offloaded: list[int] = []
+
+    async def fake_to_thread(function, body, encoding):
+        offloaded.append(len(body))
+        return function(body, encoding)
+
+    monkeypatch.setattr(compression_module.asyncio, "to_thread", fake_to_thread)
+
+    small = await compress_body(b"a" * 10, ContentEncoding.GZIP, offload_size=100)
+    large = await compress_body(b"a" * 100, ContentEncoding.GZIP, offload_size=100)
+
+    assert gzip.decompress(small) == b"a" * 10
+    assert gzip.decompress(large) == b"a" * 100
+    assert offloaded == [100]
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from core.exceptions.invalid_cursor_error import InvalidCursorError
+from infra.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    checked_at = datetime(2026, 2, 3, 4, 5, 6, 789, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(checked_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (checked_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "bm9wZQ", "!!!"])
+def test_decode_cursor_rejects_malformed_values(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
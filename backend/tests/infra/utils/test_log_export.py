@@ -0,0 +1,80 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+from infra.utils.log_export import EXPORT_FIELDS, ExportFormat, decode_logs, encode_logs
+
+START = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+async def _logs(count: int):
+    for index in range(count):
+        yield HealthcheckLog(
+            component_id=7,
+            checked_at=START + timedelta(minutes=index),
+            is_successful=index % 3 != 0,
+            status_code=200 if index % 3 else None,
+            response_time_ms=index,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.DEGRADED if index % 3 == 0 else StatusType.OPERATIONAL,
+            error_message="timeout, retrying" if index % 3 == 0 else None,
+            id=index + 1,
+        )
+
+
+async def _collect(export_format: ExportFormat, compress: bool = False, count: int = 25) -> tuple[bytes, int]:
+    chunks = [chunk async for chunk in encode_logs(_logs(count), export_format, compress=compress, chunk_rows=10)]
+
+    return b"".join(chunks), len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_encode_logs_as_ndjson_in_row_chunks() -> None:
+    payload, chunk_count = await _collect(ExportFormat.NDJSON)
+    records = [json.loads(line) for line in payload.decode().splitlines()]
+
+    assert chunk_count == 3
+    assert len(records) == 25
+    assert records[0]["checked_at"] == "2026-04-01T00:00:00+00:00"
+    assert records[0]["status_after"] == "DEGRADED"
+    assert records[1]["error_message"] is None
+
+
+@pytest.mark.asyncio
+async def test_encode_logs_as_gzipped_csv() -> None:
+    payload, _ = await _collect(ExportFormat.CSV, compress=True)
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(payload).decode())))
+
+    assert tuple(rows[0].keys()) == EXPORT_FIELDS
+    assert len(rows) == 25
+    assert rows[0]["error_message"] == "timeout, retrying"
+    assert rows[1]["status_code"] == "200"
+
+
+@pytest.mark.asyncio
+async def test_encode_logs_without_rows() -> None:
+    ndjson, _ = await _collect(ExportFormat.NDJSON, count=0)
+    csv_payload, _ = await _collect(ExportFormat.CSV, count=0)
+
+    assert ndjson == b""
+    assert csv_payload.decode() == ",".join(EXPORT_FIELDS) + "\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_decode_logs_round_trips_exports(export_format: ExportFormat) -> None:
+    payload, _ = await _collect(export_format, count=6)
+    expected = [log async for log in _logs(6)]
+
+    decoded = list(decode_logs(io.StringIO(payload.decode()), export_format))
+
+    assert [log.id for log in decoded] == [None] * 6
+    assert [(log.checked_at, log.status_code, log.is_successful, log.error_message) for log in decoded] == [
+        (log.checked_at, log.status_code, log.is_successful, log.error_message) for log in expected
+    ]
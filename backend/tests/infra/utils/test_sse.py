@@ -0,0 +1,6 @@
+from infra.utils.sse import encode_event
+
+
+def test_encode_event_prefixes_every_data_line() -> None:
+    assert encode_event("status", '{"a":1}', event_id="x-1") == b'event: status\nid: x-1\ndata: {"a":1}\n\n'
+    assert encode_event("note", "one\ntwo") == b"event: note\ndata: one\ndata: two\n\n"
@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.responses import Response
+
+from infra.web.middleware.compression_middleware import CompressionMiddleware
+
+LARGE_BODY = b'{"status":"OPERATIONAL"}' * 100
+
+
+@pytest.fixture
+def compressed_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, offload_size=65_536)
+
+    @app.get("/large")
+    async def large_endpoint() -> Response:
+        return Response(content=LARGE_BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small_endpoint() -> Response:
+        return Response(content=b'{"ok":true}', media_type="application/json")
+
+    @app.get("/events")
+    async def events_endpoint() -> Response:
+        return Response(content=LARGE_BODY, media_type="text/event-stream")
+
+    @app.get("/stream")
+    async def stream_endpoint() -> StreamingResponse:
+        async def chunks():
+            yield LARGE_BODY
+            yield LARGE_BODY
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+async def _get(app: FastAPI, path: str, accept_encoding: str = "gzip") -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        request = client.build_request("GET", path, headers={"Accept-Encoding": accept_encoding})
+        return await client.send(request, stream=True)
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_compressed_and_etag_is_weakened(compressed_app: FastAPI) -> None:
+    response = await _get(compressed_app, "/large")
+    await response.aread()
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(LARGE_BODY)
+    assert response.content == LARGE_BODY
+
+
+@pytest.mark.asyncio
+async def test_small_streamed_and_event_stream_bodies_are_left_alone(compressed_app: FastAPI) -> None:
+    for path in ("/small", "/events", "/stream"):
+        response = await _get(compressed_app, path)
+        await response.aread()
+
+        assert "content-encoding" not in response.headers, path
+
+
+@pytest.mark.asyncio
+async def test_clients_without_a_supported_encoding_get_identity(compressed_app: FastAPI) -> None:
+    response = await _get(compressed_app, "/large", accept_encoding="identity")
+    await response.aread()
+
+    assert "content-encoding" not in response.headers
+    assert response.content == LARGE_BODY
+
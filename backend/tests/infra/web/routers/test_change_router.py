@@ -0,0 +1,53 @@
+import pytest
+from fastapi import FastAPI
+
+import infra.web.routers.change_router as change_router_module
+from core.domain.change import Change, ChangeKind
+from core.domain.product import Product
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeProductRepository
+
+
+@pytest.fixture
+def change_tracker() -> InMemoryChangeTracker:
+    return InMemoryChangeTracker(initial_version=10, max_changes=2)
+
+
+@pytest.fixture
+def change_app(monkeypatch: pytest.MonkeyPatch, change_tracker: InMemoryChangeTracker) -> FastAPI:
+    product_repo = FakeProductRepository(initial_products=[Product(id=1, name="Payments")])
+
+    monkeypatch.setattr(change_router_module, "get_change_tracker", lambda: change_tracker)
+    monkeypatch.setattr(change_router_module, "get_product_repository", lambda: product_repo)
+    monkeypatch.setattr(change_router_module, "get_component_repository", lambda: FakeComponentRepository())
+    monkeypatch.setattr(change_router_module, "get_log_repository", lambda: FakeLogRepository())
+
+    app = FastAPI()
+    app.include_router(change_router_module.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_get_changes_returns_delta_and_gone_when_aged_out(
+    change_app: FastAPI,
+    change_tracker: InMemoryChangeTracker,
+    async_client_factory,
+) -> None:
+    client = await async_client_factory(change_app)
+
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    await change_tracker.record_change(Change(ChangeKind.COMPONENT, 5))
+    delta = await client.get("/changes", params={"since": 10})
+
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    expired = await client.get("/changes", params={"since": 10})
+
+    assert delta.status_code == 200
+    payload = delta.json()
+    assert payload["version"] == 12
+    assert [product["name"] for product in payload["products"]] == ["Payments"]
+    assert payload["deletedComponentIds"] == [5]
+    assert payload["daySummaries"] == []
+    assert expired.status_code == 410
+    assert "resync" in expired.json()["detail"]
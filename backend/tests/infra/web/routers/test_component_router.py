@@ -8,7 +8,9 @@ from core.domain.component import Component
 from core.domain.component_type import ComponentType
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.healthcheck_log import HealthcheckLog
 from core.domain.status_type import StatusType
+from infra.adapter.memory_change_tracker import get_change_tracker
 from tests.support.fakes import FakeComponentRepository, FakeLogRepository
 
 
@@ -36,6 +38,19 @@ def component_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
     )
 
     log_repo = FakeLogRepository(
+        initial_logs=[
+            HealthcheckLog(
+                component_id=1,
+                checked_at=datetime(2026, 1, 1, 0, minute, tzinfo=timezone.utc),
+                is_successful=minute != 1,
+                status_code=200 if minute != 1 else 500,
+                response_time_ms=12,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+            for minute in range(3)
+        ],
         precomputed_summary={
             1: [
                 HealthcheckLogDaySummary(
@@ -127,6 +142,53 @@ async def test_get_all_components(component_app: FastAPI, async_client_factory)
     assert first_summary["overallStatus"] == "OPERATIONAL"
 
 
+@pytest.mark.asyncio
+async def test_get_all_components_revalidates_with_etag(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    first = await client.get("/component", params={"product_id": 50})
+    conditional = {"If-None-Match": first.headers["etag"]}
+    unchanged = await client.get("/component", params={"product_id": 50}, headers=conditional)
+    await get_change_tracker().record_change()
+    changed = await client.get("/component", params={"product_id": 50}, headers=conditional)
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_components_can_return_columnar_day_bars(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    objects = await client.get("/component", params={"product_id": 50})
+    by_query = await client.get("/component", params={"product_id": 50, "day_bars": "columnar"})
+    by_accept = await client.get(
+        "/component",
+        params={"product_id": 50},
+        headers={"Accept": "application/vnd.status-page.columnar+json, application/json;q=0.5"},
+    )
+
+    assert by_query.headers["content-type"] == "application/vnd.status-page.columnar+json"
+    assert "Accept" in by_query.headers["vary"]
+    assert by_query.headers["etag"] != objects.headers["etag"]
+    assert by_accept.content == by_query.content
+
+    first, second = by_query.json()["content"]
+    assert "healthcheckDayLogs" not in first
+    assert first["healthcheckDayBars"] == {
+        "startDate": "2026-01-01",
+        "count": 1,
+        "totalChecks": [3],
+        "successfulChecks": [3],
+        "uptime": [100.0],
+        "avgResponseTime": [12],
+        "maxResponseTime": [20],
+        "overallStatus": [0],
+    }
+    assert second["healthcheckDayBars"]["count"] == 0
+
+
 @pytest.mark.asyncio
 async def test_update_component_returns_404_when_missing(component_app: FastAPI, async_client_factory) -> None:
     client = await async_client_factory(component_app)
@@ -156,3 +218,57 @@ async def test_delete_component_returns_204(component_app: FastAPI, async_client
     response = await client.delete("/component/1")
 
     assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_get_component_history(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    response = await client.get(
+        "/component/1/history",
+        params={"since": "2026-01-01T00:00:00Z", "until": "2026-01-03T00:00:00Z"},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["componentId"] == 1
+    assert payload["resolution"] == "HOUR"
+    assert [bucket["totalChecks"] for bucket in payload["buckets"]] == [3]
+
+
+@pytest.mark.asyncio
+async def test_get_component_history_returns_404_and_422(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    missing = await client.get("/component/999/history")
+    invalid = await client.get(
+        "/component/1/history",
+        params={"since": "2026-01-03T00:00:00Z", "until": "2026-01-01T00:00:00Z"},
+    )
+
+    assert missing.status_code == 404
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_component_checks_paginates_with_cursor(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    first = await client.get("/component/1/checks", params={"page_size": 2})
+    second = await client.get("/component/1/checks", params={"page_size": 2, "cursor": first.json()["nextCursor"]})
+    failures = await client.get("/component/1/checks", params={"outcome": "FAILURE"})
+
+    assert first.status_code == 200
+    assert [check["statusCode"] for check in first.json()["content"]] == [200, 500]
+    assert second.json()["nextCursor"] is None
+    assert len(second.json()["content"]) == 1
+    assert [check["isSuccessful"] for check in failures.json()["content"]] == [False]
+
+
+@pytest.mark.asyncio
+async def test_get_component_checks_rejects_bad_cursor(component_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(component_app)
+
+    response = await client.get("/component/1/checks", params={"cursor": "garbage"})
+
+    assert response.status_code == 422
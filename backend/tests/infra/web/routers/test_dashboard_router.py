@@ -0,0 +1,85 @@
+import pytest
+from fastapi import FastAPI
+
+import infra.web.routers.dashboard_router as dashboard_router_module
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from infra.adapter.memory_dashboard_cache import InMemoryDashboardCache
+from infra.db import reader as reader_module
+from tests.support.fakes import FakeLogRepository, FakeProductRepository
+
+
+@pytest.fixture
+def dashboard_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    product_repo = FakeProductRepository(
+        initial_products=[
+            Product(
+                id=1,
+                name="Payments",
+                components=[
+                    Component(
+                        id=10,
+                        product_id=1,
+                        name="payments-api",
+                        type=ComponentType.BACKEND,
+                        monitoring_config=HealthcheckConfig(health_url="https://payments.example.com/health"),
+                        current_status=StatusType.DEGRADED,
+                    )
+                ],
+            )
+        ]
+    )
+    change_tracker = InMemoryChangeTracker()
+    dashboard_cache = InMemoryDashboardCache()
+    log_repo = FakeLogRepository()
+
+    monkeypatch.setattr(dashboard_router_module, "get_product_repository", lambda: product_repo)
+    monkeypatch.setattr(dashboard_router_module, "get_log_repository", lambda: log_repo)
+    monkeypatch.setattr(dashboard_router_module, "get_change_tracker", lambda: change_tracker)
+    monkeypatch.setattr(dashboard_router_module, "get_dashboard_cache", lambda: dashboard_cache)
+
+    app = FastAPI()
+    app.include_router(dashboard_router_module.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_returns_versioned_snapshot(dashboard_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(dashboard_app)
+
+    first = await client.get("/dashboard")
+    second = await client.get("/dashboard")
+
+    assert first.status_code == 200
+    payload = first.json()
+    assert payload["version"] == 0
+    assert payload["products"][0]["components"][0]["currentStatus"] == "DEGRADED"
+    assert second.json()["generatedAt"] == payload["generatedAt"]
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_builds_from_primary_reads(
+    dashboard_app: FastAPI,
+    async_client_factory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    product_repo = dashboard_router_module.get_product_repository()
+    find_all = product_repo.find_all_without_pagination
+    primary_only: list[bool] = []
+
+    async def _find_all(*args, **kwargs):
+        primary_only.append(reader_module._primary_only.get())
+        return await find_all(*args, **kwargs)
+
+    monkeypatch.setattr(product_repo, "find_all_without_pagination", _find_all)
+    client = await async_client_factory(dashboard_app)
+
+    response = await client.get("/dashboard")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert primary_only == [True]
@@ -0,0 +1,114 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+
+import infra.web.routers.export_router as export_router_module
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeProductRepository
+
+START = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def export_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    product_repo = FakeProductRepository(initial_products=[Product(id=50, name="Payments")])
+    component_repo = FakeComponentRepository(
+        initial_components=[
+            Component(
+                id=component_id,
+                product_id=50,
+                name=f"payments-{component_id}",
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+            )
+            for component_id in (1, 2)
+        ]
+    )
+    log_repo = FakeLogRepository(
+        initial_logs=[
+            HealthcheckLog(
+                component_id=component_id,
+                checked_at=START + timedelta(hours=hour),
+                is_successful=True,
+                status_code=200,
+                response_time_ms=15,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+            for component_id in (1, 2)
+            for hour in range(3)
+        ]
+    )
+
+    monkeypatch.setattr(export_router_module, "get_product_repository", lambda: product_repo)
+    monkeypatch.setattr(export_router_module, "get_component_repository", lambda: component_repo)
+    monkeypatch.setattr(export_router_module, "get_log_repository", lambda: log_repo)
+
+    app = FastAPI()
+    app.include_router(export_router_module.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_export_checks_streams_ndjson(export_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(export_app)
+
+    response = await client.get(
+        "/export/checks",
+        params={"component_id": 1, "since": "2026-05-01T01:00:00Z"},
+        headers={"Accept-Encoding": "identity"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    assert [json.loads(line)["checked_at"] for line in response.text.splitlines()] == [
+        "2026-05-01T01:00:00+00:00",
+        "2026-05-01T02:00:00+00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_checks_streams_gzipped_csv_for_product(export_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(export_app)
+
+    async with client.stream(
+        "GET",
+        "/export/checks",
+        params={"product_id": 50, "format": "csv"},
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    lines = gzip.decompress(raw).decode().splitlines()
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert 'filename="health_checks.csv"' in response.headers["content-disposition"]
+    assert lines[0].startswith("id,component_id,checked_at")
+    assert len(lines) == 7
+
+
+@pytest.mark.asyncio
+async def test_export_checks_returns_404_and_422(export_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(export_app)
+
+    missing_product = await client.get("/export/checks", params={"product_id": 999})
+    missing_component = await client.get("/export/checks", params={"component_id": 999})
+    invalid_range = await client.get(
+        "/export/checks",
+        params={"since": "2026-05-02T00:00:00Z", "until": "2026-05-01T00:00:00Z"},
+    )
+
+    assert missing_product.status_code == 404
+    assert missing_component.status_code == 404
+    assert invalid_range.status_code == 422
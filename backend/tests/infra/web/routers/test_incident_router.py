@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+
+import infra.web.routers.incident_router as incident_router_module
+from core.domain.incident import Incident
+from core.domain.status_type import StatusType
+from tests.support.fakes import FakeIncidentRepository
+
+START = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def incident_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    incident_repo = FakeIncidentRepository(
+        initial_incidents=[
+            Incident(
+                id=None,
+                component_id=1,
+                started_at=START,
+                status=StatusType.OUTAGE,
+                ended_at=START + timedelta(minutes=15),
+            ),
+            Incident(id=None, component_id=2, started_at=START + timedelta(hours=1), status=StatusType.DEGRADED),
+        ],
+        component_products={1: 50, 2: 50},
+    )
+
+    monkeypatch.setattr(incident_router_module, "get_incident_repository", lambda: incident_repo)
+
+    app = FastAPI()
+    app.include_router(incident_router_module.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_get_incidents_returns_page(incident_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(incident_app)
+
+    response = await client.get("/incidents", params={"product_id": 50})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["totalElements"] == 2
+    assert payload["content"][0]["isOpen"] is True
+    assert payload["content"][1]["durationSeconds"] == 900
+    assert payload["content"][1]["endedAt"] == "2026-06-01T00:15:00Z"
+
+
+@pytest.mark.asyncio
+async def test_get_incidents_filters_by_status_and_state(incident_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(incident_app)
+
+    outages = await client.get("/incidents", params={"status": "OUTAGE"})
+    closed = await client.get("/incidents", params={"is_open": "false"})
+    invalid = await client.get("/incidents", params={"since": "2026-06-02T00:00:00Z", "until": "2026-06-01T00:00:00Z"})
+
+    assert [incident["componentId"] for incident in outages.json()["content"]] == [1]
+    assert [incident["componentId"] for incident in closed.json()["content"]] == [1]
+    assert invalid.status_code == 422
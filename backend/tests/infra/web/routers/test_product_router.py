@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 from fastapi import FastAPI
 
+import infra.web.response_cache as response_cache_module
 import infra.web.routers.product_router as product_router_module
 from core.domain.component import Component
 from core.domain.component_type import ComponentType
@@ -10,6 +12,8 @@ from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
 from core.domain.product import Product
 from core.domain.status_type import StatusType
+from infra.adapter.memory_change_tracker import get_change_tracker
+from infra.adapter.memory_response_cache import get_response_cache
 from tests.support.fakes import FakeLogRepository, FakeProductRepository
 
 
@@ -95,6 +99,93 @@ async def test_get_all_products_returns_page_with_component_summaries(
     assert first_summary["overallStatus"] == "OPERATIONAL"
 
 
+@pytest.mark.asyncio
+async def test_get_all_products_can_skip_totals(product_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(product_app)
+
+    counted = await client.get("/product")
+    uncounted = await client.get("/product", params={"include_total": "false"})
+
+    assert (counted.json()["totalElements"], counted.json()["hasNext"]) == (1, False)
+    assert uncounted.status_code == 200
+    assert uncounted.json()["totalElements"] is None
+    assert uncounted.json()["totalPages"] is None
+    assert uncounted.json()["hasNext"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_filters_by_search(product_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(product_app)
+
+    matched = await client.get("/product", params={"search": "PAYMENTS-A"})
+    unmatched = await client.get("/product", params={"search": "ledger"})
+
+    assert [product["name"] for product in matched.json()["content"]] == ["Payments"]
+    assert matched.json()["content"][0]["components"][0]["name"] == "payments-api"
+    assert unmatched.json()["content"] == []
+    assert unmatched.json()["totalElements"] == 0
+    assert matched.headers["etag"] != unmatched.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_can_leave_out_components_and_summaries(
+    product_app: FastAPI,
+    async_client_factory,
+) -> None:
+    client = await async_client_factory(product_app)
+
+    full = await client.get("/product")
+    without_summaries = await client.get("/product", params={"include": "components"})
+    zero_days = await client.get("/product", params={"summary_days": 0})
+    names_only = await client.get("/product", params={"include": ""})
+    unknown = await client.get("/product", params={"include": "components,incidents"})
+
+    assert full.json()["content"][0]["components"][0]["healthcheckDayLogs"] != []
+    assert without_summaries.json()["content"][0]["components"][0]["healthcheckDayLogs"] == []
+    assert zero_days.json() == without_summaries.json()
+    assert names_only.json()["content"][0]["name"] == "Payments"
+    assert names_only.json()["content"][0]["components"] == []
+    assert len({full.headers["etag"], without_summaries.headers["etag"], names_only.headers["etag"]}) == 3
+    assert unknown.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_answers_304_until_data_changes(
+    product_app: FastAPI,
+    async_client_factory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = await async_client_factory(product_app)
+
+    first = await client.get("/product")
+    etag = first.headers["etag"]
+    other_page = await client.get("/product", params={"page_size": 5}, headers={"If-None-Match": etag})
+
+    class ExplodingUseCase:
+        def __init__(self, *args, **kwargs) -> None:
+            raise AssertionError("use case must not run on a matching ETag")
+
+    use_case_class = product_router_module.GetAllProductsUseCase
+    monkeypatch.setattr(product_router_module, "GetAllProductsUseCase", ExplodingUseCase)
+    unchanged = await client.get("/product", headers={"If-None-Match": f'W/{etag}, "other"'})
+    monkeypatch.setattr(product_router_module, "GetAllProductsUseCase", use_case_class)
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-cache"
+    assert other_page.status_code == 200
+    assert other_page.headers["etag"] != etag
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert unchanged.content == b""
+
+    await get_change_tracker().record_change()
+
+    changed = await client.get("/product", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_get_product_by_id_returns_404_when_missing(product_app: FastAPI, async_client_factory) -> None:
     client = await async_client_factory(product_app)
@@ -105,6 +196,56 @@ async def test_get_product_by_id_returns_404_when_missing(product_app: FastAPI,
     assert response.json()["detail"] == "Product not found"
 
 
+@pytest.mark.asyncio
+async def test_product_reads_are_served_from_response_cache_until_invalidated(
+    product_app: FastAPI,
+    async_client_factory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = await async_client_factory(product_app)
+
+    by_id = await client.get("/product/1")
+    by_name = await client.get("/product/name/Payments")
+    listing = await client.get("/product")
+
+    monkeypatch.setattr(product_router_module, "get_product_repository", lambda: FakeProductRepository())
+
+    assert (await client.get("/product/1")).content == by_id.content
+    assert (await client.get("/product/name/Payments")).content == by_name.content
+    assert (await client.get("/product")).content == listing.content
+
+    await get_response_cache().invalidate(["component:10"])
+
+    assert (await client.get("/product/1")).status_code == 404
+    assert (await client.get("/product")).json()["content"] == []
+
+
+@pytest.mark.asyncio
+async def test_compressed_product_reads_are_cached_per_encoding(
+    product_app: FastAPI,
+    async_client_factory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    compression = SimpleNamespace(ENABLED=True, MINIMUM_SIZE=0, OFFLOAD_SIZE=65_536)
+    monkeypatch.setattr(response_cache_module, "get_config", lambda: SimpleNamespace(COMPRESSION_CONFIG=compression))
+    client = await async_client_factory(product_app)
+
+    compressed = await client.get("/product/1", headers={"Accept-Encoding": "gzip"})
+    plain = await client.get("/product/1", headers={"Accept-Encoding": "identity"})
+    listing = await client.get("/product", headers={"Accept-Encoding": "gzip"})
+
+    monkeypatch.setattr(product_router_module, "get_product_repository", lambda: FakeProductRepository())
+    cached = await client.get("/product/1", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == compressed.json()
+    assert cached.headers["content-encoding"] == "gzip"
+    assert cached.json() == compressed.json()
+    assert listing.headers["etag"].startswith('W/"')
+
+
 @pytest.mark.asyncio
 async def test_get_product_by_name(product_app: FastAPI, async_client_factory) -> None:
     client = await async_client_factory(product_app)
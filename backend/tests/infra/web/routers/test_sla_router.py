@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+
+import infra.web.routers.sla_router as sla_router_module
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeProductRepository
+
+START = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def sla_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    components = [
+        Component(
+            id=component_id,
+            product_id=50,
+            name=f"payments-{component_id}",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+        )
+        for component_id in (1, 2)
+    ]
+    product_repo = FakeProductRepository(initial_products=[Product(id=50, name="Payments", components=components)])
+    component_repo = FakeComponentRepository(initial_components=components)
+    log_repo = FakeLogRepository(
+        initial_logs=[
+            HealthcheckLog(
+                component_id=component_id,
+                checked_at=START + timedelta(hours=hour),
+                is_successful=not (component_id == 2 and hour == 0),
+                status_code=200,
+                response_time_ms=15,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OPERATIONAL,
+                error_message=None,
+            )
+            for component_id in (1, 2)
+            for hour in range(4)
+        ]
+    )
+
+    monkeypatch.setattr(sla_router_module, "get_product_repository", lambda: product_repo)
+    monkeypatch.setattr(sla_router_module, "get_component_repository", lambda: component_repo)
+    monkeypatch.setattr(sla_router_module, "get_log_repository", lambda: log_repo)
+
+    app = FastAPI()
+    app.include_router(sla_router_module.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_get_sla_report_for_product(sla_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(sla_app)
+
+    response = await client.get(
+        "/sla",
+        params={"product_id": 50, "since": "2026-05-01T00:00:00Z", "until": "2026-05-01T02:00:00Z"},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["totalChecks"] == 4
+    assert payload["uptime"] == 75.0
+    assert [component["uptime"] for component in payload["components"]] == [100.0, 50.0]
+
+
+@pytest.mark.asyncio
+async def test_get_sla_report_for_component_list(sla_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(sla_app)
+
+    response = await client.get(
+        "/sla",
+        params=[
+            ("component_id", 2),
+            ("component_id", 1),
+            ("since", "2026-05-01T01:00:00Z"),
+            ("until", "2026-05-02T00:00:00Z"),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert [component["componentId"] for component in response.json()["components"]] == [2, 1]
+    assert response.json()["uptime"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_get_sla_report_rejects_invalid_requests(sla_app: FastAPI, async_client_factory) -> None:
+    client = await async_client_factory(sla_app)
+
+    no_target = await client.get("/sla")
+    missing = await client.get("/sla", params={"component_id": 999})
+    empty_window = await client.get(
+        "/sla",
+        params={"component_id": 1, "since": "2026-05-01T00:00:10Z", "until": "2026-05-01T00:00:50Z"},
+    )
+
+    assert no_target.status_code == 422
+    assert missing.status_code == 404
+    assert empty_window.status_code == 422
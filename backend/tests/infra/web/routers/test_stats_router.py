@@ -58,3 +58,18 @@ async def test_stats_health_degraded_response(
     payload = response.json()
     assert payload["status"] == "DEGRADED"
     assert "process metrics unavailable" in payload["error"]
+
+
+@pytest.mark.asyncio
+async def test_stats_db_returns_pool_stats(
+    stats_app: FastAPI,
+    async_client_factory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(stats_router_module, "get_pool_stats", lambda: {"primary": {"in_use": 3, "idle": 7}})
+
+    client = await async_client_factory(stats_app)
+    response = await client.get("/stats/db")
+
+    assert response.status_code == 200
+    assert response.json() == {"primary": {"in_use": 3, "idle": 7}}
@@ -0,0 +1,60 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from core.domain.status_type import StatusType
+from infra.adapter.memory_status_event_bus import InMemoryStatusEventBus
+from infra.web.routers.stream_router import stream_status_events
+
+
+async def _publish(bus: InMemoryStatusEventBus, component_id: int, product_id: int) -> None:
+    await bus.publish(
+        component_id=component_id,
+        product_id=product_id,
+        previous_status=StatusType.OPERATIONAL,
+        status=StatusType.DEGRADED,
+        changed_at=datetime(2026, 6, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_filtered_status_events_and_heartbeats() -> None:
+    bus = InMemoryStatusEventBus(max_events=10)
+    stream = stream_status_events(bus, product_ids={2}, last_event_id=bus.latest_event_id(), heartbeat_seconds=0.01)
+
+    await _publish(bus, component_id=10, product_id=1)
+    await _publish(bus, component_id=20, product_id=2)
+
+    retry = await anext(stream)
+    status_event = (await anext(stream)).decode("utf-8")
+    heartbeat = await anext(stream)
+    await stream.aclose()
+
+    lines = status_event.strip().split("\n")
+    assert retry == b"retry: 3000\n\n"
+    assert lines[0] == "event: status"
+    assert lines[1] == f"id: {bus.latest_event_id()}"
+    assert json.loads(lines[2].removeprefix("data: ")) == {
+        "componentId": 20,
+        "productId": 2,
+        "previousStatus": "OPERATIONAL",
+        "status": "DEGRADED",
+        "changedAt": "2026-06-01T00:00:00Z",
+    }
+    assert heartbeat == b": heartbeat\n\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_asks_for_resync_when_last_event_id_has_expired() -> None:
+    bus = InMemoryStatusEventBus(max_events=1)
+    stale = bus.latest_event_id()
+    await _publish(bus, component_id=10, product_id=1)
+    await _publish(bus, component_id=11, product_id=1)
+
+    stream = stream_status_events(bus, product_ids=set(), last_event_id=stale, heartbeat_seconds=0.01)
+    await anext(stream)
+    resync = await anext(stream)
+    await stream.aclose()
+
+    assert resync == f"event: resync\nid: {bus.latest_event_id()}\ndata: {{}}\n\n".encode("utf-8")
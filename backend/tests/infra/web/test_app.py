@@ -4,8 +4,14 @@ import pytest
 
 import infra.web.app as app_module
 from infra.adapter.dict_component_cache import DictComponentCache
+from infra.web.middleware.compression_middleware import CompressionMiddleware
 from infra.web.middleware.request_event_log_middleware import RequestEventLogMiddleware
-from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeScheduler
+from tests.support.fakes import (
+    FakeComponentRepository,
+    FakeIncidentRepository,
+    FakeLogRepository,
+    FakeScheduler,
+)
 
 
 class FakeHttpClient:
@@ -77,7 +83,18 @@ async def test_create_app_wires_routers_middleware_and_lifespan(monkeypatch: pyt
             LEVEL="INFO",
             JSON_FORMAT=False,
             LIBRARY_LOG_LEVELS={"httpx": "WARNING"},
+            REQUEST_LOG_MODE="full",
+            REQUEST_LOG_SAMPLE_RATE=0.1,
+            REQUEST_LOG_SLOW_MS=1000.0,
         ),
+        ARCHIVE_CONFIG=SimpleNamespace(
+            ENABLED=False,
+            PATH="./archive",
+            RETENTION_DAYS=30,
+            INTERVAL_SECONDS=3600,
+        ),
+        DATABASE_CONFIG=SimpleNamespace(POOL_STATS_LOG_INTERVAL_SECONDS=60),
+        COMPRESSION_CONFIG=SimpleNamespace(ENABLED=True, MINIMUM_SIZE=1024, OFFLOAD_SIZE=65_536),
     )
 
     monkeypatch.setattr(app_module, "get_config", lambda: config)
@@ -86,6 +103,7 @@ async def test_create_app_wires_routers_middleware_and_lifespan(monkeypatch: pyt
     monkeypatch.setattr(app_module, "get_dict_component_cache", lambda: DictComponentCache())
     monkeypatch.setattr(app_module, "get_component_repository", lambda: FakeComponentRepository())
     monkeypatch.setattr(app_module, "get_log_repository", lambda: FakeLogRepository())
+    monkeypatch.setattr(app_module, "get_incident_repository", lambda: FakeIncidentRepository())
     monkeypatch.setattr(app_module, "HealthcheckService", FakeHealthcheckService)
     monkeypatch.setattr(app_module.httpx, "AsyncClient", FakeHttpClient)
     monkeypatch.setattr(app_module, "close_engine", fake_close_engine)
@@ -101,10 +119,12 @@ async def test_create_app_wires_routers_middleware_and_lifespan(monkeypatch: pyt
 
     route_paths = {route.path for route in app.routes}
     assert "/stats/health" in route_paths
+    assert "/stats/db" in route_paths
     assert "/product" in route_paths
     assert "/component" in route_paths
 
     assert any(m.cls is RequestEventLogMiddleware for m in app.user_middleware)
+    assert any(m.cls is CompressionMiddleware for m in app.user_middleware)
 
     assert configure_calls == [
         {
@@ -120,6 +140,7 @@ async def test_create_app_wires_routers_middleware_and_lifespan(monkeypatch: pyt
         assert scheduler.started is True
         assert len(FakeHealthcheckService.instances) == 1
         assert FakeHealthcheckService.instances[0].started is True
+        assert scheduler.jobs["log_db_pool_stats"]["interval_seconds"] == 60
 
     assert create_database_schema_calls["count"] == 1
     assert scheduler.stopped is True
@@ -158,7 +179,18 @@ async def test_create_app_does_not_create_schema_outside_dev_or_loc(
             LEVEL="INFO",
             JSON_FORMAT=False,
             LIBRARY_LOG_LEVELS={"httpx": "WARNING"},
+            REQUEST_LOG_MODE="full",
+            REQUEST_LOG_SAMPLE_RATE=0.1,
+            REQUEST_LOG_SLOW_MS=1000.0,
+        ),
+        ARCHIVE_CONFIG=SimpleNamespace(
+            ENABLED=False,
+            PATH="./archive",
+            RETENTION_DAYS=30,
+            INTERVAL_SECONDS=3600,
         ),
+        DATABASE_CONFIG=SimpleNamespace(POOL_STATS_LOG_INTERVAL_SECONDS=0),
+        COMPRESSION_CONFIG=SimpleNamespace(ENABLED=False, MINIMUM_SIZE=1024, OFFLOAD_SIZE=65_536),
     )
 
     monkeypatch.setattr(app_module, "get_config", lambda: config)
@@ -167,6 +199,7 @@ async def test_create_app_does_not_create_schema_outside_dev_or_loc(
     monkeypatch.setattr(app_module, "get_dict_component_cache", lambda: DictComponentCache())
     monkeypatch.setattr(app_module, "get_component_repository", lambda: FakeComponentRepository())
     monkeypatch.setattr(app_module, "get_log_repository", lambda: FakeLogRepository())
+    monkeypatch.setattr(app_module, "get_incident_repository", lambda: FakeIncidentRepository())
     monkeypatch.setattr(app_module, "HealthcheckService", FakeHealthcheckService)
     monkeypatch.setattr(app_module.httpx, "AsyncClient", FakeHttpClient)
     monkeypatch.setattr(app_module, "create_database_schema", fake_create_database_schema)
@@ -175,6 +208,6 @@ async def test_create_app_does_not_create_schema_outside_dev_or_loc(
     app = app_module.create_app()
 
     async with app.router.lifespan_context(app):
-        pass
+        assert "log_db_pool_stats" not in scheduler.jobs
 
     assert create_database_schema_calls["count"] == 0
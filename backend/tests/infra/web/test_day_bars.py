@@ -0,0 +1,51 @@
+from datetime import date, datetime, timezone
+
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.status_type import StatusType
+from infra.web.day_bars import COLUMNAR_MEDIA_TYPE, DayBarsFormat, day_bar_columns, negotiate_day_bars_format
+
+
+def _summary(day: int, status: StatusType, uptime: float) -> HealthcheckLogDaySummary:
+    return HealthcheckLogDaySummary(
+        component_id=1,
+        date=datetime(2026, 3, day, tzinfo=timezone.utc),
+        total_checks=1440,
+        successful_checks=round(1440 * uptime / 100),
+        uptime=uptime,
+        avg_response_time=100 + day,
+        max_response_time=900 + day,
+        overall_status=status,
+    )
+
+
+def test_negotiate_day_bars_format_prefers_the_query_over_accept() -> None:
+    assert negotiate_day_bars_format(None, None) is DayBarsFormat.OBJECTS
+    assert negotiate_day_bars_format(None, "application/json") is DayBarsFormat.OBJECTS
+    assert negotiate_day_bars_format(None, f"{COLUMNAR_MEDIA_TYPE};q=0.9, */*") is DayBarsFormat.COLUMNAR
+    assert negotiate_day_bars_format(DayBarsFormat.OBJECTS, COLUMNAR_MEDIA_TYPE) is DayBarsFormat.OBJECTS
+    assert negotiate_day_bars_format(DayBarsFormat.COLUMNAR, None) is DayBarsFormat.COLUMNAR
+
+
+def test_day_bar_columns_are_oldest_first_and_keep_empty_days() -> None:
+    columns = day_bar_columns(
+        [
+            _summary(4, StatusType.OUTAGE, 90.0),
+            _summary(3, StatusType.OPERATIONAL, 100.0),
+            _summary(1, StatusType.DEGRADED, 99.5),
+        ]
+    )
+
+    assert columns == {
+        "start_date": date(2026, 3, 1),
+        "count": 4,
+        "total_checks": [1440, 0, 1440, 1440],
+        "successful_checks": [1433, 0, 1440, 1296],
+        "uptime": [99.5, None, 100.0, 90.0],
+        "avg_response_time": [101, None, 103, 104],
+        "max_response_time": [901, None, 903, 904],
+        "overall_status": [1, None, 0, 2],
+    }
+
+
+def test_day_bar_columns_without_history() -> None:
+    assert day_bar_columns([]) == {"start_date": None, "count": 0}
@@ -0,0 +1,20 @@
+from infra.web.etag import etag_matches, listing_etag
+
+
+def test_listing_etag_depends_on_version_and_params() -> None:
+    etag = listing_etag(3, page=1, page_size=10)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert listing_etag(3, page_size=10, page=1) == etag
+    assert listing_etag(4, page=1, page_size=10) != etag
+    assert listing_etag(3, page=2, page_size=10) != etag
+
+
+def test_etag_matches_uses_weak_comparison_over_lists() -> None:
+    etag = listing_etag(1)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"stale", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"stale"', etag)
@@ -0,0 +1,134 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import infra.web.json_encoder as json_encoder_module
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.page import Page
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.web.json_encoder import compile_encoder, encode_response
+from infra.web.routers.schemas.component import HealthcheckLogDaySummaryResponseDTO
+from infra.web.routers.schemas.page import PageDTO
+from infra.web.routers.schemas.product import ColumnarProductResponseDTO, ProductResponseDTO
+
+RESPONSE_MODEL = PageDTO[ProductResponseDTO]
+
+
+def _page() -> Page[Product]:
+    product = Product(
+        id=1,
+        name="Pagamentos — São Paulo",
+        description=None,
+        created_at=datetime(2026, 1, 1, 12, 0),
+        updated_at=datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc),
+        components=[
+            Component(
+                id=7,
+                product_id=1,
+                name="api",
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url="https://api.example.com/health"),
+                current_status=StatusType.DEGRADED,
+                healthcheck_day_logs=[
+                    HealthcheckLogDaySummary(
+                        component_id=7,
+                        date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                        total_checks=3,
+                        successful_checks=2,
+                        uptime=66.67,
+                        avg_response_time=12,
+                        max_response_time=20,
+                        overall_status=StatusType.DEGRADED,
+                    )
+                ],
+            )
+        ],
+    )
+
+    return Page(page_size=10, page_count=1, total_elements=1, total_pages=1, content=[product])
+
+
+def _use_fast_serialization(monkeypatch: pytest.MonkeyPatch, enabled: bool) -> None:
+    monkeypatch.setattr(json_encoder_module, "get_config", lambda: SimpleNamespace(FAST_SERIALIZATION=enabled))
+
+
+def test_compiled_encoder_matches_validated_response_bytes() -> None:
+    page = _page()
+
+    compiled = compile_encoder(RESPONSE_MODEL).to_json(page, by_alias=True)
+    validated = RESPONSE_MODEL.model_validate(page).model_dump_json(by_alias=True).encode("utf-8")
+
+    assert compiled == validated
+    assert json.loads(compiled)["content"][0]["components"][0]["healthcheckDayLogs"][0]["overallStatus"] == "DEGRADED"
+
+
+def test_encode_response_uses_compiled_encoder_only_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[type] = []
+    original = json_encoder_module.compile_encoder
+
+    def tracking_compile_encoder(model):
+        calls.append(model)
+        return original(model)
+
+    monkeypatch.setattr(json_encoder_module, "compile_encoder", tracking_compile_encoder)
+
+    _use_fast_serialization(monkeypatch, False)
+    disabled = encode_response(RESPONSE_MODEL, _page())
+    assert calls == []
+
+    _use_fast_serialization(monkeypatch, True)
+    enabled = encode_response(RESPONSE_MODEL, _page())
+    assert calls == [RESPONSE_MODEL]
+
+    assert enabled == disabled
+
+
+def test_encode_response_falls_back_to_validation_on_unexpected_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_fast_serialization(monkeypatch, True)
+    summary = HealthcheckLogDaySummary(
+        component_id=7,
+        date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        total_checks=3,
+        successful_checks=2,
+        uptime=66.67,
+        avg_response_time=12,
+        max_response_time=20,
+        overall_status="DEGRADED",
+    )
+
+    body = json.loads(encode_response(HealthcheckLogDaySummaryResponseDTO, summary))
+
+    assert body["overallStatus"] == "DEGRADED"
+
+
+def test_compiled_encoder_emits_exactly_the_documented_properties() -> None:
+    body = json.loads(compile_encoder(RESPONSE_MODEL).to_json(_page(), by_alias=True))
+    schema = RESPONSE_MODEL.model_json_schema(mode="serialization", by_alias=True)
+    definitions = schema["$defs"]
+
+    product = body["content"][0]
+    component = product["components"][0]
+
+    assert set(body) == set(schema["properties"])
+    assert set(product) == set(definitions["ProductResponseDTO"]["properties"])
+    assert set(component) == set(definitions["ComponentResponseDTO"]["properties"])
+    assert set(component["monitoringConfig"]) == set(definitions["MonitoringConfigResponseDTO"]["properties"])
+    assert set(component["healthcheckDayLogs"][0]) == set(
+        definitions["HealthcheckLogDaySummaryResponseDTO"]["properties"]
+    )
+
+
+def test_reshaping_models_are_not_compiled_and_still_encode(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_fast_serialization(monkeypatch, True)
+    model = PageDTO[ColumnarProductResponseDTO]
+
+    body = json.loads(encode_response(model, _page()))
+
+    assert compile_encoder(model) is None
+    assert body["content"][0]["components"][0]["healthcheckDayBars"]["overallStatus"] == [1]
@@ -0,0 +1,18 @@
+import pytest
+
+from infra.web.listing_include import ListingInclude, parse_listing_include
+
+
+def test_parse_listing_include_defaults_to_everything() -> None:
+    assert parse_listing_include(None) == {ListingInclude.COMPONENTS, ListingInclude.SUMMARIES}
+
+
+def test_parse_listing_include_reads_a_comma_separated_list() -> None:
+    assert parse_listing_include("") == set()
+    assert parse_listing_include(" Components, ") == {ListingInclude.COMPONENTS}
+    assert parse_listing_include("summaries") == {ListingInclude.COMPONENTS, ListingInclude.SUMMARIES}
+
+
+def test_parse_listing_include_rejects_unknown_values() -> None:
+    with pytest.raises(ValueError, match="incidents"):
+        parse_listing_include("components,incidents")
@@ -41,13 +41,13 @@ class RaisingRequestLogger:
         raise RuntimeError("log emit failed")
 
 
-@pytest.fixture
-def test_app() -> FastAPI:
+def _build_app(**middleware_options: Any) -> FastAPI:
     app = FastAPI()
     app.add_middleware(
         RequestEventLogMiddleware,
         request_id_header="x-request-id",
         excluded_path_suffixes={"/stats/health"},
+        **middleware_options,
     )
 
     @app.get("/ok")
@@ -77,6 +77,11 @@ def test_app() -> FastAPI:
     return app
 
 
+@pytest.fixture
+def test_app() -> FastAPI:
+    return _build_app()
+
+
 @pytest.fixture
 def fake_request_logger(monkeypatch: pytest.MonkeyPatch) -> FakeRequestLogger:
     fake_logger = FakeRequestLogger()
@@ -306,3 +311,79 @@ async def test_non_http_scope_is_forwarded_without_logging(fake_request_logger:
 
     assert called["count"] == 1
     assert fake_request_logger.calls == []
+
+
+async def _get_all(app: FastAPI, *paths: str) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        return [await test_client.get(path, headers={"x-request-id": f"req{path}"}) for path in paths]
+
+
+@pytest.mark.asyncio
+async def test_summary_mode_logs_every_request_without_history(fake_request_logger: FakeRequestLogger) -> None:
+    responses = await _get_all(_build_app(mode="summary"), "/ok?foo=1", "/client-error", "/boom")
+
+    assert [response.status_code for response in responses] == [200, 404, 500]
+    assert [response.headers["x-request-id"] for response in responses] == [
+        "req/ok?foo=1",
+        "req/client-error",
+        "req/boom",
+    ]
+    assert [(level, event) for level, event, _ in fake_request_logger.calls] == [
+        ("info", "http_request_summary"),
+        ("warning", "http_request_summary"),
+        ("exception", "http_request_summary"),
+    ]
+
+    payload = fake_request_logger.calls[0][2]
+    assert set(payload) == {
+        "request_id",
+        "method",
+        "path",
+        "route_path",
+        "route_name",
+        "status_code",
+        "outcome",
+        "duration_ms",
+        "error",
+    }
+    assert (payload["route_name"], payload["outcome"], payload["error"]) == ("ok_endpoint", "success", None)
+    assert fake_request_logger.calls[2][2]["error"] == {"error_class": "RuntimeError", "error_message": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_sampled_mode_keeps_errors_and_slow_requests_outside_the_sample(
+    fake_request_logger: FakeRequestLogger,
+) -> None:
+    unsampled = _build_app(mode="sampled", sample_rate=0.0, slow_request_ms=60_000)
+    await _get_all(unsampled, "/ok", "/client-error", "/server-error", "/boom")
+
+    assert [(level, payload["path"]) for level, _, payload in fake_request_logger.calls] == [
+        ("warning", "/client-error"),
+        ("error", "/server-error"),
+        ("exception", "/boom"),
+    ]
+    assert all("history" not in payload for _, _, payload in fake_request_logger.calls)
+
+    fake_request_logger.calls.clear()
+    await _get_all(_build_app(mode="sampled", sample_rate=0.0, slow_request_ms=0), "/ok")
+
+    assert [payload["path"] for _, _, payload in fake_request_logger.calls] == ["/ok"]
+
+    fake_request_logger.calls.clear()
+    await _get_all(_build_app(mode="sampled", sample_rate=1.0), "/ok")
+
+    assert [event_data["event"] for event_data in fake_request_logger.calls[0][2]["history"]][-1] == "request_completed"
+
+
+@pytest.mark.asyncio
+async def test_sampled_mode_logs_client_errors_outside_the_sample(fake_request_logger: FakeRequestLogger) -> None:
+    [response] = await _get_all(_build_app(mode="sampled", sample_rate=0.0, slow_request_ms=60_000), "/client-error")
+
+    assert response.status_code == 404
+    assert [(level, event) for level, event, _ in fake_request_logger.calls] == [("warning", "http_request_summary")]
+
+    payload = fake_request_logger.calls[0][2]
+    assert (payload["status_code"], payload["outcome"]) == (404, "client_error")
+    assert "history" not in payload
@@ -0,0 +1,67 @@
+import gzip
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.adapter.memory_response_cache import InMemoryResponseCache
+from infra.db.reader import ReplicaSessionReader
+from infra.web.response_cache import cached_json, response_cache_key
+
+
+class _Marker(BaseModel):
+    value: int
+
+
+@pytest.mark.asyncio
+async def test_cached_json_fills_the_cache_from_the_primary(sqlite_session_factory) -> None:
+    replica_calls: list[str] = []
+
+    def _replica_session_factory() -> AsyncSession:
+        replica_calls.append("replica")
+        raise AssertionError("a cache-filling load must not read the replica")
+
+    reader = ReplicaSessionReader(
+        sqlite_session_factory,
+        _replica_session_factory,  # type: ignore
+        max_lag_seconds=5,
+        lag_query="SELECT 0",
+    )
+    cache = InMemoryResponseCache(max_bytes=1024)
+    key = response_cache_key("/markers", page=1)
+
+    async def _load() -> _Marker:
+        return _Marker(value=await reader.run(_select_one))
+
+    response = await cached_json(cache, key, _load, _Marker, lambda _: ["markers"])
+
+    assert response.body == b'{"value":1}'
+    assert await cache.get(key) == b'{"value":1}'
+    assert replica_calls == []
+
+
+@pytest.mark.asyncio
+async def test_cached_json_compresses_a_cached_body_whose_encoded_copy_was_evicted() -> None:
+    cache = InMemoryResponseCache(max_bytes=1 << 20)
+    key = response_cache_key("/markers", page=1)
+    body = b'{"value":' + b"1" * 4096 + b"}"
+    await cache.set(key, body, {"markers"}, await cache.generation())
+
+    async def _load() -> _Marker:
+        raise AssertionError("a cached plain body must not be reloaded")
+
+    response = await cached_json(cache, key, _load, _Marker, lambda _: ["markers"], accept_encoding="gzip")
+    encoded = await cache.get(f"{key}|gzip")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.body) == body
+    assert encoded == response.body
+
+    await cache.invalidate({"markers"})
+
+    assert await cache.get(f"{key}|gzip") is None
+
+
+async def _select_one(session: AsyncSession) -> int:
+    return (await session.execute(text("SELECT 1"))).scalar_one()
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from copy import deepcopy
 from dataclasses import replace
 from datetime import datetime, time, timezone, timedelta
@@ -5,16 +6,22 @@ from math import ceil
 from typing import Any
 
 from core.domain.component import Component
+from core.domain.cursor_page import CursorPage
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
 from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.healthcheck_rollup import HealthcheckRollup
+from core.domain.incident import Incident
 from core.domain.page import Page
 from core.domain.product import Product
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
 from core.exceptions.component_already_exists_error import ComponentAlreadyExistsError
 from core.port.component_repository import ComponentRepository
+from core.port.incident_repository import IncidentRepository
 from core.port.log_repository import LogRepository
 from core.port.product_repository import ProductRepository
 from core.port.scheduler import Scheduler
+from infra.utils.cursor import decode_cursor, encode_cursor
 
 
 class FakeProductRepository(ProductRepository):
@@ -53,23 +60,49 @@ class FakeProductRepository(ProductRepository):
 
         return None
 
-    async def find_all(self, is_visible: bool, page: int, page_size: int) -> Page[Product]:
-        filtered = [product for product in self._products.values() if product.is_visible is is_visible]
+    async def find_all(
+        self,
+        is_visible: bool,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: str | None = None,
+        include_components: bool = True,
+    ) -> Page[Product]:
+        filtered = [
+            product
+            for product in self._products.values()
+            if product.is_visible is is_visible
+            and (
+                search is None
+                or search.casefold() in product.name.casefold()
+                or any(search.casefold() in component.name.casefold() for component in product.components)
+            )
+        ]
         ordered = sorted(filtered, key=lambda item: item.id or 0)
 
         total_elements = len(ordered)
         offset = (page - 1) * page_size
         content = [deepcopy(item) for item in ordered[offset : offset + page_size]]
+        if not include_components:
+            for item in content:
+                item.components = []
         total_pages = (total_elements + page_size - 1) // page_size if total_elements > 0 else 0
 
         return Page(
             page_size=page_size,
             page_count=len(content),
-            total_elements=total_elements,
-            total_pages=total_pages,
+            total_elements=total_elements if include_total else None,
+            total_pages=total_pages if include_total else None,
             content=content,
+            has_next=offset + len(content) < total_elements,
         )
 
+    async def find_all_without_pagination(self, is_visible: bool) -> list[Product]:
+        filtered = [product for product in self._products.values() if product.is_visible is is_visible]
+
+        return [deepcopy(product) for product in sorted(filtered, key=lambda item: item.id or 0)]
+
     async def delete(self, product_id: int) -> bool:
         self._products.pop(product_id, None)
         return True
@@ -123,8 +156,24 @@ class FakeComponentRepository(ComponentRepository):
         component = self._components.get(component_id)
         return deepcopy(component) if component is not None else None
 
-    async def find_all_by_product_id(self, product_id: int, page: int, page_size: int) -> Page[Component]:
-        filtered = [component for component in self._components.values() if component.product_id == product_id]
+    async def find_all_by_ids(self, component_ids: list[int]) -> list[Component]:
+        found_ids = sorted(set(component_ids) & self._components.keys())
+        return [deepcopy(self._components[component_id]) for component_id in found_ids]
+
+    async def find_all_by_product_id(
+        self,
+        product_id: int,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+        search: str | None = None,
+    ) -> Page[Component]:
+        filtered = [
+            component
+            for component in self._components.values()
+            if component.product_id == product_id
+            and (search is None or search.casefold() in component.name.casefold())
+        ]
         ordered = sorted(filtered, key=lambda item: item.id or 0)
 
         total_elements = len(ordered)
@@ -135,9 +184,10 @@ class FakeComponentRepository(ComponentRepository):
         return Page(
             page_size=page_size,
             page_count=len(content),
-            total_elements=total_elements,
-            total_pages=total_pages,
+            total_elements=total_elements if include_total else None,
+            total_pages=total_pages if include_total else None,
             content=content,
+            has_next=offset + len(content) < total_elements,
         )
 
     async def delete(self, component_id: int) -> bool:
@@ -151,14 +201,30 @@ class FakeLogRepository(LogRepository):
         initial_logs: list[HealthcheckLog] | None = None,
         precomputed_summary: dict[int, list[HealthcheckLogDaySummary]] | None = None,
     ) -> None:
-        self.logs: list[HealthcheckLog] = [deepcopy(log) for log in (initial_logs or [])]
+        self.logs: list[HealthcheckLog] = []
         self.precomputed_summary = precomputed_summary
         self.bulk_calls: list[tuple[list[int], int]] = []
+        self._next_id = 1
 
-    async def add_log(self, log: HealthcheckLog) -> HealthcheckLog:
+        for log in initial_logs or []:
+            self._append(log)
+
+    def _append(self, log: HealthcheckLog) -> HealthcheckLog:
         log_copy = deepcopy(log)
+        if log_copy.id is None:
+            log_copy.id = self._next_id
+        self._next_id = max(self._next_id, log_copy.id) + 1
         self.logs.append(log_copy)
-        return deepcopy(log_copy)
+        return log_copy
+
+    async def add_log(self, log: HealthcheckLog) -> HealthcheckLog:
+        return deepcopy(self._append(log))
+
+    async def add_logs(self, logs: list[HealthcheckLog]) -> int:
+        for log in logs:
+            self._append(log)
+
+        return len(logs)
 
     async def get_logs(self, component_id: int, limit: int) -> list[HealthcheckLog]:
         filtered = [log for log in self.logs if log.component_id == component_id]
@@ -166,6 +232,52 @@ class FakeLogRepository(LogRepository):
 
         return [deepcopy(log) for log in ordered[:limit]]
 
+    async def get_logs_page(
+        self,
+        component_id: int,
+        page_size: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        is_successful: bool | None = None,
+    ) -> CursorPage[HealthcheckLog]:
+        cursor_key = decode_cursor(cursor) if cursor is not None else None
+        filtered = [
+            log
+            for log in self.logs
+            if log.component_id == component_id
+            and (since is None or log.checked_at >= since)
+            and (until is None or log.checked_at < until)
+            and (is_successful is None or log.is_successful is is_successful)
+            and (cursor_key is None or (log.checked_at, log.id or 0) < cursor_key)
+        ]
+        ordered = sorted(filtered, key=lambda item: (item.checked_at, item.id or 0), reverse=True)
+        content = [deepcopy(log) for log in ordered[:page_size]]
+
+        next_cursor: str | None = None
+        if len(ordered) > page_size:
+            next_cursor = encode_cursor(content[-1].checked_at, content[-1].id or 0)
+
+        return CursorPage(page_size=page_size, content=content, next_cursor=next_cursor)
+
+    async def stream_logs(
+        self,
+        component_ids: list[int] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[HealthcheckLog]:
+        filtered = [
+            log
+            for log in self.logs
+            if (component_ids is None or log.component_id in component_ids)
+            and (since is None or log.checked_at >= since)
+            and (until is None or log.checked_at < until)
+        ]
+
+        for log in sorted(filtered, key=lambda item: (item.component_id, item.checked_at, item.id or 0)):
+            yield deepcopy(log)
+
     async def get_last_n_day_summary(self, component_id: int, last_n_days: int) -> list[HealthcheckLogDaySummary]:
         bulk_result = await self.get_last_n_day_summary_bulk([component_id], last_n_days)
         return bulk_result.get(component_id, [])
@@ -230,6 +342,181 @@ class FakeLogRepository(LogRepository):
 
         return summaries_by_component
 
+    async def get_logs_between(self, component_id: int, since: datetime, until: datetime) -> list[HealthcheckLog]:
+        filtered = [
+            log
+            for log in self.logs
+            if log.component_id == component_id and since <= log.checked_at < until
+        ]
+
+        return [deepcopy(log) for log in sorted(filtered, key=lambda item: item.checked_at)]
+
+    async def delete_logs(self, component_id: int, log_ids: list[int]) -> int:
+        deleted_ids = set(log_ids)
+        remaining = [log for log in self.logs if log.component_id != component_id or log.id not in deleted_ids]
+        deleted = len(self.logs) - len(remaining)
+        self.logs = remaining
+
+        return deleted
+
+    async def find_archivable_components(self, until: datetime) -> dict[int, datetime]:
+        oldest_by_component: dict[int, datetime] = {}
+
+        for log in self.logs:
+            if log.checked_at >= until:
+                continue
+
+            current = oldest_by_component.get(log.component_id)
+            if current is None or log.checked_at < current:
+                oldest_by_component[log.component_id] = log.checked_at
+
+        return oldest_by_component
+
+    async def get_check_counts(
+        self,
+        component_ids: list[int],
+        since: datetime,
+        until: datetime,
+    ) -> dict[int, tuple[int, int]]:
+        counts: dict[int, tuple[int, int]] = {component_id: (0, 0) for component_id in component_ids}
+
+        for log in self.logs:
+            bucket_start = RollupResolution.MINUTE.bucket_start(log.checked_at)
+
+            if log.component_id not in counts or not since <= bucket_start < until:
+                continue
+
+            total_checks, successful_checks = counts[log.component_id]
+            counts[log.component_id] = (total_checks + 1, successful_checks + (1 if log.is_successful else 0))
+
+        return counts
+
+    async def get_rollups(
+        self,
+        component_id: int,
+        resolution: RollupResolution,
+        since: datetime,
+        until: datetime,
+    ) -> list[HealthcheckRollup]:
+        grouped: dict[datetime, list[HealthcheckLog]] = {}
+        first_bucket = resolution.bucket_start(since)
+
+        for log in self.logs:
+            bucket_start = resolution.bucket_start(log.checked_at)
+
+            if log.component_id != component_id or bucket_start < first_bucket or bucket_start >= until:
+                continue
+
+            grouped.setdefault(bucket_start, []).append(log)
+
+        rollups: list[HealthcheckRollup] = []
+
+        for bucket_start, bucket_logs in sorted(grouped.items()):
+            total_checks = len(bucket_logs)
+            successful_checks = len([log for log in bucket_logs if log.is_successful])
+
+            rollups.append(
+                HealthcheckRollup(
+                    component_id=component_id,
+                    resolution=resolution,
+                    bucket_start=bucket_start,
+                    total_checks=total_checks,
+                    successful_checks=successful_checks,
+                    uptime=round((successful_checks / total_checks) * 100, 2),
+                    avg_response_time=ceil(sum(log.response_time_ms for log in bucket_logs) / total_checks),
+                    max_response_time=max(log.response_time_ms for log in bucket_logs),
+                    overall_status=max((log.status_after for log in bucket_logs), key=lambda item: item.severity),
+                )
+            )
+
+        return rollups
+
+
+class FakeIncidentRepository(IncidentRepository):
+    def __init__(
+        self,
+        initial_incidents: list[Incident] | None = None,
+        component_products: dict[int, int] | None = None,
+    ) -> None:
+        self._incidents: dict[int, Incident] = {}
+        self._component_products = component_products or {}
+        self._next_id = 1
+        self.find_open_calls = 0
+
+        for incident in initial_incidents or []:
+            self._store(incident)
+
+    def _store(self, incident: Incident) -> Incident:
+        incident_copy = deepcopy(incident)
+        if incident_copy.id is None:
+            incident_copy.id = self._next_id
+        self._next_id = max(self._next_id, incident_copy.id) + 1
+        self._incidents[incident_copy.id] = incident_copy
+        return deepcopy(incident_copy)
+
+    @property
+    def incidents(self) -> list[Incident]:
+        return sorted(self._incidents.values(), key=lambda item: (item.component_id, item.started_at))
+
+    async def save(self, incident: Incident) -> Incident:
+        return self._store(incident)
+
+    async def find_open(self, component_id: int) -> Incident | None:
+        self.find_open_calls += 1
+
+        for incident in self._incidents.values():
+            if incident.component_id == component_id and incident.is_open:
+                return deepcopy(incident)
+
+        return None
+
+    async def find_all(
+        self,
+        page: int,
+        page_size: int,
+        component_id: int | None = None,
+        product_id: int | None = None,
+        status: StatusType | None = None,
+        is_open: bool | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Page[Incident]:
+        filtered = [
+            incident
+            for incident in self._incidents.values()
+            if (component_id is None or incident.component_id == component_id)
+            and (product_id is None or self._component_products.get(incident.component_id) == product_id)
+            and (status is None or incident.status is status)
+            and (is_open is None or incident.is_open is is_open)
+            and (since is None or incident.ended_at is None or incident.ended_at >= since)
+            and (until is None or incident.started_at < until)
+        ]
+        ordered = sorted(filtered, key=lambda item: (item.started_at, item.id or 0), reverse=True)
+
+        total_elements = len(ordered)
+        offset = (page - 1) * page_size
+        content = [deepcopy(item) for item in ordered[offset : offset + page_size]]
+        total_pages = (total_elements + page_size - 1) // page_size if total_elements > 0 else 0
+
+        return Page(
+            page_size=page_size,
+            page_count=len(content),
+            total_elements=total_elements,
+            total_pages=total_pages,
+            content=content,
+            has_next=offset + len(content) < total_elements,
+        )
+
+    async def replace_for_component(self, component_id: int, incidents: list[Incident]) -> None:
+        self._incidents = {
+            incident_id: incident
+            for incident_id, incident in self._incidents.items()
+            if incident.component_id != component_id
+        }
+
+        for incident in incidents:
+            self._store(replace(incident, id=None))
+
 
 class FakeScheduler(Scheduler):
     def __init__(self) -> None:
@@ -0,0 +1,112 @@
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import cli
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.status_type import StatusType
+from tests.support.fakes import (
+    FakeComponentRepository,
+    FakeIncidentRepository,
+    FakeLogRepository,
+    FakeProductRepository,
+)
+
+
+@pytest.fixture
+def incident_repo() -> FakeIncidentRepository:
+    return FakeIncidentRepository()
+
+
+@pytest.fixture(autouse=True)
+def fake_repositories(monkeypatch: pytest.MonkeyPatch, incident_repo: FakeIncidentRepository) -> None:
+    component_repo = FakeComponentRepository(
+        initial_components=[
+            Component(
+                id=1,
+                product_id=1,
+                name="api",
+                type=ComponentType.BACKEND,
+                monitoring_config=HealthcheckConfig(health_url="https://api.example.com/health"),
+            )
+        ]
+    )
+    log_repo = FakeLogRepository(
+        initial_logs=[
+            HealthcheckLog(
+                component_id=1,
+                checked_at=datetime(2026, 5, 1, hour, tzinfo=timezone.utc),
+                is_successful=hour != 1,
+                status_code=200,
+                response_time_ms=15,
+                status_before=StatusType.OPERATIONAL,
+                status_after=StatusType.OUTAGE if hour == 1 else StatusType.OPERATIONAL,
+                error_message=None,
+            )
+            for hour in range(3)
+        ]
+    )
+
+    monkeypatch.setattr(cli, "get_product_repository", lambda: FakeProductRepository())
+    monkeypatch.setattr(cli, "get_component_repository", lambda: component_repo)
+    monkeypatch.setattr(cli, "get_log_repository", lambda: log_repo)
+    monkeypatch.setattr(cli, "get_incident_repository", lambda: incident_repo)
+
+
+@pytest.mark.asyncio
+async def test_export_checks_writes_filtered_rows() -> None:
+    args = cli.build_parser().parse_args(["export", "--component-id", "1", "--since", "2026-05-01T01:00:00"])
+    output = io.BytesIO()
+
+    await cli.export_checks(args, output)
+
+    records = [json.loads(line) for line in output.getvalue().decode().splitlines()]
+    assert [record["checked_at"] for record in records] == ["2026-05-01T01:00:00+00:00", "2026-05-01T02:00:00+00:00"]
+
+
+def test_main_reports_missing_component(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    async def _close_engine() -> None:
+        return None
+
+    monkeypatch.setattr(cli, "close_engine", _close_engine)
+
+    assert cli.main(["export", "--component-id", "999"]) == 1
+    assert "Component not found" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_backfill_incidents_rebuilds_from_history(incident_repo: FakeIncidentRepository) -> None:
+    args = cli.build_parser().parse_args(["backfill-incidents", "--component-id", "1"])
+
+    assert await cli.backfill_incidents(args) == 1
+    assert [incident.duration_seconds for incident in incident_repo.incidents] == [3_600]
+
+
+@pytest.mark.asyncio
+async def test_import_checks_loads_an_export_in_batches() -> None:
+    exported = io.BytesIO()
+    await cli.export_checks(cli.build_parser().parse_args(["export", "--component-id", "1"]), exported)
+
+    args = cli.build_parser().parse_args(["import", "--batch-size", "2"])
+
+    assert await cli.import_checks(args, io.StringIO(exported.getvalue().decode())) == 3
+    assert len(cli.get_log_repository().logs) == 6
+
+
+def test_main_runs_migrations(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    async def _close_engine() -> None:
+        return None
+
+    async def _migrate_database() -> list[int]:
+        return [1]
+
+    monkeypatch.setattr(cli, "close_engine", _close_engine)
+    monkeypatch.setattr(cli, "migrate_database", _migrate_database)
+
+    assert cli.main(["migrate"]) == 0
+    assert "Applied migrations: 1" in capsys.readouterr().err
@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from core.domain.change import Change, ChangeKind
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from core.exceptions.event_log_expired_error import EventLogExpiredError
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeProductRepository
+from use_cases.change.get_changes_use_case import GetChangesUseCase
+
+
+def _component(component_id: int, product_id: int) -> Component:
+    return Component(
+        id=component_id,
+        product_id=product_id,
+        name=f"component-{component_id}",
+        type=ComponentType.BACKEND,
+        monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+        current_status=StatusType.OUTAGE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_changes_reads_back_current_state_once_per_changed_entity() -> None:
+    today = HealthcheckLogDaySummary(
+        component_id=10,
+        date=datetime(2026, 6, 1, tzinfo=timezone.utc),
+        total_checks=4,
+        successful_checks=3,
+        uptime=75.0,
+        avg_response_time=10,
+        max_response_time=12,
+        overall_status=StatusType.DEGRADED,
+    )
+    change_tracker = InMemoryChangeTracker(initial_version=50)
+    use_case = GetChangesUseCase(
+        change_tracker,
+        FakeProductRepository(initial_products=[Product(id=1, name="Payments")]),
+        FakeComponentRepository(initial_components=[_component(10, 1)]),
+        FakeLogRepository(precomputed_summary={10: [today]}),
+    )
+
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    since = await change_tracker.current_version()
+    await change_tracker.record_change(Change(ChangeKind.COMPONENT, 10))
+    await change_tracker.record_change(Change(ChangeKind.DAY_SUMMARY, 10))
+    await change_tracker.record_change(Change(ChangeKind.COMPONENT, 10))
+    await change_tracker.record_change(Change(ChangeKind.COMPONENT, 11))
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 2))
+
+    change_set = await use_case.execute(since)
+
+    assert change_set.version == 56
+    assert change_set.products == []
+    assert change_set.deleted_product_ids == [2]
+    assert [(component.id, component.current_status) for component in change_set.components] == [
+        (10, StatusType.OUTAGE)
+    ]
+    assert change_set.deleted_component_ids == [11]
+    assert change_set.day_summaries == [today]
+
+
+@pytest.mark.asyncio
+async def test_get_changes_raises_when_version_aged_out() -> None:
+    change_tracker = InMemoryChangeTracker(max_changes=1)
+    use_case = GetChangesUseCase(
+        change_tracker,
+        FakeProductRepository(),
+        FakeComponentRepository(),
+        FakeLogRepository(),
+    )
+
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 1))
+    await change_tracker.record_change(Change(ChangeKind.PRODUCT, 2))
+
+    with pytest.raises(EventLogExpiredError):
+        await use_case.execute(0)
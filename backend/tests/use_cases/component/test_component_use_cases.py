@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -7,14 +7,19 @@ from core.domain.component_type import ComponentType
 from core.domain.healthcheck_config import HealthcheckConfig
 from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
 from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.rollup_resolution import RollupResolution
 from core.domain.status_type import StatusType
 from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from infra.adapter.memory_status_event_bus import InMemoryStatusEventBus
 from infra.web.routers.schemas.component import ComponentCreateDTO, ComponentUpdateDTO, MonitoringConfigCreateDTO
-from tests.support.fakes import FakeComponentRepository, FakeLogRepository
+from tests.support.fakes import FakeComponentRepository, FakeIncidentRepository, FakeLogRepository
 from use_cases.component.create_component_use_case import CreateComponentUseCase
 from use_cases.component.delete_component_use_case import DeleteComponentUseCase
 from use_cases.component.get_all_components_by_product_use_case import GetAllComponentsByProductUseCase
 from use_cases.component.get_all_components_unpaginated_use_case import GetAllComponentsUnpaginatedUseCase
+from use_cases.component.get_component_checks_use_case import GetComponentChecksUseCase
+from use_cases.component.get_component_history_use_case import GetComponentHistoryUseCase
 from use_cases.component.update_component_status_use_case import UpdateComponentStatusUseCase
 from use_cases.component.update_component_use_case import UpdateComponentUseCase
 
@@ -118,6 +123,18 @@ async def test_get_all_components_by_product_enriches_day_logs_and_normalizes_pa
     assert result.content[1].healthcheck_day_logs == []
 
 
+@pytest.mark.asyncio
+async def test_get_all_components_by_product_skips_summaries_for_zero_days() -> None:
+    repository = FakeComponentRepository(initial_components=[_component(10, 99, "api")])
+    log_repository = FakeLogRepository(precomputed_summary={})
+
+    use_case = GetAllComponentsByProductUseCase(repository, log_repository)
+    result = await use_case.execute(product_id=99, page=1, page_size=10, summary_days=0)
+
+    assert [component.name for component in result] == ["api"]
+    assert log_repository.bulk_calls == []
+
+
 @pytest.mark.asyncio
 async def test_update_component_raises_when_component_does_not_exist() -> None:
     repository = FakeComponentRepository()
@@ -147,7 +164,7 @@ async def test_update_component_updates_scalar_fields() -> None:
 async def test_update_component_status_updates_component_and_adds_log() -> None:
     component_repository = CountingComponentRepository(initial_components=[_component(42, 10, "payments")])
     log_repository = FakeLogRepository()
-    use_case = UpdateComponentStatusUseCase(component_repository, log_repository)
+    use_case = UpdateComponentStatusUseCase(component_repository, log_repository, FakeIncidentRepository())
 
     log = HealthcheckLog(
         component_id=42,
@@ -162,15 +179,95 @@ async def test_update_component_status_updates_component_and_adds_log() -> None:
 
     result = await use_case.execute(component_id=42, current_status=StatusType.DEGRADED, new_log=log)
 
-    assert component_repository.save_calls == 2
+    assert component_repository.save_calls == 1
     assert result.current_status is StatusType.DEGRADED
     assert len(log_repository.logs) == 1
     assert log_repository.logs[0].component_id == 42
 
 
+@pytest.mark.asyncio
+async def test_update_component_status_opens_escalates_and_closes_incidents() -> None:
+    incident_repository = FakeIncidentRepository()
+    use_case = UpdateComponentStatusUseCase(
+        FakeComponentRepository(initial_components=[_component(42, 10, "payments")]),
+        FakeLogRepository(),
+        incident_repository,
+    )
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    statuses = [
+        StatusType.OPERATIONAL,
+        StatusType.DEGRADED,
+        StatusType.OUTAGE,
+        StatusType.DEGRADED,
+        StatusType.OPERATIONAL,
+        StatusType.OPERATIONAL,
+    ]
+
+    for minute, status in enumerate(statuses):
+        await use_case.execute(
+            component_id=42,
+            current_status=status,
+            new_log=HealthcheckLog(
+                component_id=42,
+                checked_at=start + timedelta(minutes=minute),
+                is_successful=status is StatusType.OPERATIONAL,
+                status_code=200,
+                response_time_ms=10,
+                status_before=StatusType.OPERATIONAL,
+                status_after=status,
+                error_message=None,
+            ),
+        )
+
+    [incident] = incident_repository.incidents
+    assert incident.started_at == start + timedelta(minutes=1)
+    assert incident.ended_at == start + timedelta(minutes=4)
+    assert incident.status is StatusType.OUTAGE
+    assert incident.duration_seconds == 180
+    assert incident_repository.find_open_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_update_component_status_publishes_only_status_changes() -> None:
+    status_event_bus = InMemoryStatusEventBus(max_events=10)
+    cursor = status_event_bus.latest_event_id()
+    use_case = UpdateComponentStatusUseCase(
+        FakeComponentRepository(initial_components=[_component(42, 10, "payments")]),
+        FakeLogRepository(),
+        FakeIncidentRepository(),
+        status_event_bus,
+    )
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+    for minute, status in enumerate([StatusType.OPERATIONAL, StatusType.OUTAGE, StatusType.OUTAGE]):
+        await use_case.execute(
+            component_id=42,
+            current_status=status,
+            new_log=HealthcheckLog(
+                component_id=42,
+                checked_at=start + timedelta(minutes=minute),
+                is_successful=status is StatusType.OPERATIONAL,
+                status_code=200,
+                response_time_ms=10,
+                status_before=StatusType.OPERATIONAL,
+                status_after=status,
+                error_message=None,
+            ),
+        )
+
+    [event] = await status_event_bus.read_after(cursor, timeout_seconds=0.01)
+    assert (event.component_id, event.product_id) == (42, 10)
+    assert (event.previous_status, event.status) == (StatusType.OPERATIONAL, StatusType.OUTAGE)
+    assert event.changed_at == start + timedelta(minutes=1)
+
+
 @pytest.mark.asyncio
 async def test_update_component_status_raises_when_component_is_missing() -> None:
-    use_case = UpdateComponentStatusUseCase(FakeComponentRepository(), FakeLogRepository())
+    use_case = UpdateComponentStatusUseCase(
+        FakeComponentRepository(),
+        FakeLogRepository(),
+        FakeIncidentRepository(),
+    )
 
     with pytest.raises(ComponentNotFoundError):
         await use_case.execute(
@@ -195,3 +292,166 @@ async def test_delete_component_use_case_returns_repository_result() -> None:
     use_case = DeleteComponentUseCase(repository)
 
     assert await use_case.execute(1) is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("span", "expected_resolution"),
+    [
+        (timedelta(hours=6), RollupResolution.MINUTE),
+        (timedelta(days=14), RollupResolution.HOUR),
+        (timedelta(days=400), RollupResolution.DAY),
+    ],
+)
+async def test_get_component_history_selects_resolution_for_range(
+    span: timedelta,
+    expected_resolution: RollupResolution,
+) -> None:
+    until = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    use_case = GetComponentHistoryUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(),
+    )
+
+    history = await use_case.execute(component_id=1, since=until - span, until=until)
+
+    assert history.resolution is expected_resolution
+
+
+@pytest.mark.asyncio
+async def test_get_component_history_returns_buckets_from_rollups() -> None:
+    since = datetime(2026, 6, 1, 10, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=1,
+            checked_at=since + timedelta(minutes=minute),
+            is_successful=minute != 70,
+            status_code=200 if minute != 70 else 503,
+            response_time_ms=100,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL if minute != 70 else StatusType.OUTAGE,
+            error_message=None,
+        )
+        for minute in (5, 10, 70, 75)
+    ]
+    use_case = GetComponentHistoryUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(initial_logs=logs),
+    )
+
+    history = await use_case.execute(
+        component_id=1,
+        since=since,
+        until=since + timedelta(hours=3),
+        resolution=RollupResolution.HOUR,
+    )
+
+    assert [bucket.total_checks for bucket in history.buckets] == [2, 2]
+    assert history.buckets[1].uptime == 50.0
+    assert history.buckets[1].overall_status is StatusType.OUTAGE
+
+
+@pytest.mark.asyncio
+async def test_get_component_history_rejects_invalid_ranges() -> None:
+    until = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    use_case = GetComponentHistoryUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(),
+    )
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(component_id=1, since=until, until=until - timedelta(hours=1))
+
+    with pytest.raises(InvalidTimeRangeError, match="coarser resolution"):
+        await use_case.execute(
+            component_id=1,
+            since=until - timedelta(days=30),
+            until=until,
+            resolution=RollupResolution.MINUTE,
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_component_history_raises_when_component_is_missing() -> None:
+    until = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    use_case = GetComponentHistoryUseCase(FakeComponentRepository(), FakeLogRepository())
+
+    with pytest.raises(ComponentNotFoundError):
+        await use_case.execute(component_id=9, since=until - timedelta(hours=1), until=until)
+
+
+@pytest.mark.asyncio
+async def test_get_component_checks_pages_with_cursor_and_outcome_filter() -> None:
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=1,
+            checked_at=start + timedelta(minutes=minute),
+            is_successful=minute % 2 == 0,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for minute in range(5)
+    ]
+    use_case = GetComponentChecksUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(initial_logs=logs),
+    )
+
+    first_page = await use_case.execute(component_id=1, page_size=2)
+    second_page = await use_case.execute(component_id=1, page_size=2, cursor=first_page.next_cursor)
+    successes = await use_case.execute(component_id=1, page_size=10, is_successful=True)
+
+    assert [log.checked_at.minute for log in first_page] == [4, 3]
+    assert [log.checked_at.minute for log in second_page] == [2, 1]
+    assert [log.checked_at.minute for log in successes] == [4, 2, 0]
+    assert successes.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_component_checks_accepts_a_naive_and_an_aware_bound() -> None:
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    logs = [
+        HealthcheckLog(
+            component_id=1,
+            checked_at=start + timedelta(minutes=minute),
+            is_successful=True,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for minute in range(5)
+    ]
+    use_case = GetComponentChecksUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(initial_logs=logs),
+    )
+    naive_since = datetime(2026, 6, 1, 0, 2)
+    aware_until = datetime(2026, 5, 31, 21, 4, tzinfo=timezone(timedelta(hours=-3)))
+
+    page = await use_case.execute(component_id=1, page_size=10, since=naive_since, until=aware_until)
+
+    assert [log.checked_at.minute for log in page] == [3, 2]
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(component_id=1, page_size=10, since=datetime(2026, 6, 1, 0, 4), until=aware_until)
+
+
+@pytest.mark.asyncio
+async def test_get_component_checks_validates_component_and_range() -> None:
+    until = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    use_case = GetComponentChecksUseCase(
+        FakeComponentRepository(initial_components=[_component(1, 1, "api")]),
+        FakeLogRepository(),
+    )
+
+    with pytest.raises(ComponentNotFoundError):
+        await use_case.execute(component_id=2, page_size=10)
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(component_id=1, page_size=10, since=until, until=until)
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_day_summary import HealthcheckLogDaySummary
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from infra.adapter.memory_change_tracker import InMemoryChangeTracker
+from infra.adapter.memory_dashboard_cache import InMemoryDashboardCache
+from tests.support.fakes import FakeLogRepository, FakeProductRepository
+from use_cases.dashboard.get_dashboard_use_case import GetDashboardUseCase
+
+
+def _component(component_id: int, product_id: int) -> Component:
+    return Component(
+        id=component_id,
+        product_id=product_id,
+        name=f"component-{component_id}",
+        type=ComponentType.BACKEND,
+        monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+        current_status=StatusType.OPERATIONAL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dashboard_snapshot_is_reused_until_data_changes() -> None:
+    summary = HealthcheckLogDaySummary(
+        component_id=1,
+        date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        total_checks=2,
+        successful_checks=2,
+        uptime=100.0,
+        avg_response_time=10,
+        max_response_time=12,
+        overall_status=StatusType.OPERATIONAL,
+    )
+    product_repository = FakeProductRepository(
+        initial_products=[
+            Product(id=1, name="Visible", components=[_component(1, 1), _component(2, 1)]),
+            Product(id=2, name="Hidden", is_visible=False, components=[_component(3, 2)]),
+        ]
+    )
+    log_repository = FakeLogRepository(precomputed_summary={1: [summary]})
+    change_tracker = InMemoryChangeTracker()
+    use_case = GetDashboardUseCase(product_repository, log_repository, change_tracker, InMemoryDashboardCache())
+
+    first = await use_case.execute()
+    second = await use_case.execute()
+
+    assert second is first
+    assert first.version == 0
+    assert [product.name for product in first.products] == ["Visible"]
+    assert [len(component.healthcheck_day_logs) for component in first.products[0].components] == [1, 0]
+    assert log_repository.bulk_calls == [([1, 2], 100)]
+
+    await product_repository.save(Product(id=4, name="New"))
+    await change_tracker.record_change()
+    third = await use_case.execute()
+
+    assert third.version == 1
+    assert [product.name for product in third.products] == ["Visible", "New"]
+    assert len(log_repository.bulk_calls) == 2
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.incident import Incident
+from core.domain.status_type import StatusType
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from tests.support.fakes import FakeIncidentRepository, FakeLogRepository
+from use_cases.incident.backfill_incidents_use_case import BackfillIncidentsUseCase
+from use_cases.incident.get_incidents_use_case import GetIncidentsUseCase
+
+START = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _log(component_id: int, minute: int, status: StatusType) -> HealthcheckLog:
+    return HealthcheckLog(
+        component_id=component_id,
+        checked_at=START + timedelta(minutes=minute),
+        is_successful=status is StatusType.OPERATIONAL,
+        status_code=200,
+        response_time_ms=10,
+        status_before=StatusType.OPERATIONAL,
+        status_after=status,
+        error_message=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_incidents_replays_history_per_component() -> None:
+    logs = [
+        _log(1, 0, StatusType.OPERATIONAL),
+        _log(1, 1, StatusType.DEGRADED),
+        _log(1, 2, StatusType.OUTAGE),
+        _log(1, 3, StatusType.OPERATIONAL),
+        _log(1, 4, StatusType.DEGRADED),
+        _log(2, 0, StatusType.OUTAGE),
+        _log(2, 1, StatusType.OPERATIONAL),
+    ]
+    stale = Incident(id=None, component_id=1, started_at=START - timedelta(days=1), status=StatusType.OUTAGE)
+    incident_repository = FakeIncidentRepository(initial_incidents=[stale])
+
+    written = await BackfillIncidentsUseCase(FakeLogRepository(initial_logs=logs), incident_repository).execute()
+
+    assert written == 3
+    assert [
+        (incident.component_id, incident.started_at.minute, incident.status, incident.duration_seconds)
+        for incident in incident_repository.incidents
+    ] == [
+        (1, 1, StatusType.OUTAGE, 120),
+        (1, 4, StatusType.DEGRADED, None),
+        (2, 0, StatusType.OUTAGE, 60),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_incidents_filters_and_paginates() -> None:
+    incidents = [
+        Incident(
+            id=None,
+            component_id=component_id,
+            started_at=START + timedelta(hours=hour),
+            status=StatusType.OUTAGE if hour % 2 else StatusType.DEGRADED,
+            ended_at=START + timedelta(hours=hour, minutes=5) if hour < 4 else None,
+        )
+        for component_id in (1, 2)
+        for hour in range(5)
+    ]
+    use_case = GetIncidentsUseCase(FakeIncidentRepository(initial_incidents=incidents, component_products={1: 10}))
+
+    first_page = await use_case.execute(page=1, page_size=3, product_id=10)
+    open_incidents = await use_case.execute(page=1, page_size=10, is_open=True)
+    outages = await use_case.execute(page=0, page_size=0, component_id=2, status=StatusType.OUTAGE)
+
+    assert first_page.total_elements == 5
+    assert first_page.total_pages == 2
+    assert [incident.started_at.hour for incident in first_page] == [4, 3, 2]
+    assert len(open_incidents) == 2
+    assert [incident.started_at.hour for incident in outages] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_incidents_rejects_inverted_window() -> None:
+    use_case = GetIncidentsUseCase(FakeIncidentRepository())
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(page=1, page_size=10, since=START, until=START)
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(page=1, page_size=10, since=START.replace(tzinfo=None), until=START)
@@ -0,0 +1,229 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from core.domain.component import Component
+from core.domain.component_type import ComponentType
+from core.domain.healthcheck_config import HealthcheckConfig
+from core.domain.healthcheck_log import HealthcheckLog
+from core.domain.product import Product
+from core.domain.status_type import StatusType
+from core.exceptions.component_not_found_error import ComponentNotFoundError
+from core.exceptions.invalid_time_range_error import InvalidTimeRangeError
+from core.exceptions.product_not_found_error import ProductNotFoundError
+from infra.adapter.segment_log_archive import SegmentLogArchive
+from tests.support.fakes import FakeComponentRepository, FakeLogRepository, FakeProductRepository
+from use_cases.log.archive_logs_use_case import ArchiveLogsUseCase
+from use_cases.log.export_logs_use_case import ExportLogsUseCase
+from use_cases.log.get_sla_report_use_case import GetSlaReportUseCase
+from use_cases.log.import_logs_use_case import ImportLogsUseCase
+
+NOW = datetime(2026, 3, 10, 15, 30, tzinfo=timezone.utc)
+
+
+def _log(component_id: int, checked_at: datetime) -> HealthcheckLog:
+    return HealthcheckLog(
+        component_id=component_id,
+        checked_at=checked_at,
+        is_successful=True,
+        status_code=200,
+        response_time_ms=80,
+        status_before=StatusType.OPERATIONAL,
+        status_after=StatusType.OPERATIONAL,
+        error_message=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_archive_logs_moves_rows_older_than_retention_by_day(tmp_path: Path) -> None:
+    repository = FakeLogRepository(
+        initial_logs=[
+            _log(1, NOW - timedelta(days=12)),
+            _log(1, NOW - timedelta(days=11, hours=2)),
+            _log(1, NOW - timedelta(days=1)),
+            _log(2, NOW - timedelta(days=15)),
+        ]
+    )
+    archive = SegmentLogArchive(tmp_path)
+
+    archived_rows = await ArchiveLogsUseCase(repository, archive).execute(retention_days=7, now=NOW)
+
+    assert archived_rows == 3
+    assert [log.checked_at for log in repository.logs] == [NOW - timedelta(days=1)]
+    assert len(await archive.read_logs(1)) == 2
+    assert len(await archive.read_logs(2)) == 1
+    assert len(list((tmp_path / "1").glob("*.seg"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_archive_logs_does_not_duplicate_already_archived_days(tmp_path: Path) -> None:
+    old_log = _log(1, NOW - timedelta(days=10))
+    archive = SegmentLogArchive(tmp_path)
+    await archive.write_segment(1, [old_log])
+
+    repository = FakeLogRepository(initial_logs=[old_log])
+
+    archived_rows = await ArchiveLogsUseCase(repository, archive).execute(retention_days=7, now=NOW)
+
+    assert archived_rows == 0
+    assert repository.logs == []
+    assert len(await archive.read_logs(1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_logs_keeps_late_rows_on_an_already_archived_day(tmp_path: Path) -> None:
+    archived_log = _log(1, NOW - timedelta(days=10, hours=3))
+    late_log = replace(_log(1, NOW - timedelta(days=10, hours=2)), response_time_ms=999)
+    archive = SegmentLogArchive(tmp_path)
+    await archive.write_segment(1, [_log(1, NOW - timedelta(days=10, hours=1)), archived_log])
+
+    repository = FakeLogRepository(initial_logs=[archived_log, late_log])
+
+    archived_rows = await ArchiveLogsUseCase(repository, archive).execute(retention_days=7, now=NOW)
+
+    assert archived_rows == 1
+    assert repository.logs == []
+    assert sorted(log.response_time_ms for log in await archive.read_logs(1)) == [80, 80, 999]
+    assert [log.response_time_ms for log in await archive.read_latest_logs(1, limit=2)] == [80, 999]
+
+
+def _export_use_case() -> ExportLogsUseCase:
+    components = [
+        Component(
+            id=component_id,
+            product_id=product_id,
+            name=f"component-{component_id}",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+        )
+        for component_id, product_id in [(1, 10), (2, 10), (3, 20)]
+    ]
+    logs = [_log(component_id, NOW - timedelta(hours=hours)) for component_id in (1, 2, 3) for hours in (1, 30)]
+
+    return ExportLogsUseCase(
+        FakeProductRepository(initial_products=[Product(id=10, name="API"), Product(id=20, name="Web")]),
+        FakeComponentRepository(initial_components=components),
+        FakeLogRepository(initial_logs=logs),
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_logs_filters_by_component_product_and_time() -> None:
+    use_case = _export_use_case()
+
+    by_product = [log async for log in await use_case.execute(product_id=10)]
+    by_component = [log async for log in await use_case.execute(component_id=3, since=NOW - timedelta(days=1))]
+    everything = [log async for log in await use_case.execute()]
+
+    assert {log.component_id for log in by_product} == {1, 2}
+    assert len(by_product) == 4
+    assert [(log.component_id, log.checked_at) for log in by_component] == [(3, NOW - timedelta(hours=1))]
+    assert len(everything) == 6
+
+
+@pytest.mark.asyncio
+async def test_export_logs_validates_filters() -> None:
+    use_case = _export_use_case()
+
+    with pytest.raises(ProductNotFoundError):
+        await use_case.execute(product_id=99)
+
+    with pytest.raises(ComponentNotFoundError):
+        await use_case.execute(component_id=3, product_id=10)
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(since=NOW, until=NOW)
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(since=NOW.replace(tzinfo=None), until=NOW)
+
+    naive_since = (NOW - timedelta(days=1)).replace(tzinfo=None)
+    mixed = [log async for log in await use_case.execute(since=naive_since, until=NOW)]
+
+    assert len(mixed) == 3
+
+
+@pytest.mark.asyncio
+async def test_sla_report_aggregates_components_and_products_over_minute_window() -> None:
+    components = [
+        Component(
+            id=component_id,
+            product_id=10,
+            name=f"component-{component_id}",
+            type=ComponentType.BACKEND,
+            monitoring_config=HealthcheckConfig(health_url=f"https://{component_id}.example.com/health"),
+        )
+        for component_id in (1, 2, 3)
+    ]
+    logs = [_log(1, NOW + timedelta(minutes=minute)) for minute in range(10)]
+    logs += [replace(_log(2, NOW + timedelta(minutes=minute)), is_successful=minute != 0) for minute in range(4)]
+    use_case = GetSlaReportUseCase(
+        FakeProductRepository(initial_products=[Product(id=10, name="API", components=components[1:])]),
+        FakeComponentRepository(initial_components=components),
+        FakeLogRepository(initial_logs=logs),
+    )
+
+    report = await use_case.execute(
+        since=NOW + timedelta(seconds=20),
+        until=NOW + timedelta(minutes=4, seconds=59),
+        component_ids=[1],
+        product_ids=[10],
+    )
+
+    assert report.since == NOW
+    assert report.until == NOW + timedelta(minutes=4)
+    assert [(item.component_id, item.total_checks, item.uptime) for item in report.components] == [
+        (1, 4, 100.0),
+        (2, 4, 75.0),
+        (3, 0, None),
+    ]
+    assert report.total_checks == 8
+    assert report.uptime == 87.5
+
+
+@pytest.mark.asyncio
+async def test_sla_report_validates_window_and_targets() -> None:
+    use_case = GetSlaReportUseCase(FakeProductRepository(), FakeComponentRepository(), FakeLogRepository())
+
+    with pytest.raises(InvalidTimeRangeError):
+        await use_case.execute(since=NOW, until=NOW + timedelta(seconds=30), component_ids=[1])
+
+    with pytest.raises(ComponentNotFoundError):
+        await use_case.execute(since=NOW, until=NOW + timedelta(days=1), component_ids=[1])
+
+    with pytest.raises(ProductNotFoundError):
+        await use_case.execute(since=NOW, until=NOW + timedelta(days=1), product_ids=[1])
+
+
+@pytest.mark.asyncio
+async def test_import_logs_writes_fixed_size_batches() -> None:
+    log_repository = FakeLogRepository()
+    batch_sizes: list[int] = []
+    add_logs = log_repository.add_logs
+
+    async def _add_logs(logs: list[HealthcheckLog]) -> int:
+        batch_sizes.append(len(logs))
+        return await add_logs(logs)
+
+    log_repository.add_logs = _add_logs  # type: ignore[method-assign]
+    logs = [
+        HealthcheckLog(
+            component_id=1,
+            checked_at=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index),
+            is_successful=True,
+            status_code=200,
+            response_time_ms=10,
+            status_before=StatusType.OPERATIONAL,
+            status_after=StatusType.OPERATIONAL,
+            error_message=None,
+        )
+        for index in range(7)
+    ]
+
+    imported = await ImportLogsUseCase(log_repository).execute(iter(logs), batch_size=3)
+
+    assert imported == 7
+    assert batch_sizes == [3, 3, 1]
+    assert len(log_repository.logs) == 7
@@ -149,3 +149,49 @@ async def test_get_all_products_skips_summary_query_when_there_are_no_components
 
     assert result.page_count == 1
     assert log_repository.bulk_calls == []
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_search_keeps_only_matching_components() -> None:
+    product_repository = FakeProductRepository(
+        initial_products=[
+            Product(id=1, name="Payments", components=[_component(100, "ledger"), _component(101, "cards")]),
+            Product(id=2, name="Billing", components=[_component(200, "payment-worker"), _component(201, "pdf")]),
+            Product(id=3, name="Search", components=[_component(300, "indexer")]),
+        ]
+    )
+    log_repository = FakeLogRepository(precomputed_summary={})
+
+    use_case = GetAllProductsUseCase(product_repository=product_repository, log_repository=log_repository)
+
+    result = await use_case.execute(is_visible=True, page=1, page_size=10, summary_days=7, search="  PAYMENT ")
+
+    assert [(product.name, [component.id for component in product.components]) for product in result] == [
+        ("Payments", [100, 101]),
+        ("Billing", [200]),
+    ]
+    assert log_repository.bulk_calls == [([100, 101, 200], 7)]
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_lean_variants_skip_components_and_summaries() -> None:
+    product_repository = FakeProductRepository(
+        initial_products=[Product(id=1, name="Payments", components=[_component(100, "ledger")], is_visible=True)]
+    )
+    log_repository = FakeLogRepository(precomputed_summary={})
+
+    use_case = GetAllProductsUseCase(product_repository=product_repository, log_repository=log_repository)
+
+    without_summaries = await use_case.execute(is_visible=True, page=1, page_size=10, summary_days=0)
+    names_only = await use_case.execute(
+        is_visible=True,
+        page=1,
+        page_size=10,
+        summary_days=0,
+        include_components=False,
+    )
+
+    assert [component.name for component in without_summaries.content[0].components] == ["ledger"]
+    assert without_summaries.content[0].components[0].healthcheck_day_logs == []
+    assert names_only.content[0].components == []
+    assert log_repository.bulk_calls == []
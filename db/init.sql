@@ -22,8 +22,8 @@ CREATE TABLE products (
   "name" varchar(100) UNIQUE NOT NULL,
   "description" text,
   "is_visible" boolean DEFAULT true,
-  "created_at" timestamp DEFAULT (now()),
-  "updated_at" timestamp DEFAULT (now())
+  "created_at" timestamptz DEFAULT (now()),
+  "updated_at" timestamptz DEFAULT (now())
 );
 
 CREATE TABLE components (
@@ -34,7 +34,7 @@ CREATE TABLE components (
   "description" text,
   "type" component_type NOT NULL,
   "current_status" status_type,
-  "status_changed_at" timestamp DEFAULT (now()),
+  "status_changed_at" timestamptz DEFAULT (now()),
 
   "health_url" varchar(500),
   "check_interval_seconds" integer DEFAULT 60,
@@ -44,12 +44,12 @@ CREATE TABLE components (
   "failures_before_outage" integer DEFAULT 3,
 
   "is_active" boolean DEFAULT true,
-  "last_checked_at" timestamp,
+  "last_checked_at" timestamptz,
   "consecutive_failures" integer DEFAULT 0,
   "display_order" integer DEFAULT 0,
 
-  "created_at" timestamp DEFAULT (now()),
-  "updated_at" timestamp DEFAULT (now()),
+  "created_at" timestamptz DEFAULT (now()),
+  "updated_at" timestamptz DEFAULT (now()),
 
   constraint fk_components_products
   foreign key (product_id)
@@ -60,7 +60,7 @@ CREATE TABLE health_checks (
   "id" BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
   "component_id" bigint NOT NULL,
 
-  "checked_at" timestamp NOT NULL DEFAULT (now()),
+  "checked_at" timestamptz NOT NULL DEFAULT (now()),
   "is_successful" boolean NOT NULL,
   "status_code" integer,
   "response_time_ms" integer,
@@ -73,11 +73,59 @@ CREATE TABLE health_checks (
   references components(id)
 );
 
+CREATE TABLE health_check_rollups (
+  "component_id" bigint NOT NULL,
+  "resolution" varchar(6) NOT NULL,
+  "bucket_start" timestamptz NOT NULL,
+
+  "total_checks" integer NOT NULL DEFAULT 0,
+  "successful_checks" integer NOT NULL DEFAULT 0,
+  "total_response_time_ms" bigint NOT NULL DEFAULT 0,
+  "max_response_time_ms" integer NOT NULL DEFAULT 0,
+  "max_status_severity" integer NOT NULL DEFAULT 0,
+
+  PRIMARY KEY ("component_id", "resolution", "bucket_start"),
+
+  constraint fk_health_check_rollup_component
+  foreign key (component_id)
+  references components(id)
+  on delete cascade
+);
+
+CREATE TABLE health_check_counters (
+  "component_id" bigint NOT NULL,
+  "bucket_start" timestamptz NOT NULL,
+
+  "cumulative_checks" bigint NOT NULL DEFAULT 0,
+  "cumulative_successful_checks" bigint NOT NULL DEFAULT 0,
+
+  PRIMARY KEY ("component_id", "bucket_start"),
+
+  constraint fk_health_check_counter_component
+  foreign key (component_id)
+  references components(id)
+  on delete cascade
+);
+
+CREATE TABLE incidents (
+  "id" BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+  "component_id" bigint NOT NULL,
+
+  "started_at" timestamptz NOT NULL,
+  "status" status_type NOT NULL,
+  "ended_at" timestamptz,
+
+  constraint fk_incident_component
+  foreign key (component_id)
+  references components(id)
+  on delete cascade
+);
+
 CREATE INDEX ON products ("name");
 CREATE INDEX ON components ("product_id");
 CREATE INDEX ON components ("type");
 CREATE INDEX ON components ("current_status");
 CREATE INDEX ON components ("is_active", "last_checked_at");
-CREATE INDEX ON health_checks ("component_id");
-CREATE INDEX ON health_checks ("checked_at");
-CREATE INDEX ON health_checks ("component_id", "checked_at");
+-- health_checks indexes are owned by the backend migrations (`python src/cli.py migrate`, run by entrypoint.sh).
+CREATE INDEX ON incidents ("component_id", "ended_at");
+CREATE INDEX ON incidents ("started_at");